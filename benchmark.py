@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput benchmark for the apply pipeline.
+
+Starts the offline replay server, points an EasyApplyBot at it and runs the
+real start_apply -> applications_loop -> apply_loop -> apply_to_job ->
+send_resume path against the fixture pages. Reports jobs/minute and the
+p50/p95 latency of a single apply_to_job call so releases can be compared
+on one reproducible number.
+
+With --command-budget N every WebDriver command is audited and the run fails
+if any single application took more than N commands. --startup measures
+cold start instead: the import time of easyapplybot in fresh interpreters,
+the constructor's work before Chrome launches, and the time to the first
+search page.
+
+Usage: python3 benchmark.py [--jobs 20] [--latency-ms 150] [--headless] [--command-budget 60] [--startup]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from metrics import summarize
+from replay_server import ReplayFixtures, ReplayServer
+
+
+class BenchmarkComplete(BaseException):
+    """Raised once the job budget is spent; BaseException so applications_loop does not swallow it"""
+
+
+def measure_import(module="easyapplybot", runs=5) -> list:
+    """Seconds to import module in each of runs fresh interpreters"""
+    code = f"import time; started = time.perf_counter(); import {module}; print(time.perf_counter() - started)"
+    here = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], cwd=here, capture_output=True, text=True, check=True)
+        times.append(float(output.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def make_bot_class(base_url, max_jobs, first_page_only=False):
+    # Imported here so `--help` works without selenium installed
+    from easyapplybot import EasyApplyBot
+
+    class BenchmarkBot(EasyApplyBot):
+        BASE_URL = base_url
+
+        def __init__(self, *args, **kwargs) -> None:
+            self.job_latencies = []
+            self.constructed_at = time.perf_counter()
+            self.browser_requested_at = None
+            self.first_page_at = None
+            super().__init__(*args, **kwargs)
+
+        def launch_browser(self, options):
+            if self.browser_requested_at is None:
+                self.browser_requested_at = time.perf_counter()
+            return super().launch_browser(options)
+
+        def next_jobs_page(self, *args, **kwargs):
+            result = super().next_jobs_page(*args, **kwargs)
+            if self.first_page_at is None:
+                self.first_page_at = time.perf_counter()
+                if first_page_only:
+                    raise BenchmarkComplete()
+            return result
+
+        def apply_to_job(self, jobID, job_card=None, job=None):
+            started = time.perf_counter()
+            try:
+                return super().apply_to_job(jobID, job_card, job)
+            finally:
+                self.job_latencies.append(time.perf_counter() - started)
+                if len(self.job_latencies) >= max_jobs:
+                    raise BenchmarkComplete()
+
+    return BenchmarkBot
+
+
+def run_benchmark(args, fixtures=None) -> dict:
+    """Run the bot against the replay server; fixtures default to the ones described by args"""
+    if fixtures is None:
+        fixtures = ReplayFixtures(positions=tuple(args.positions), pages=args.pages,
+                                  jobs_per_page=args.jobs_per_page, latency_ms=args.latency_ms, seed=args.seed)
+    max_jobs = min(args.jobs, fixtures.easy_apply_count) or 1
+    workdir = tempfile.mkdtemp(prefix="easyapply-bench-")
+    # Before anything imports easyapplybot in this process
+    import_times = measure_import(runs=args.import_runs) if args.startup else []
+
+    with ReplayServer(fixtures) as server:
+        BotClass = make_bot_class(server.url, max_jobs, first_page_only=args.startup)
+        BotClass.MAX_SEARCH_TIME = args.max_seconds
+        cwd = os.getcwd()
+        bot = None
+        # Output CSV, qa.csv and unanswered questions land in a scratch dir, not the user's files
+        os.chdir(workdir)
+        try:
+            bot = BotClass("bench@example.com", "password", "5555555555", "100000", "50",
+                           filename=os.path.join(workdir, "output.csv"),
+                           discovery_worker=args.discovery and not args.startup,
+                           audit_commands=args.audit or bool(args.command_budget),
+                           headless=args.headless, block_resources=args.block, network_stats=args.network_stats)
+            if bot.audit is not None:
+                bot.audit.budget = args.command_budget
+            if bot.network is not None and args.network_baseline:
+                with open(args.network_baseline, encoding='utf-8') as f:
+                    bot.network.baseline = json.load(f).get("network", {})
+            started = time.perf_counter()
+            try:
+                bot.start_apply(args.positions, args.locations)
+            except BenchmarkComplete:
+                pass
+            elapsed = time.perf_counter() - started
+        finally:
+            os.chdir(cwd)
+            if bot is not None:
+                bot.close()
+
+    latencies = bot.job_latencies
+    phases = bot.phases.durations
+    startup = {
+        "import_seconds": {k: round(v, 3) for k, v in summarize(import_times).items()},
+        "before_browser_seconds": round(bot.browser_requested_at - bot.constructed_at, 3),
+        "resolve_driver_seconds": round(phases["resolve_driver"][0], 3),
+        "launch_browser_seconds": round(phases["launch_browser"][0], 3),
+        "session_check_seconds": round(phases["session_check"][0], 3),
+        "login_seconds": round(phases["login"][0], 3) if phases.get("login") else 0.0,
+        "first_search_page_seconds": round(bot.first_page_at - bot.constructed_at, 3) if bot.first_page_at else None,
+    }
+    return {
+        "startup": startup,
+        "jobs": len(latencies),
+        "elapsed_seconds": round(elapsed, 3),
+        "jobs_per_minute": round(len(latencies) / elapsed * 60, 2) if elapsed else 0.0,
+        "job_latency": {k: round(v, 3) for k, v in summarize(latencies).items()},
+        "page_loads": {k: round(v, 3) for k, v in summarize(bot.page_loads).items()},
+        "cards_per_page": list(bot.cards_per_page),
+        "pipeline": dict(bot.pipeline_metrics),
+        "waits": {name: {k: round(v, 3) for k, v in stats.items()} for name, stats in bot.waiter.summary().items()},
+        "answer_strategies": dict(bot.answer_matcher.stats),
+        "selectors": bot.selectors.report(),
+        "commands": bot.audit.report() if bot.audit is not None else {},
+        "network": bot.network.report() if bot.network is not None else {},
+        "server_requests": dict(server.requests),
+        "workdir": workdir,
+    }
+
+
+def print_report(result) -> None:
+    latency = result["job_latency"]
+    print("=" * 60)
+    print("Easy Apply pipeline benchmark")
+    print("=" * 60)
+    startup = result["startup"]
+    if startup["import_seconds"]["count"]:
+        cold = startup["import_seconds"]["p50"] + startup["before_browser_seconds"] + startup["resolve_driver_seconds"]
+        print(f"Import           : p50 {startup['import_seconds']['p50']:.3f}s  max {startup['import_seconds']['max']:.3f}s")
+        print(f"Cold start       : {cold:.3f}s before Chrome launches")
+    print(f"Startup          : constructor {startup['before_browser_seconds']:.3f}s, driver {startup['resolve_driver_seconds']:.3f}s, "
+          f"Chrome {startup['launch_browser_seconds']:.2f}s, session check {startup['session_check_seconds']:.2f}s, "
+          f"login {startup['login_seconds']:.2f}s")
+    if startup["first_search_page_seconds"] is not None:
+        print(f"First search page: {startup['first_search_page_seconds']:.2f}s after the constructor started")
+    print(f"Jobs processed   : {result['jobs']}")
+    print(f"Elapsed          : {result['elapsed_seconds']:.1f}s")
+    print(f"Throughput       : {result['jobs_per_minute']:.2f} jobs/minute")
+    print(f"Per-job latency  : p50 {latency['p50']:.2f}s  p95 {latency['p95']:.2f}s  max {latency['max']:.2f}s")
+    if result.get("page_loads", {}).get("count"):
+        pages = result["page_loads"]
+        print(f"Search page load : {pages['count']} pages  p50 {pages['p50']:.2f}s  p95 {pages['p95']:.2f}s")
+    if result.get("cards_per_page"):
+        print(f"Cards per page   : {result['cards_per_page']}")
+    if result.get("pipeline"):
+        pipeline = result["pipeline"]
+        print(f"Discovery        : {pipeline['queued']} jobs queued from {pipeline['pages']} pages, "
+              f"queue depth mean {pipeline['queue_depth_mean']} max {pipeline['queue_depth_max']}")
+        print(f"Utilization      : discovery {pipeline['discovery_utilization']:.0%}  apply {pipeline['apply_utilization']:.0%}")
+    if result.get("waits"):
+        print("Waits (count, p50, p95):")
+        for name, stats in sorted(result["waits"].items()):
+            print(f"  {name:<16} {stats['count']:>5}  {stats['p50']:.3f}s  {stats['p95']:.3f}s")
+    if result.get("selectors"):
+        print("Selectors (attempts, hit rate, mean):")
+        for target, selectors in sorted(result["selectors"].items()):
+            for label, stats in selectors.items():
+                print(f"  {target:<18} {stats['attempts']:>5}  {stats['hit_rate']:>5.0%}  {stats['mean_ms']:>6.1f}ms  {label}")
+    if result.get("network"):
+        network = result["network"]
+        print(f"Network          : {network['bytes_per_page'] / 1024:.0f} KiB/page, {network['requests']} requests, "
+              f"{network['blocked']} blocked {network['blocked_by_type']}")
+        if network["blocked"]:
+            print(f"  blocking saved : ~{network['saved_bytes_per_page'] / 1024:.0f} KiB/page "
+                  f"(~{network['saved_bytes'] / 1024:.0f} KiB in all, estimated)")
+    if result.get("commands"):
+        commands = result["commands"]
+        per_job = commands["per_job"]
+        print(f"WebDriver commands: {commands['commands']} in {commands['command_seconds']:.1f}s, "
+              f"page source {commands['page_source_bytes'] / 1024:.0f} KiB")
+        print(f"  per job        : p50 {per_job['p50']:.0f}  p95 {per_job['p95']:.0f}  max {per_job['max']:.0f}")
+        for site in commands["slowest_sites"]:
+            print(f"  {site['site']:<32} {site['count']:>5}  {site['seconds']:>7.2f}s  max {site['max']:.3f}s")
+        for jobID, count in commands["over_budget"]:
+            print(f"  over budget    : job {jobID} took {count} commands")
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the Easy Apply pipeline against offline fixtures")
+    parser.add_argument("--jobs", type=int, default=20, help="stop after this many apply_to_job calls")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--jobs-per-page", type=int, default=25)
+    parser.add_argument("--latency-ms", type=int, default=0, help="simulated delay for every page transition")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--positions", nargs="+", default=["Data", "Analytics"])
+    parser.add_argument("--locations", nargs="+", default=["Remote"])
+    parser.add_argument("--max-seconds", type=int, default=600, help="upper bound on each search combo")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--discovery", action="store_true", help="search in a second browser while applying")
+    parser.add_argument("--audit", action="store_true", help="count and time every WebDriver command")
+    parser.add_argument("--command-budget", type=int, default=0,
+                        help="fail if any application takes more than this many WebDriver commands (implies --audit)")
+    parser.add_argument("--block", nargs="*", default=[], metavar="TYPE",
+                        help="resource types to block: images, media, fonts, analytics")
+    parser.add_argument("--network-stats", action="store_true",
+                        help="report bytes transferred and requests blocked per search page")
+    parser.add_argument("--network-baseline", metavar="JSON",
+                        help="--json output of an unblocked --network-stats run, to price the blocked requests")
+    parser.add_argument("--startup", action="store_true",
+                        help="measure cold start and stop at the first search page instead of applying")
+    parser.add_argument("--import-runs", type=int, default=5, help="fresh interpreters to time the import in (--startup)")
+    parser.add_argument("--json", dest="json_path", help="also write the result as JSON to this file")
+    return parser
+
+
+def main() -> int:
+    args = make_parser().parse_args()
+
+    result = run_benchmark(args)
+    print_report(result)
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    if result["commands"] and result["commands"]["over_budget"]:
+        return 1
+    if args.startup:
+        return 0 if result["startup"]["first_search_page_seconds"] is not None else 1
+    return 0 if result["jobs"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Memory watchdog for the bot's browser.
+
+Chrome grows over a long run, since the same tab pages through search after
+search. BrowserWatchdog samples the RSS and CPU of Chrome, chromedriver and
+the Python process after every job and says when the browser should be
+recycled: when Chrome and chromedriver together cross memory_limit_mb, or
+every recycle_jobs jobs. Sampling needs psutil; without it only the job
+count limit applies.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+try:
+    import psutil
+except ImportError:  # optional, only needed for memory and CPU samples
+    psutil = None
+
+MB = 1024 * 1024
+
+
+class BrowserWatchdog:
+    """
+    Per-job resource samples of a WebDriver browser and its recycle decision.
+
+    sample(browser) returns {chrome_mb, driver_mb, python_mb, chrome_cpu,
+    python_cpu, processes, jobs}; CPU is the percentage since the previous
+    sample. recycle_reason(sample) is None or why the browser should be
+    replaced; call recycled() once it was.
+    """
+
+    def __init__(self, memory_limit_mb=None, recycle_jobs=0) -> None:
+        self.memory_limit_mb = memory_limit_mb
+        self.recycle_jobs = recycle_jobs
+        self.jobs = 0  # since the last recycle
+        self.recycles = 0
+        self._processes = {}  # pid -> psutil.Process, kept so cpu_percent() measures since the last sample
+        if psutil is None and memory_limit_mb:
+            log.info("psutil is not installed, the browser memory limit is disabled (pip install psutil)")
+
+    def _process(self, pid):
+        process = self._processes.get(pid)
+        if process is None:
+            process = self._processes[pid] = psutil.Process(pid)
+            process.cpu_percent(None)
+        return process
+
+    def sample(self, browser) -> dict:
+        self.jobs += 1
+        sample = {"jobs": self.jobs}
+        if psutil is None:
+            return sample
+        try:
+            driver = self._process(browser.service.process.pid)
+            chrome = driver.children(recursive=True)
+            chrome_rss = chrome_cpu = 0.0
+            alive = {driver.pid}
+            for child in chrome:
+                try:
+                    process = self._process(child.pid)
+                    chrome_rss += process.memory_info().rss
+                    chrome_cpu += process.cpu_percent(None)
+                    alive.add(child.pid)
+                except psutil.Error:
+                    continue
+            python = self._process(os.getpid())
+            alive.add(python.pid)
+            # Forget renderers that have exited
+            self._processes = {pid: process for pid, process in self._processes.items() if pid in alive}
+            sample.update(
+                chrome_mb=round(chrome_rss / MB, 1),
+                driver_mb=round(driver.memory_info().rss / MB, 1),
+                python_mb=round(python.memory_info().rss / MB, 1),
+                chrome_cpu=round(chrome_cpu, 1),
+                python_cpu=round(python.cpu_percent(None), 1),
+                processes=len(chrome),
+            )
+        except Exception as e:
+            log.debug(f"Could not sample browser resources: {e}")
+        return sample
+
+    def recycle_reason(self, sample):
+        browser_mb = sample.get("chrome_mb", 0.0) + sample.get("driver_mb", 0.0)
+        if self.memory_limit_mb and browser_mb > self.memory_limit_mb:
+            return f"browser uses {browser_mb:.0f} MB, over the {self.memory_limit_mb} MB limit"
+        if self.recycle_jobs and self.jobs >= self.recycle_jobs:
+            return f"{self.jobs} jobs since the last recycle"
+        return None
+
+    def recycled(self) -> None:
+        self.jobs = 0
+        self.recycles += 1
+        self._processes = {}
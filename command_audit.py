@@ -0,0 +1,124 @@
+"""
+WebDriver round-trip auditor.
+
+Wraps a driver's command executor so every remote command (findElements,
+getElementText, executeScript, getPageSource, ...) is counted and timed,
+tagged with the bot method that issued it and the job being applied to.
+Opt-in: the wrapper costs a stack walk per command, which is nothing next
+to the round trip but still not worth paying on every run.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+from metrics import summarize
+
+log = logging.getLogger(__name__)
+
+# Frames in these files are where the bot issues commands; the first one found is the call site
+BOT_FILES = ("easyapplybot.py",)
+# Frames in these files are never a call site
+_SKIP_PATHS = ("selenium" + os.sep, __file__)
+
+
+class CommandAuditor:
+    """
+    Counts and times every command sent through the browsers attached to it.
+
+    context() returns the fields of whatever the calling thread is doing; its
+    "job_id" decides which job a command is charged to (PhaseRecorder.context
+    fits). finish_job(jobID) closes a job's tally and returns it. Jobs that
+    took more than budget commands (0 = no budget) are kept in over_budget.
+    """
+
+    def __init__(self, context=None, budget=0) -> None:
+        self.context = context or dict
+        self.budget = budget
+        self.lock = threading.Lock()
+        self.commands = Counter()  # command name -> count
+        self.seconds = defaultdict(float)  # command name -> seconds
+        self.sites = defaultdict(lambda: [0, 0.0, 0.0])  # call site -> [count, seconds, slowest]
+        self.page_source_bytes = 0
+        self.open_jobs = defaultdict(lambda: {"commands": 0, "command_seconds": 0.0, "page_source_bytes": 0})
+        self.job_commands = {}  # job ID -> commands, for every finished job
+        self.over_budget = []  # (job ID, commands)
+
+    def attach(self, browser):
+        """Route browser's commands through the auditor; returns browser"""
+        executor = browser.command_executor
+        execute = executor.execute
+
+        def audited(command, params):
+            started = time.perf_counter()
+            response = execute(command, params)
+            self.record(command, time.perf_counter() - started, response)
+            return response
+
+        executor.execute = audited
+        return browser
+
+    def call_site(self) -> str:
+        """function:line of the innermost bot frame on the calling stack"""
+        frame = sys._getframe(2)
+        fallback = None
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if os.path.basename(filename) in BOT_FILES:
+                return f"{frame.f_code.co_name}:{frame.f_lineno}"
+            if fallback is None and not any(part in filename for part in _SKIP_PATHS):
+                fallback = f"{os.path.basename(filename)}:{frame.f_code.co_name}:{frame.f_lineno}"
+            frame = frame.f_back
+        return fallback or "unknown"
+
+    def record(self, command, seconds, response=None) -> None:
+        site = self.call_site()
+        job_id = self.context().get("job_id")
+        source_bytes = 0
+        if command == "getPageSource" and isinstance(response, dict) and isinstance(response.get("value"), str):
+            source_bytes = len(response["value"].encode("utf-8"))
+        with self.lock:
+            self.commands[command] += 1
+            self.seconds[command] += seconds
+            stats = self.sites[site]
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+            self.page_source_bytes += source_bytes
+            if job_id is not None:
+                job = self.open_jobs[job_id]
+                job["commands"] += 1
+                job["command_seconds"] += seconds
+                job["page_source_bytes"] += source_bytes
+
+    def finish_job(self, jobID) -> dict:
+        """Tally of jobID's commands (commands, command_seconds, page_source_bytes)"""
+        with self.lock:
+            job = self.open_jobs.pop(jobID, None) or {"commands": 0, "command_seconds": 0.0, "page_source_bytes": 0}
+            self.job_commands[jobID] = job["commands"]
+        job["command_seconds"] = round(job["command_seconds"], 4)
+        if self.budget and job["commands"] > self.budget:
+            log.warning(f"Job {jobID} took {job['commands']} WebDriver commands, over the budget of {self.budget}")
+            self.over_budget.append((jobID, job["commands"]))
+        return job
+
+    def report(self, top=10) -> dict:
+        """Totals per command, commands per job and the slowest call sites by total time"""
+        with self.lock:
+            sites = sorted(self.sites.items(), key=lambda item: item[1][1], reverse=True)[:top]
+            return {
+                "commands": sum(self.commands.values()),
+                "command_seconds": round(sum(self.seconds.values()), 3),
+                "page_source_bytes": self.page_source_bytes,
+                "per_command": {name: {"count": count, "seconds": round(self.seconds[name], 3)}
+                                for name, count in self.commands.most_common()},
+                "per_job": {k: round(v, 1) for k, v in summarize(list(self.job_commands.values())).items()},
+                "over_budget": list(self.over_budget),
+                "slowest_sites": [{"site": site, "count": count, "seconds": round(seconds, 3),
+                                   "max": round(slowest, 3)} for site, (count, seconds, slowest) in sites],
+            }
@@ -0,0 +1,168 @@
+"""
+Search discovery running ahead of the apply stage.
+
+DiscoveryWorker walks the search result pages of every position/location
+combo the scheduler hands out, for the time it allots each one, in its own
+browser and pushes the jobs worth applying to into a bounded queue. The apply stage consumes that queue in the main browser, so
+search page loads overlap with Easy Apply modal work instead of alternating
+with it. When the queue is full the worker waits, so it never runs more than
+queue_size jobs ahead.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+
+from metrics import summarize
+
+log = logging.getLogger(__name__)
+
+# Marks the end of the queue once every combo has been searched
+DONE = object()
+# Queued in place of a card after the last card of a combo
+COMBO_DONE = object()
+
+
+class DiscoveryWorker(threading.Thread):
+    """
+    Background search stage.
+
+    browser_factory() returns the WebDriver the worker owns; close_browser(browser)
+    quits it when the worker is done (browser.quit() if not given).
+    scan_page(browser, position, location, start, seen) loads one search page and
+    returns (cards harvested, cards selected). scheduler yields (position,
+    location, seconds) for every combo to search and is told the seconds each
+    one took through spent(), like ComboScheduler. A combo is searched until
+    its seconds run out or stale_pages pages in a row selected nothing.
+
+    Every selected card is queued as (position, location, card) in the order it
+    was found, followed by (position, location, COMBO_DONE) once the combo is done.
+    """
+
+    def __init__(self, browser_factory, scan_page, scheduler, queue_size=25,
+                 jobs_per_page=25, stale_pages=3, close_browser=None) -> None:
+        super().__init__(name="discovery", daemon=True)
+        self.browser_factory = browser_factory
+        self.close_browser = close_browser or (lambda browser: browser.quit())
+        self.scan_page = scan_page
+        self.scheduler = scheduler
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.jobs_per_page = jobs_per_page
+        self.stale_pages = stale_pages
+        self.stop_event = threading.Event()
+        self.error = None
+        self.stats = {"pages": 0, "cards": 0, "queued": 0}
+        self.busy_seconds = 0.0  # loading and filtering pages
+        self.blocked_seconds = 0.0  # waiting for room in the queue
+        self.started_at = None
+        self.finished_at = None
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def _put(self, item) -> bool:
+        """Queue item, waiting for room unless the worker is being stopped"""
+        started = time.perf_counter()
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    self.queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            self.blocked_seconds += time.perf_counter() - started
+
+    def run(self) -> None:
+        self.started_at = time.perf_counter()
+        browser = None
+        try:
+            browser = self.browser_factory()
+            seen = set()  # shared across combos so a job listed under several searches is queued once
+            for position, location, seconds in self.scheduler:
+                started = time.time()
+                self._search(browser, position, location, seconds, seen)
+                self.scheduler.spent(time.time() - started)
+                if self.stop_event.is_set() or not self._put((position, location, COMBO_DONE)):
+                    break
+        except Exception as e:
+            log.error(f"Discovery worker failed: {e}")
+            self.error = e
+        finally:
+            if browser is not None:
+                try:
+                    self.close_browser(browser)
+                except Exception as e:
+                    log.debug(f"Could not quit discovery browser: {e}")
+            self.finished_at = time.perf_counter()
+            # The apply stage always gets an end marker, even when stopping
+            while True:
+                try:
+                    self.queue.put(DONE, timeout=0.5)
+                    break
+                except queue.Full:
+                    if self.stop_event.is_set():
+                        break
+
+    def _search(self, browser, position, location, seconds, seen) -> None:
+        log.info(f"Discovering jobs for {position}: {location} for up to {seconds / 60:.0f} minutes")
+        combo_started = time.time()
+        start = 0
+        stale = 0
+        while time.time() - combo_started < seconds and not self.stop_event.is_set():
+            page_started = time.perf_counter()
+            try:
+                harvested, selected = self.scan_page(browser, position, location, start, seen)
+            except Exception as e:
+                log.error(f"Discovery failed on {position}: {location} (start={start}): {e}")
+                harvested, selected = 0, []
+            self.busy_seconds += time.perf_counter() - page_started
+            self.stats["pages"] += 1
+            self.stats["cards"] += harvested
+            log.info(f"Discovered {len(selected)} of {harvested} jobs on {position}: {location} (start={start})")
+
+            for card in selected:
+                if not self._put((position, location, card)):
+                    return
+                self.stats["queued"] += 1
+
+            stale = stale + 1 if not selected else 0
+            if stale >= self.stale_pages:
+                log.info(f"No new Easy Apply matches on the last {stale} pages of {position}: {location}, moving on")
+                return
+            start += self.jobs_per_page
+
+    def utilization(self) -> float:
+        """Share of the worker's lifetime spent loading and filtering pages"""
+        if self.started_at is None:
+            return 0.0
+        elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+        return self.busy_seconds / elapsed if elapsed > 0 else 0.0
+
+
+class PipelineMetrics:
+    """Queue depth seen by the apply stage and how busy each stage was"""
+
+    def __init__(self) -> None:
+        self.queue_depths = []
+        self.apply_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def report(self, worker) -> dict:
+        total = self.apply_seconds + self.wait_seconds
+        depth = summarize(self.queue_depths)
+        return {
+            "pages": worker.stats["pages"],
+            "cards": worker.stats["cards"],
+            "queued": worker.stats["queued"],
+            "queue_depth_mean": round(depth["mean"], 1),
+            "queue_depth_max": depth["max"],
+            "discovery_utilization": round(worker.utilization(), 3),
+            "discovery_blocked_seconds": round(worker.blocked_seconds, 1),
+            "apply_utilization": round(self.apply_seconds / total, 3) if total else 0.0,
+            "apply_idle_seconds": round(self.wait_seconds, 1),
+        }
@@ -0,0 +1,112 @@
+"""
+Offline chromedriver resolution.
+
+ChromeDriverManager().install() asks the network which driver fits the
+installed Chrome on every launch. The driver it picks only has to change
+when Chrome's major version does, so the result is kept in a small JSON
+manifest together with that version, and later launches use the cached
+driver without importing webdriver_manager or going online.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import plistlib
+import re
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST = Path.home() / ".cache" / "easyapplybot" / "chromedriver.json"
+
+CHROME_COMMANDS = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+MAC_APPS = ("/Applications/Google Chrome.app", "/Applications/Chromium.app")
+WINDOWS_KEYS = (r"Software\Google\Chrome\BLBeacon", r"Software\Chromium\BLBeacon")
+
+
+def installed_chrome_version():
+    """Version of the installed Chrome (e.g. "126.0.6478.126"), read locally, or None"""
+    try:
+        if sys.platform == "win32":
+            import winreg
+            for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                for key_path in WINDOWS_KEYS:
+                    try:
+                        with winreg.OpenKey(root, key_path) as key:
+                            return winreg.QueryValueEx(key, "version")[0]
+                    except OSError:
+                        continue
+            return None
+        if sys.platform == "darwin":
+            for app in MAC_APPS:
+                plist = Path(app) / "Contents" / "Info.plist"
+                if plist.is_file():
+                    with open(plist, "rb") as f:
+                        return plistlib.load(f).get("CFBundleShortVersionString")
+            return None
+        for command in CHROME_COMMANDS:
+            path = shutil.which(command)
+            if path is None:
+                continue
+            output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=5).stdout
+            match = re.search(r"\d+(\.\d+)+", output)
+            if match:
+                return match.group(0)
+    except Exception as e:
+        log.debug(f"Could not read the installed Chrome version: {e}")
+    return None
+
+
+def _read_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(path, manifest) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.debug(f"Could not write chromedriver manifest {path}: {e}")
+
+
+def resolve_chromedriver(manifest=DEFAULT_MANIFEST, refresh=False) -> str:
+    """
+    Path of a chromedriver for the installed Chrome.
+
+    Uses the cached driver while the manifest's Chrome major version matches
+    the installed one (or the installed version cannot be read); otherwise,
+    or with refresh=True, downloads one with webdriver_manager and records it.
+    """
+    manifest = Path(manifest)
+    version = installed_chrome_version()
+    major = version.split(".")[0] if version else None
+    if not refresh:
+        cached = _read_manifest(manifest)
+        if cached and cached.get("driver") and Path(cached["driver"]).is_file() \
+                and (major is None or cached.get("chrome_major") == major):
+            log.debug(f"Using cached chromedriver {cached['driver']} for Chrome {version or cached.get('chrome_version')}")
+            return cached["driver"]
+
+    log.info(f"Resolving chromedriver for Chrome {version or '(unknown version)'}")
+    from webdriver_manager.chrome import ChromeDriverManager
+    driver = ChromeDriverManager().install()
+    _write_manifest(manifest, {
+        "chrome_version": version,
+        "chrome_major": major,
+        "driver": driver,
+        "resolved": time.strftime("%Y-%m-%d %H:%M:%S"),
+    })
+    return driver
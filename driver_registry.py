@@ -0,0 +1,126 @@
+"""
+Record of the chromedriver and Chrome processes each bot run starts.
+
+A run killed before it could quit its browser (SIGKILL, a crash, a closed
+terminal) leaves chromedriver and Chrome running. Every run writes the PIDs
+of the browsers it has open to its own file under DEFAULT_DIR, drops a
+browser's PIDs when that browser is quit and deletes the file once none are
+left; a file whose owner is gone belongs to such a run, and
+reap_orphans() terminates the processes it lists. Process start times are
+recorded with the PIDs so a reused PID is never killed. Needs psutil; without
+it nothing is recorded or reaped.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+try:
+    import psutil
+except ImportError:  # optional, only needed to find and reap orphaned processes
+    psutil = None
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DIR = Path.home() / ".cache" / "easyapplybot" / "drivers"
+
+
+def _started(pid):
+    try:
+        return psutil.Process(pid).create_time()
+    except (psutil.Error, ValueError):
+        return None
+
+
+class DriverRegistry:
+    """
+    PIDs of the browsers this process has open, in DEFAULT_DIR/<pid>.json, and reaping of earlier runs' leftovers.
+
+    Each browser is registered and unregistered on its own, so quitting the
+    main browser leaves the discovery browser's processes on record.
+    """
+
+    def __init__(self, directory=DEFAULT_DIR) -> None:
+        self.directory = Path(directory)
+        self.path = self.directory / f"{os.getpid()}.json"
+        self.browsers = {}  # id(browser) -> {pid: start time}
+        self.lock = threading.Lock()  # the discovery worker launches its browser from another thread
+
+    def register(self, browser) -> None:
+        """Record browser's chromedriver and the Chrome processes it started"""
+        if psutil is None:
+            return
+        try:
+            driver = psutil.Process(browser.service.process.pid)
+            processes = {process.pid: process.create_time() for process in [driver] + driver.children(recursive=True)}
+            with self.lock:
+                self.browsers[id(browser)] = processes
+                self._write()
+        except Exception as e:
+            log.debug(f"Could not record the browser processes: {e}")
+
+    def unregister(self, browser) -> None:
+        """Forget browser's processes once it was quit; the file goes with the last browser"""
+        with self.lock:
+            if self.browsers.pop(id(browser), None) is None:
+                return
+            try:
+                if self.browsers:
+                    self._write()
+                else:
+                    self.path.unlink(missing_ok=True)
+            except OSError as e:
+                log.debug(f"Could not update {self.path}: {e}")
+
+    def _write(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        processes = {str(pid): started for browser in self.browsers.values() for pid, started in browser.items()}
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"owner": os.getpid(), "owner_started": _started(os.getpid()), "processes": processes}, f)
+        os.replace(tmp, self.path)
+
+    def reap_orphans(self) -> int:
+        """Terminate the processes recorded by runs that are no longer alive. Returns how many were stopped"""
+        if psutil is None:
+            log.warning("psutil is not installed, leftover chromedriver/Chrome processes of earlier runs "
+                        "are not stopped (pip install psutil)")
+            return 0
+        reaped = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                continue
+            owner_started = _started(record.get("owner", -1))
+            if owner_started is not None and owner_started == record.get("owner_started"):
+                continue  # that run is still going
+            victims = []
+            for pid, started in record.get("processes", {}).items():
+                try:
+                    process = psutil.Process(int(pid))
+                    if process.create_time() == started:
+                        victims.append(process)
+                except (psutil.Error, ValueError):
+                    continue
+            for process in victims:
+                try:
+                    process.terminate()
+                except psutil.Error:
+                    pass
+            _, alive = psutil.wait_procs(victims, timeout=5)
+            for process in alive:
+                try:
+                    process.kill()
+                except psutil.Error:
+                    pass
+            reaped += len(victims)
+            path.unlink(missing_ok=True)
+        if reaped:
+            log.info(f"Stopped {reaped} chromedriver/Chrome processes left behind by earlier runs")
+        return reaped
@@ -1,23 +1,23 @@
 from __future__ import annotations
 
+import atexit
+import contextlib
 import json
 import csv
 import logging
 import os
 import random
 import re
+import signal
+import threading
 import time
 from datetime import datetime, timedelta
-from difflib import SequenceMatcher
 import getpass
 from pathlib import Path
 
-import pandas as pd
-import pyautogui
 import yaml
-from bs4 import BeautifulSoup
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -27,14 +27,31 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from selenium.webdriver.chrome.service import Service as ChromeService
-import webdriver_manager.chrome as ChromeDriverManager
-ChromeDriverManager = ChromeDriverManager.ChromeDriverManager
+
+import page_scripts
+from browser_watchdog import BrowserWatchdog
+from command_audit import CommandAuditor
+from discovery import COMBO_DONE, DONE, DiscoveryWorker, PipelineMetrics
+from driver_cache import resolve_chromedriver
+from driver_registry import DriverRegistry
+from matching import AnswerMatcher, BlacklistMatcher, RelevanceScorer
+from metrics import PhaseRecorder, summarize, timed
+from network import NetworkStats, block_requests, blocked_url_patterns, enable_performance_log
+from scheduler import ComboScheduler
+from search_page import SCROLL_UNTIL_STABLE, LazyPage, harvest_cards
+from seen_index import APPLIED, BLACKLISTED, FAILED, SKIPPED, SeenJobIndex
+from selector_registry import SelectorRegistry
+from storage import AnswerStore, BackgroundWriter, HistoryStore, SessionStore
+from waits import DomWaiter
 
 
 log = logging.getLogger(__name__)
 
 
 def setupLogger() -> None:
+    # Called by every bot instance; only the first one sets up the log file and console handler
+    if log.handlers:
+        return
     dt: str = datetime.strftime(datetime.now(), "%m_%d_%y %H_%M_%S ")
 
     if not os.path.isdir('./logs'):
@@ -52,15 +69,24 @@ def setupLogger() -> None:
 
 
 class EasyApplyBot:
-    setupLogger()
     # MAX_SEARCH_TIME is 10 hours by default, feel free to modify it
     MAX_SEARCH_TIME = 60 * 60
+    # load_page scrolls this far per step and stops once the card count has not grown for this many steps
+    SCROLL_STEP_PX = 500
+    SCROLL_STABLE_STEPS = 2
+    # A search combo is abandoned after this many pages in a row without a new Easy Apply match
+    STALE_PAGES = 3
+    # How many discovered jobs the discovery worker may queue ahead of the apply stage
+    DISCOVERY_QUEUE_SIZE = 25
+    # Root of every page the bot visits, overridden by benchmark.py to point at the replay server
+    BASE_URL = "https://www.linkedin.com"
+    # Signals that shut the bot down cleanly inside a `with EasyApplyBot(...)` block (Ctrl+C already does)
+    SHUTDOWN_SIGNALS = ("SIGTERM", "SIGHUP", "SIGBREAK")
 
     def __init__(self,
                  username,
                  password,
                  phone_number,
-                 # profile_path,
                  salary,
                  rate,
                  uploads={},
@@ -69,9 +95,24 @@ class EasyApplyBot:
                  blackListTitles=[],
                  experience_level=[],
                  years_of_experience=8,
-                 interactive_mode=False
+                 interactive_mode=False,
+                 history_days=2,
+                 scroll_steps=30,
+                 scroll_timeout=10,
+                 discovery_worker=False,
+                 search_budget_minutes=None,
+                 audit_commands=False,
+                 profile_path=None,
+                 reuse_session=True,
+                 headless=False,
+                 block_resources=(),
+                 block_urls=(),
+                 network_stats=False,
+                 memory_limit_mb=None,
+                 recycle_jobs=0
                  ) -> None:
 
+        setupLogger()
         log.info("Welcome to Easy Apply Bot")
         dirpath: str = os.getcwd()
         log.info("current directory is : " + dirpath)
@@ -96,16 +137,87 @@ class EasyApplyBot:
         self.rate = rate
         self.years_of_experience = years_of_experience
         self.interactive_mode = interactive_mode
-        # self.profile_path = profile_path
-        past_ids: list | None = self.get_appliedIDs(filename)
-        self.appliedJobIDs: list = past_ids if past_ids != None else []
+        # Persistent Chrome profile (--user-data-dir) for the main browser, if configured
+        self.profile_path = profile_path
+        # Cookies of the last signed-in session, tried before the login form
+        self.session = SessionStore("linkedin_session.json") if reuse_session else None
+        # Every disk append goes through one background thread, journaled next to the output CSV;
+        # phase timing events are not worth an fsync and skip the journal
+        self.writer = BackgroundWriter(Path(filename).with_suffix(".journal"), unjournaled=("event",))
+        # Per-phase timings as JSON lines next to the output CSV (output.csv -> output_events.jsonl)
+        self.events_file = Path(filename).with_name(Path(filename).stem + "_events.jsonl")
+        self.phases = PhaseRecorder(sink=lambda event: self.writer.submit("event", event))
+        # Indexed history of past attempts, next to the output CSV (output.csv -> output.db)
+        self.history = HistoryStore(Path(filename).with_suffix(".db"), lookback_days=history_days)
         self.filename: str = filename
+        # Answers resolved in earlier runs (and hand-written ones from qa.csv), read lazily from SQLite
+        self.qa_file = Path("qa.csv")
+        self.answer_store = AnswerStore("answers.db", legacy_csv=self.qa_file, writer=self.writer)
+
+        # Initialize unanswered questions tracking
+        self.unanswered_questions_file = Path("unanswered_questions.yaml")
+        self.unanswered_questions = set()
+        if not self.unanswered_questions_file.exists():
+            with open(self.unanswered_questions_file, 'w') as f:
+                f.write("# Unanswered Questions\n")
+                f.write("# Review and add appropriate keywords and answers below\n")
+                f.write("# Then copy them to questions.yaml for the bot to use\n\n")
+
+        # Started before anything is submitted so the startup phases are batched like every other write,
+        # and writes a killed run left in the journal are replayed before the applied job IDs are read
+        self.writer.register("event", self.write_events)
+        self.writer.register("result", self.write_results)
+        self.writer.register("unanswered", self.write_unanswered_questions)
+        self.writer.register("saved_answer", self.write_saved_answers)
+        self.writer.register("answer", self.answer_store.write_many)
+        self.writer.start()
+        atexit.register(self.writer.close)
+        self.appliedJobIDs: set = self.get_appliedIDs(filename)
+        # Every job already applied to, failed, blacklisted or skipped, memory-mapped (output.csv -> output.idx)
+        self.seen_jobs = SeenJobIndex(Path(filename).with_suffix(".idx"), retry_days=history_days)
+        if self.seen_jobs.empty:
+            log.info(f"Seeded seen-job index with {self.seen_jobs.seed(self.history.attempts())} past attempts")
+        atexit.register(self.seen_jobs.close)
+        self.headless = headless
+        # Requests matching these patterns are failed inside Chrome before they are sent
+        self.block_resources = list(block_resources or ())
+        self.blocked_urls = blocked_url_patterns(self.block_resources, block_urls)
+        # Bytes transferred and requests blocked per search page, from Chrome's performance log
+        self.network = NetworkStats() if network_stats else None
+        # Opt-in count and timing of every WebDriver command, charged to the job being applied to
+        self.audit = CommandAuditor(context=self.phases.context) if audit_commands else None
+        # Samples browser memory after every job and recycles it past memory_limit_mb or every recycle_jobs jobs
+        self.watchdog = BrowserWatchdog(memory_limit_mb, recycle_jobs) if memory_limit_mb or recycle_jobs else None
+        self.current_search = None  # (position, location, start) of the search page on screen
+        # Chromedriver/Chrome processes of this run, so a later run can reap them if this one gets killed
+        self.drivers = DriverRegistry()
+        with self.phases.phase("reap_orphans"):
+            self.drivers.reap_orphans()
         self.options = self.browser_options()
-        self.browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=self.options)
+        self.browser = self.launch_browser(self.options)
+        # Quits the browser at exit if close() never ran; the writer, registered earlier, is closed after it
+        atexit.register(self.quit_browser)
         self.wait = WebDriverWait(self.browser, 30)
+        self.waiter = DomWaiter(self.browser)
+        self.page_loads = []  # seconds spent in every load_page call
+        self.scroll_steps = scroll_steps
+        self.scroll_timeout = scroll_timeout
+        self.cards_per_page = []  # job cards harvested from every search page
+        self.discovery_worker = discovery_worker
+        self.search_budget_minutes = search_budget_minutes
+        self.pipeline_metrics = {}
+        # Fallback chains try whichever selector worked last first; stats persist in selectors.db
+        self.selectors = SelectorRegistry(self.browser)
+        self.register_selectors()
+        atexit.register(self.selectors.save)
         self.blacklist = blacklist
         self.blackListTitles = blackListTitles
-        self.start_linkedin(username, password)
+        # Compiled once; every card is checked against each list in a single pass
+        self.company_blacklist = BlacklistMatcher(blacklist)
+        self.title_blacklist = BlacklistMatcher(blackListTitles)
+        # Kept to sign in again if the browser has to be recycled
+        self.credentials = (username, password)
+        self.sign_in(username, password)
         self.phone_number = phone_number
         self.experience_level = experience_level
 
@@ -119,6 +231,8 @@ class EasyApplyBot:
             "upload_cv": (By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]"),
             "follow": (By.CSS_SELECTOR, "label[for='follow-company-checkbox']"),
             "upload": (By.NAME, "file"),
+            "upload_resume_section": (By.XPATH, '//span[text()="Upload resume"]'),
+            "upload_cv_section": (By.XPATH, '//span[text()="Upload cover letter"]'),
             "search": (By.CLASS_NAME, "jobs-search-results-list"),
             "links": ("xpath", '//div[@data-job-id]'),
             "fields": (By.CLASS_NAME, "jobs-easy-apply-form-section__grouping"),
@@ -126,24 +240,15 @@ class EasyApplyBot:
             "multi_select": (By.XPATH, "//*[contains(@id, 'text-entity-list-form-component')]"),
             "text_select": (By.CLASS_NAME, "artdeco-text-input--input"),
             "2fa_oneClick": (By.ID, 'reset-password-submit-button'),
-            "easy_apply_button": (By.XPATH, '//button[contains(@class, "jobs-apply-button")]')
+            "easy_apply_button": (By.XPATH, '//button[contains(@class, "jobs-apply-button")]'),
+            # CSS the waits resolve on: the job details panel and any Easy Apply step button
+            "job_details": (By.CSS_SELECTOR, ".jobs-apply-button, .jobs-details-top-card__apply-error, .jobs-unified-top-card, .job-details-jobs-unified-top-card__container--two-pane"),
+            "modal_ready": (By.CSS_SELECTOR, "button[aria-label='Continue to next step'], button[aria-label='Review your application'], button[aria-label='Submit application']"),
+            "discard": (By.CSS_SELECTOR, "button[data-test-dialog-primary-btn]"),
+            "modal": (By.CSS_SELECTOR, ".jobs-easy-apply-modal, div[role='dialog']")
 
         }
 
-        #initialize questions and answers file
-        self.qa_file = Path("qa.csv")
-        self.answers = {}
-
-        #if qa file does not exist, create it
-        if self.qa_file.is_file():
-            df = pd.read_csv(self.qa_file)
-            for index, row in df.iterrows():
-                self.answers[row['Question']] = row['Answer']
-        #if qa file does exist, load it
-        else:
-            df = pd.DataFrame(columns=["Question", "Answer"])
-            df.to_csv(self.qa_file, index=False, encoding='utf-8')
-
         # Load custom answers from YAML file
         self.user_answers = []
         try:
@@ -154,37 +259,82 @@ class EasyApplyBot:
             log.info("questions.yaml not found, will use default answering logic.")
         except yaml.YAMLError as exc:
             log.error(f"Error parsing questions.yaml: {exc}")
-
-        # Initialize unanswered questions tracking
-        self.unanswered_questions_file = Path("unanswered_questions.yaml")
-        self.unanswered_questions = set()
-        if not self.unanswered_questions_file.exists():
-            with open(self.unanswered_questions_file, 'w') as f:
-                f.write("# Unanswered Questions\n")
-                f.write("# Review and add appropriate keywords and answers below\n")
-                f.write("# Then copy them to questions.yaml for the bot to use\n\n")
-
-
-    def get_appliedIDs(self, filename) -> list | None:
+        # Compile every keyword once so ans_question is a single pass over the question
+        self.answer_matcher = AnswerMatcher(self.user_answers)
+
+
+    def register_selectors(self) -> None:
+        """Fallback chains for every element LinkedIn has rendered in more than one way"""
+        def usable(element, *args):
+            return element.is_displayed() and element.is_enabled()
+
+        def usable_for_job(element, jobID):
+            # Match by job ID if available, otherwise just take the visible button
+            button_job_id = element.get_attribute('data-job-id')
+            return usable(element) and (button_job_id == str(jobID) or not button_job_id)
+
+        def says_easy_apply(element, *args):
+            return usable(element) and 'easy apply' in element.text.strip().lower()
+
+        def labelled_easy_apply(element, *args):
+            aria_label = (element.get_attribute('aria-label') or '').lower()
+            return ('easy apply' in element.text.strip().lower() or 'easy apply' in aria_label) and usable(element)
+
+        def displayed(element, *args):
+            return element.is_displayed()
+
+        self.selectors.register("login_button", [
+            ((By.XPATH, '//*[@id="organic-div"]/form/div[3]/button'), None),
+            ((By.XPATH, '//button[@type="submit"]'), None),
+            ((By.XPATH, '//button[contains(text(), "Sign in")]'), None),
+            ((By.XPATH, '//button[contains(text(), "Sign")]'), None),
+            ((By.XPATH, '//input[@type="submit"]'), None),
+        ])
+        # The button appears in the job details panel on the right side, not within the card itself
+        self.selectors.register("easy_apply_button", [
+            ((By.ID, 'jobs-apply-button'), usable),
+            ((By.ID, 'jobs-apply-button-id'), usable),
+            ((By.CSS_SELECTOR, 'button.jobs-apply-button'), usable_for_job),
+            ((By.XPATH, '//button[contains(@aria-label, "Easy Apply")]'), usable_for_job),
+            ((By.XPATH, '//button[contains(., "Easy Apply")]'), says_easy_apply),
+            ((By.CSS_SELECTOR, 'button.artdeco-button--primary'), labelled_easy_apply),
+        ])
+        self.selectors.register("discard", [
+            ((By.XPATH, '//button[@data-test-dialog-primary-btn]'), displayed),
+            ((By.XPATH, '//button[contains(text(), "Discard")]'), displayed),
+            ((By.XPATH, '//button[contains(@aria-label, "Discard")]'), displayed),
+        ])
+        self.selectors.register("modal_close", [
+            ((By.CSS_SELECTOR, 'button[aria-label="Dismiss"]'), displayed),
+            ((By.CSS_SELECTOR, 'button[data-test-modal-close-btn]'), displayed),
+            ((By.XPATH, '//button[contains(@aria-label, "Dismiss")]'), displayed),
+            ((By.XPATH, '//button[contains(@class, "artdeco-modal__dismiss")]'), displayed),
+            ((By.CSS_SELECTOR, 'button.artdeco-modal__dismiss'), displayed),
+        ])
+        self.selectors.register("upload_resume", [
+            ((By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-resume')]"), None),
+            ((By.XPATH, "//input[@type='file' and contains(@id, 'resume')]"), None),
+            ((By.XPATH, "//input[@type='file'][contains(@name, 'resume')]"), None),
+            ((By.CSS_SELECTOR, "input[type='file'][id*='resume']"), None),
+        ])
+
+    def get_appliedIDs(self, filename) -> set:
+        """Job IDs attempted within the lookback window, importing the output CSV the first time it is seen"""
         try:
-            df = pd.read_csv(filename,
-                             header=None,
-                             names=['timestamp', 'jobID', 'job', 'company', 'attempted', 'result'],
-                             lineterminator='\n',
-                             encoding='utf-8')
-
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format="%Y-%m-%d %H:%M:%S")
-            df = df[df['timestamp'] > (datetime.now() - timedelta(days=2))]
-            jobIDs: list = list(df.jobID)
-            log.info(f"{len(jobIDs)} jobIDs found")
-            return jobIDs
+            self.history.import_csv(filename)
         except Exception as e:
-            log.info(str(e) + "   jobIDs could not be loaded from CSV {}".format(filename))
-            return None
+            log.info(str(e) + "   jobIDs could not be imported from CSV {}".format(filename))
+        jobIDs: set = self.history.load_recent()
+        log.info(f"{len(jobIDs)} jobIDs found")
+        return jobIDs
 
-    def browser_options(self):
+    def browser_options(self, profile=True):
         options = webdriver.ChromeOptions()
-        options.add_argument("--start-maximized")
+        if self.headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+        else:
+            options.add_argument("--start-maximized")
         options.add_argument("--ignore-certificate-errors")
         options.add_argument('--no-sandbox')
         options.add_argument("--disable-extensions")
@@ -195,13 +345,170 @@ class EasyApplyBot:
         options.add_argument("--disable-blink-features")
         options.add_argument("--disable-blink-features=AutomationControlled")
 
-        # Load user profile
-        #options.add_argument(r"--user-data-dir={}".format(self.profile_path))
+        if "images" in self.block_resources:
+            # Also covers images whose URL has no extension
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        if self.network is not None:
+            enable_performance_log(options)
+
+        # Load user profile; only one browser can use it, so the discovery browser passes profile=False
+        if profile and self.profile_path:
+            options.add_argument(r"--user-data-dir={}".format(self.profile_path))
         return options
 
-    def start_linkedin(self, username, password) -> None:
+    def launch_browser(self, options):
+        """Chrome with the cached chromedriver, resolved again if Chrome was updated under it"""
+        with self.phases.phase("resolve_driver"):
+            driver = resolve_chromedriver()
+        with self.phases.phase("launch_browser"):
+            try:
+                browser = webdriver.Chrome(service=ChromeService(driver), options=options)
+            except SessionNotCreatedException as e:
+                log.info(f"Cached chromedriver does not fit the installed Chrome ({e.msg}), resolving it again")
+                browser = webdriver.Chrome(service=ChromeService(resolve_chromedriver(refresh=True)), options=options)
+        try:
+            block_requests(browser, self.blocked_urls)
+        except Exception as e:
+            log.error(f"Could not set up request blocking: {e}")
+        if self.audit is not None:
+            self.audit.attach(browser)
+        self.drivers.register(browser)
+        return browser
+
+    def quit_browser(self) -> None:
+        """Quit the browser and its chromedriver; does nothing once they are gone"""
+        if self.browser is None:
+            return
+        browser, self.browser = self.browser, None
+        self.close_browser(browser)
+
+    def close_browser(self, browser) -> None:
+        """Quit one browser and drop its processes from the driver registry"""
+        try:
+            browser.quit()
+        except Exception as e:
+            log.debug(f"Could not quit the browser: {e}")
+        self.drivers.unregister(browser)
+
+    def close(self) -> None:
+        """Flush every pending write and quit the browser; safe to call more than once"""
+        log.info("Shutting down: flushing pending writes and quitting the browser")
+        for step in (self.selectors.save, self.seen_jobs.close, self.writer.close, self.quit_browser):
+            try:
+                step()
+            except Exception as e:
+                log.error(f"Error during shutdown ({step.__qualname__}): {e}")
+
+    def __enter__(self) -> "EasyApplyBot":
+        self.previous_handlers = {}
+        # Signal handlers can only be set from the main thread
+        if threading.current_thread() is threading.main_thread():
+            for name in ("SIGINT",) + self.SHUTDOWN_SIGNALS:
+                signum = getattr(signal, name, None)
+                if signum is not None:
+                    self.previous_handlers[signum] = signal.getsignal(signum)
+                    if name != "SIGINT":
+                        signal.signal(signum, self.on_shutdown_signal)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # A second Ctrl+C or SIGTERM must not cut the shutdown short
+        for signum in self.previous_handlers:
+            signal.signal(signum, signal.SIG_IGN)
+        try:
+            self.close()
+        finally:
+            for signum, handler in self.previous_handlers.items():
+                signal.signal(signum, handler if handler is not None else signal.SIG_DFL)
+
+    def on_shutdown_signal(self, signum, frame) -> None:
+        log.info(f"Received {signal.Signals(signum).name}, shutting down")
+        # Unwinds to __exit__ like Ctrl+C does; BaseException, so the loops' except Exception let it through
+        raise SystemExit(128 + signum)
+
+    def sign_in(self, username, password, cookies=None) -> None:
+        """
+        Reuse a signed-in session when it is still valid, otherwise log in with the form.
+        The session is cookies when given (a recycled browser), else the stored one or the Chrome profile.
+        """
+        with self.phases.phase("session_check") as event:
+            event["restored"] = restored = self.restore_session(username, cookies)
+        if restored:
+            log.info("Reusing the signed-in LinkedIn session, skipping the login form")
+            return
+        with self.phases.phase("login") as event:
+            event["result"] = logged_in = self.start_linkedin(username, password)
+        if logged_in and self.session is not None:
+            self.session.save(username, self.browser.get_cookies())
+
+    def restore_session(self, username, cookies=None) -> bool:
+        """Load the session cookies and check with a single HEAD request whether they are still signed in"""
+        if cookies is None:
+            cookies = self.session.load(username) if self.session is not None else []
+        if not cookies and not self.profile_path:
+            return False
+        try:
+            self.add_cookies(self.browser, cookies)
+            if self.browser.execute_async_script(page_scripts.SESSION_CHECK, self.BASE_URL + "/feed/"):
+                return True
+            log.info("Stored LinkedIn session has expired, logging in again")
+            self.browser.delete_all_cookies()
+        except Exception as e:
+            log.info(f"Could not check the stored LinkedIn session: {e}")
+        return False
+
+    def add_cookies(self, browser, cookies) -> None:
+        # add_cookie only works on a page of the cookies' domain; robots.txt is the cheapest one
+        browser.get(self.BASE_URL + "/robots.txt")
+        for cookie in cookies:
+            try:
+                browser.add_cookie(cookie)
+            except Exception as e:
+                log.debug(f"Could not add cookie {cookie.get('name')}: {e}")
+
+    def check_browser(self) -> bool:
+        """Sample the browser's memory after a job and recycle it when over the limits. True when it was recycled"""
+        if self.watchdog is None:
+            return False
+        with self.phases.phase("memory_sample") as event:
+            sample = self.watchdog.sample(self.browser)
+            event.update(sample)
+        reason = self.watchdog.recycle_reason(sample)
+        if reason is None:
+            return False
+        self.recycle_browser(reason)
+        return True
+
+    def recycle_browser(self, reason) -> None:
+        """Replace the browser with a fresh one signed in with the same session"""
+        log.info(f"Recycling the browser: {reason}")
+        with self.phases.phase("recycle_browser", reason=reason):
+            try:
+                cookies = self.browser.get_cookies()
+            except Exception as e:
+                log.debug(f"Could not read cookies before recycling: {e}")
+                cookies = []
+            self.quit_browser()
+            self.browser = self.launch_browser(self.options)
+            self.wait = WebDriverWait(self.browser, 30)
+            self.waiter.browser = self.browser
+            self.selectors.browser = self.browser
+            # Launched with --start-maximized, like the first browser before fill_data shrank it
+            self.sign_in(*self.credentials, cookies=cookies)
+            self.watchdog.recycled()
+
+    def resume_search(self) -> None:
+        """Reload the search page that was on screen before the browser was recycled"""
+        if self.current_search is None:
+            return
+        position, location, start = self.current_search
+        log.info(f"Resuming {position}{location} at start={start}")
+        self.browser.get(self.search_url(position, location, start))
+        self.load_page()
+
+    def start_linkedin(self, username, password) -> bool:
         log.info("Logging in.....Please wait :)  ")
-        self.browser.get("https://www.linkedin.com/login?trk=guest_homepage-basic_nav-header-signin")
+        self.browser.get(self.BASE_URL + "/login?trk=guest_homepage-basic_nav-header-signin")
         try:
             # Wait for username field to be present
             user_field = self.wait.until(EC.presence_of_element_located((By.ID, "username")))
@@ -212,25 +519,9 @@ class EasyApplyBot:
             pw_field = self.browser.find_element("id","password")
             pw_field.send_keys(password)
             
-            # Try multiple possible login button selectors
-            login_button = None
-            possible_selectors = [
-                '//*[@id="organic-div"]/form/div[3]/button',
-                '//button[@type="submit"]',
-                '//button[contains(text(), "Sign in")]',
-                '//button[contains(text(), "Sign")]',
-                '//input[@type="submit"]'
-            ]
-            
-            for selector in possible_selectors:
-                try:
-                    login_button = self.browser.find_element("xpath", selector)
-                    if login_button:
-                        log.info(f"Found login button with selector: {selector}")
-                        break
-                except:
-                    continue
-            
+            # Try the possible login button selectors, last run's winner first
+            login_button = self.selectors.find("login_button")
+
             if login_button:
                 login_button.click()
                 log.info("Login button clicked successfully")
@@ -256,6 +547,7 @@ class EasyApplyBot:
             # Check if login was successful
             if "feed" in self.browser.current_url or "mynetwork" in self.browser.current_url:
                 log.info("Successfully logged into LinkedIn!")
+                return True
             else:
                 log.info("Login may have failed. Current URL: " + self.browser.current_url)
                 
@@ -264,8 +556,11 @@ class EasyApplyBot:
         except Exception as e:
             log.info(f"Login error: {str(e)}")
             log.info("Please check your credentials and try again.")
+        return False
 
     def fill_data(self) -> None:
+        if self.headless:
+            return
         self.browser.set_window_size(1, 1)
         self.browser.set_window_position(2000, 2000)
 
@@ -274,229 +569,367 @@ class EasyApplyBot:
         self.fill_data()
         self.positions = positions
         self.locations = locations
-        combos: list = []
-        while len(combos) < len(positions) * len(locations):
-            position = positions[random.randint(0, len(positions) - 1)]
-            location = locations[random.randint(0, len(locations) - 1)]
-            combo: tuple = (position, location)
-            if combo not in combos:
-                combos.append(combo)
-                log.info(f"Applying to {position}: {location}")
-                location = "&location=" + location
-                self.applications_loop(position, location)
-            if len(combos) > 500:
-                break
-
-    # self.finish_apply() --> this does seem to cause more harm than good, since it closes the browser which we usually don't want, other conditions will stop the loop and just break out
-
-    def applications_loop(self, position, location):
-
+        self.relevance_scorer = RelevanceScorer(positions)
+        # Stored answers derived from these inputs are dropped once any of them change
+        self.answer_store.set_generation(self.user_answers, self.salary, self.years_of_experience, locations[:1])
+        # Blacklisted and skipped jobs from earlier runs only count while these filters stay the same
+        self.seen_jobs.set_generation(self.blacklist, self.blackListTitles, positions)
+        # Every combo once, the most productive ones in earlier runs first, sharing one time budget
+        combo_count = len(set(positions)) * len(set(locations))
+        budget = self.search_budget_minutes * 60 if self.search_budget_minutes else self.MAX_SEARCH_TIME * combo_count
+        scheduler = ComboScheduler(positions, locations, self.history.combo_yields(), budget)
+        log.info(f"Search order by past yield (applications/minute): "
+                 f"{[(f'{p}: {l}', round(scheduler.rates[(p, l)], 2)) for p, l in scheduler.order]}")
+
+        if self.discovery_worker:
+            self.pipelined_apply(scheduler)
+        else:
+            for position, location, time_budget in scheduler:
+                log.info(f"Applying to {position}: {location} for up to {time_budget / 60:.0f} minutes")
+                self.phases.set_context(combo=f"{position}: {location}")
+                started = time.time()
+                found = self.applications_loop(position, "&location=" + location, time_budget=time_budget)
+                minutes = (time.time() - started) / 60
+                scheduler.spent(minutes * 60)
+                self.history.record_combo(position, location, minutes, found["matched"], found["applied"])
+        log.info(f"Answer strategy hits/misses: {dict(self.answer_matcher.stats)}")
+        log.info(f"Blacklist rejections: companies {dict(self.company_blacklist.hits)}, titles {dict(self.title_blacklist.hits)}")
+        log.info(f"Selector health: {self.selectors.report()}")
+        log.info(f"Search page loads (s): { {k: round(v, 2) for k, v in summarize(self.page_loads).items()} }")
+        log.info(f"Job cards harvested per page: {self.cards_per_page}")
+        if self.pipeline_metrics:
+            log.info(f"Discovery pipeline: {self.pipeline_metrics}")
+        if self.network is not None:
+            log.info(f"Network (blocking {len(self.blocked_urls)} URL patterns): {self.network.report()}")
+        if self.audit is not None:
+            report = self.audit.report()
+            log.info(f"WebDriver commands: {report}")
+            self.phases.record("webdriver_audit", report["command_seconds"], **report)
+        log.info(f"Phase timings written to {self.events_file}, summarize with: python run_report.py {self.events_file}")
+        self.selectors.save()
+        self.seen_jobs.flush()
+        self.writer.flush()
+
+    # The browser stays open here; it is quit by close(), i.e. when the `with EasyApplyBot(...)` block is left
+
+    def applications_loop(self, position, location, time_budget=None):
+        """
+        Search one position/location combo page by page for up to time_budget seconds (MAX_SEARCH_TIME by default).
+        Moves on early once STALE_PAGES pages in a row had no new Easy Apply matches.
+        Returns {"matched": jobs selected, "applied": applications sent}.
+        """
         count_application = 0
         count_job = 0
         jobs_per_page = 0
+        stale_pages = 0
+        max_time = self.MAX_SEARCH_TIME if time_budget is None else time_budget
         start_time: float = time.time()
 
         log.info("Looking for jobs.. Please wait..")
 
-        self.browser.set_window_position(1, 1)
-        self.browser.maximize_window()
+        if not self.headless:
+            self.browser.set_window_position(1, 1)
+            self.browser.maximize_window()
         self.browser, _ = self.next_jobs_page(position, location, jobs_per_page, experience_level=self.experience_level)
         log.info("Looking for jobs.. Please wait..")
 
-        while time.time() - start_time < self.MAX_SEARCH_TIME:
+        while time.time() - start_time < max_time:
             try:
-                log.info(f"{(self.MAX_SEARCH_TIME - (time.time() - start_time)) // 60} minutes left in this search")
+                log.info(f"{(max_time - (time.time() - start_time)) // 60} minutes left in this search")
 
                 # sleep to make sure everything loads, add random to make us look human.
                 randoTime: float = random.uniform(1.5, 2.9)
                 log.debug(f"Sleeping for {round(randoTime, 1)}")
                 #time.sleep(randoTime)
-                self.load_page(sleep=0.1)
-
-                # LinkedIn displays the search results in a scrollable <div> on the left side, we have to scroll to its bottom
-
-                # scroll to bottom
-
-                if self.is_present(self.locator["search"]):
-                    scrollresults = self.get_elements("search")
-                    #     self.browser.find_element(By.CLASS_NAME,
-                    #     "jobs-search-results-list"
-                    # )
-                    # Selenium only detects visible elements; if we scroll to the bottom too fast, only 8-9 results will be loaded into IDs list
-                    for i in range(300, 3000, 100):
-                        self.browser.execute_script("arguments[0].scrollTo(0, {})".format(i), scrollresults[0])
-                    scrollresults = self.get_elements("search")
-                    #time.sleep(1)
-
-                # get job links, (the following are actually the job card objects)
-                if self.is_present(self.locator["links"]):
-                    links = self.get_elements("links")
-                # links = self.browser.find_elements("xpath",
-                #     '//div[@data-job-id]'
-                # )
-
-                    jobIDs = {} #{Job id: processed_status}
-                    job_cards = {} #{Job id: card_element} - Store card elements for Easy Apply
-
-                    # children selector is the container of the job cards on the left
-                    for link in links:
-                            if 'Applied' not in link.text: #checking if applied already
-                                # Extract job title and company from card
-                                lines = link.text.splitlines() if link.text else []
-                                job_title = lines[0] if len(lines) > 0 else ""
-                                company = lines[1] if len(lines) > 1 else ""
-
-                                # Check if company is blacklisted
-                                if any(blacklisted.lower() in company.lower() for blacklisted in self.blacklist):
-                                    log.info(f"Skipping blacklisted company: '{company}'")
-                                    continue
-
-                                # Check if job title contains blacklisted keywords
-                                if any(blacklisted.lower() in job_title.lower() for blacklisted in self.blackListTitles):
-                                    log.info(f"Skipping blacklisted job title: '{job_title}'")
-                                    continue
-
-                                # Enhanced relevance check with scoring
-                                relevance_score = self.calculate_job_relevance(job_title)
-
-                                if relevance_score > 0:
-                                    jobID = link.get_attribute("data-job-id")
-                                    if jobID == "search":
-                                        log.debug("Job ID not found, search keyword found instead? {}".format(link.text))
-                                        continue
-                                    else:
-                                        log.info(f"Job matched (score: {relevance_score}): '{job_title}' at '{company}'")
-                                        jobIDs[jobID] = "To be processed"
-                                        job_cards[jobID] = link  # Store the card element
-                                else:
-                                    log.debug(f"Skipping low-relevance job: '{job_title}'")
-                    if len(jobIDs) > 0:
-                        self.apply_loop(jobIDs, job_cards)
-                    self.browser, jobs_per_page = self.next_jobs_page(position,
-                                                                      location,
-                                                                      jobs_per_page, 
-                                                                      experience_level=self.experience_level)
-                else:
-                    self.browser, jobs_per_page = self.next_jobs_page(position,
-                                                                      location,
-                                                                      jobs_per_page, 
-                                                                      experience_level=self.experience_level)
+                # next_jobs_page has already scrolled this page until its cards stopped loading
+
+                # LinkedIn displays the search results in a scrollable <div> on the left side, we have to scroll to its bottom.
+                # Cards come back in batches while it scrolls, so filtering and scoring start before the scroll is done
+                jobIDs = {} #{Job id: processed_status}
+                jobs = {} #{Job id: card data} - card elements are only resolved for jobs we open
+                seen = set()
+                harvested = 0
+                with self.phases.phase("harvest_cards") as event:
+                    for batch in self.harvest_job_cards():
+                        harvested += len(batch)
+                        for card in self.select_jobs(batch, seen):
+                            jobIDs[card["job_id"]] = "To be processed"
+                            jobs[card["job_id"]] = card
+                    event.update(cards=harvested, selected=len(jobIDs))
+                self.cards_per_page.append(harvested)
+                log.info(f"Harvested {harvested} job cards, {len(jobIDs)} to apply to")
+                count_job += len(jobIDs)
+
+                stale_pages = stale_pages + 1 if not jobIDs else 0
+                if stale_pages >= self.STALE_PAGES:
+                    log.info(f"No new Easy Apply matches on the last {stale_pages} pages, moving on")
+                    break
 
+                if jobIDs:
+                    self.apply_loop(jobIDs, jobs)
+                    count_application += sum(1 for applied in jobIDs.values() if applied is True)
+                self.browser, jobs_per_page = self.next_jobs_page(position,
+                                                                  location,
+                                                                  jobs_per_page,
+                                                                  experience_level=self.experience_level)
 
             except Exception as e:
-                print(e)
+                log.error(f"Error on {position}{location} (start={jobs_per_page}): {e}")
+
+        return {"matched": count_job, "applied": count_application}
+
+    def pipelined_apply(self, scheduler) -> None:
+        """
+        Search the scheduler's combos in a second browser while this one applies.
+        The discovery worker queues jobs that passed select_jobs; this loop applies to them as they arrive
+        and records each combo's yield once its last queued job is done. Stops once the scheduler's budget is used.
+        """
+        worker = DiscoveryWorker(self.make_discovery_browser, self.scan_search_page, scheduler,
+                                 queue_size=self.DISCOVERY_QUEUE_SIZE, stale_pages=self.STALE_PAGES,
+                                 close_browser=self.close_browser)
+        metrics = PipelineMetrics()
+        deadline = time.time() + scheduler.remaining
+        combo_started = time.time()  # the apply stage's time on a combo runs from the end of the previous one
+        matched = applied_count = 0
+        worker.start()
+        try:
+            while True:
+                waited = time.perf_counter()
+                item = worker.queue.get()
+                metrics.wait_seconds += time.perf_counter() - waited
+                if item is DONE:
+                    break
+                if time.time() >= deadline:
+                    log.info("Search budget used up, not applying to the remaining discovered jobs")
+                    break
+                metrics.queue_depths.append(worker.queue.qsize())
+                position, location, card = item
+                if card is COMBO_DONE:
+                    minutes = (time.time() - combo_started) / 60
+                    self.history.record_combo(position, location, minutes, matched, applied_count)
+                    combo_started = time.time()
+                    matched = applied_count = 0
+                    continue
+                matched += 1
+                jobID = card["job_id"]
+                if jobID in self.appliedJobIDs:
+                    continue
+                self.phases.set_context(combo=f"{position}: {location}")
+                started = time.perf_counter()
+                try:
+                    with self.job_phase(jobID) as event:
+                        # Opened by ID: reloading the search page here would redo the discovery browser's work
+                        applied = self.apply_to_job(jobID, None, card)
+                        event["result"] = applied
+                    log.info(f"{'Applied' if applied else 'Failed to apply'} to {jobID}")
+                    applied_count += applied is True
+                except Exception as e:
+                    log.error(f"Error applying to {jobID}: {e}")
+                finally:
+                    metrics.apply_seconds += time.perf_counter() - started
+                # Discovered jobs are opened on their own page, so a recycled browser needs nothing reloaded
+                self.check_browser()
+        finally:
+            worker.stop()
+            # The worker reads the seen-job index, which start_apply flushes next
+            worker.join(timeout=30)
+            while worker.is_alive():
+                log.info("Waiting for the discovery worker to finish its current page")
+                worker.join(timeout=30)
+            self.pipeline_metrics = metrics.report(worker)
+
+    def make_discovery_browser(self):
+        """Second browser for the discovery worker, signed in with this browser's cookies"""
+        browser = self.launch_browser(self.browser_options(profile=False))
+        self.add_cookies(browser, self.browser.get_cookies())
+        return browser
+
+    def scan_search_page(self, browser, position, location, start, seen):
+        """Load one search results page in browser and return (cards harvested, cards selected)"""
+        self.phases.set_context(combo=f"{position}: {location}")
+        with self.phases.phase("next_jobs_page", start=start):
+            browser.get(self.search_url(position, "&location=" + location, start))
+            self.load_page(browser=browser)
+        harvested = 0
+        selected = []
+        with self.phases.phase("harvest_cards") as event:
+            for batch in self.harvest_job_cards(browser):
+                harvested += len(batch)
+                selected.extend(self.select_jobs(batch, seen))
+            event.update(cards=harvested, selected=len(selected))
+        self.cards_per_page.append(harvested)
+        return harvested, selected
+
+    def harvest_job_cards(self, browser=None):
+        """
+        Yield batches of new job cards while the results list is scrolled, in as few round trips as possible.
+        Falls back to a single get_job_cards() snapshot if the list can't be scrolled from a script.
+        """
+        browser = browser or self.browser
+        harvested = False
+        try:
+            for batch in harvest_cards(browser, page_scripts.locator_query(self.locator["search"])[1],
+                                       max_steps=self.scroll_steps, timeout=self.scroll_timeout):
+                harvested = True
+                yield batch
+        except Exception as e:
+            log.debug(f"Streaming card harvest failed: {e}")
+        if not harvested:
+            cards = self.get_job_cards(browser)
+            if cards:
+                yield cards
+
+    def select_jobs(self, cards, seen) -> list:
+        """Cards worth applying to: not applied, attempted or blacklisted, and relevant to the search"""
+        candidates = []
+        for card in cards:
+            jobID = card["job_id"]
+            if card["already_applied"] or jobID in seen: #checking if applied already
+                continue
+            seen.add(jobID)
+            if jobID in self.appliedJobIDs:
+                log.debug(f"Skipping {jobID}, already attempted in the last {self.history.lookback_days} days")
+                continue
+            # Seen in another combo or an earlier run
+            reason = self.seen_jobs.skip_reason(jobID)
+            if reason:
+                log.debug(f"Skipping {jobID}, already {reason}")
+                continue
+
+            job_title = card["title"]
+            company = card["company"]
+
+            # Check if company is blacklisted
+            rule = self.company_blacklist.match(company)
+            if rule:
+                log.info(f"Skipping blacklisted company: '{company}' (rule '{rule}')")
+                self.seen_jobs.add(jobID, BLACKLISTED)
+                continue
+
+            # Check if job title contains blacklisted keywords
+            rule = self.title_blacklist.match(job_title)
+            if rule:
+                log.info(f"Skipping blacklisted job title: '{job_title}' (rule '{rule}')")
+                self.seen_jobs.add(jobID, BLACKLISTED)
+                continue
+
+            candidates.append(card)
+
+        # Enhanced relevance check with scoring, the whole batch at once
+        selected = []
+        scores = self.relevance_scorer.score_many([card["title"] for card in candidates])
+        for card, relevance_score in zip(candidates, scores):
+            jobID, job_title, company = card["job_id"], card["title"], card["company"]
+            if relevance_score > 0:
+                if not jobID or jobID == "search":
+                    log.debug("Job ID not found, search keyword found instead? {}".format(job_title))
+                    continue
+                log.info(f"Job matched (score: {relevance_score}): '{job_title}' at '{company}'")
+                selected.append(card)
+            else:
+                log.debug(f"Skipping low-relevance job: '{job_title}'")
+                self.seen_jobs.add(jobID, SKIPPED)
+        return selected
+
+    def get_job_cards(self, browser=None) -> list:
+        """
+        Extract every job card on the current search page in a single round trip.
+        Returns: list of {job_id, title, company, already_applied, easy_apply} dicts
+        """
+        try:
+            return (browser or self.browser).execute_script(page_scripts.JOB_CARDS) or []
+        except Exception as e:
+            log.debug(f"Job card extraction failed: {e}")
+            return []
+
+    def get_job_card_element(self, jobID):
+        """Resolve the WebElement of a single job card, only done for cards we actually open"""
+        try:
+            return self.browser.find_element(By.CSS_SELECTOR, f'div[data-job-id="{jobID}"]')
+        except Exception as e:
+            log.debug(f"Job card {jobID} no longer on the page: {e}")
+            return None
+
     def calculate_job_relevance(self, job_title):
         """
         Calculate relevance score for a job title based on position keywords.
         Returns: score > 0 if relevant, 0 if not relevant
         """
-        job_title_lower = job_title.lower()
-        score = 0
-
-        # Exclude these irrelevant job types immediately (score = 0)
-        irrelevant_keywords = [
-            'intern', 'internship',  # Unless specifically searching for these
-            'entry level data entry', 'data entry clerk',  # Not analytics
-            'senior manager', 'director', 'vp ', 'vice president',  # Too senior unless specified
-            'recruiter', 'recruitment',  # Not technical roles
-            'sales', 'account executive',  # Not technical
-            'customer service', 'customer support',
-            'administrative', 'secretary', 'clerk'
-        ]
-
-        # Check for explicitly irrelevant keywords first
-        for irrelevant in irrelevant_keywords:
-            if irrelevant in job_title_lower:
-                # But allow if user is explicitly searching for them
-                if not any(pos.lower() in irrelevant for pos in self.positions):
-                    log.debug(f"Excluding due to irrelevant keyword '{irrelevant}': {job_title}")
-                    return 0
-
-        # Positive scoring: Match position keywords
-        for position in self.positions:
-            position_lower = position.lower()
-
-            # Exact match = high score
-            if position_lower == job_title_lower:
-                score += 100
-                continue
+        if getattr(self, "relevance_scorer", None) is None:
+            self.relevance_scorer = RelevanceScorer(self.positions)
+        return self.relevance_scorer.score(job_title)
 
-            # Position keyword is in the title
-            if position_lower in job_title_lower:
-                score += 50
-
-                # Bonus: Check for related terms that indicate good match
-                related_terms = {
-                    'data': ['analyst', 'scientist', 'engineer', 'analytics'],
-                    'analytics': ['analyst', 'engineer', 'specialist'],
-                    'analyst': ['data', 'business', 'analytics'],
-                    'engineer': ['data', 'analytics', 'software', 'machine learning'],
-                    'scientist': ['data', 'machine learning', 'research']
-                }
-
-                if position_lower in related_terms:
-                    for related_term in related_terms[position_lower]:
-                        if related_term in job_title_lower:
-                            score += 20  # Bonus for related terms
-
-        # Fuzzy matching for partial keyword matches
-        if score == 0:
-            for position in self.positions:
-                similarity = SequenceMatcher(None, position.lower(), job_title_lower).ratio()
-                if similarity > 0.6:  # 60% similarity
-                    score += int(similarity * 30)
-
-        return score
-
-    def apply_loop(self, jobIDs, job_cards):
+    def apply_loop(self, jobIDs, jobs):
         for jobID in jobIDs:
             if jobIDs[jobID] == "To be processed":
-                job_card = job_cards.get(jobID)  # Get the job card element
-                applied = self.apply_to_job(jobID, job_card)
+                with self.job_phase(jobID) as event:
+                    job_card = self.get_job_card_element(jobID)  # Resolve the card element only now
+                    applied = self.apply_to_job(jobID, job_card, jobs.get(jobID))
+                    event["result"] = applied
                 if applied:
                     log.info(f"Applied to {jobID}")
                 else:
                     log.info(f"Failed to apply to {jobID}")
                 jobIDs[jobID] = applied  # Fixed: was == (comparison), now = (assignment)
+                if self.check_browser():
+                    # The remaining cards of this page are resolved on the reloaded page
+                    self.resume_search()
+
+    @contextlib.contextmanager
+    def job_phase(self, jobID):
+        """apply_job phase for jobID, with its WebDriver command tally when auditing"""
+        with self.phases.phase("apply_job", job_id=jobID) as event:
+            try:
+                yield event
+            finally:
+                if self.audit is not None:
+                    event.update(self.audit.finish_job(jobID))
 
-    def apply_to_job(self, jobID, job_card=None):
+    def apply_to_job(self, jobID, job_card=None, job=None):
         """
         Apply to a job directly from the search results
         Args:
             jobID: The LinkedIn job ID
             job_card: The WebElement representing the job card in search results
+            job: The card data extracted by get_job_cards (title, company, ...)
         """
-        # Find Easy Apply button in the job card (faster - no page navigation!)
-        button = self.get_easy_apply_button_from_card(job_card, jobID)
-
-        # Get job title for logging
-        try:
-            job_title = job_card.text.splitlines()[0] if job_card and job_card.text else "Unknown"
-        except:
-            job_title = "Unknown"
+        if job_card is not None:
+            # Find Easy Apply button in the job card (faster - no page navigation!)
+            button = self.get_easy_apply_button_from_card(job_card, jobID)
+        else:
+            # Discovered in another browser, or the card is gone from the results list
+            button = self.get_easy_apply_button_from_job_page(jobID)
+
+        # Get job title for logging, from the extracted card data when we have it
+        company = ""
+        if job:
+            job_title = job.get("title") or "Unknown"
+            company = job.get("company") or ""
+        else:
+            try:
+                job_title = job_card.text.splitlines()[0] if job_card and job_card.text else "Unknown"
+            except:
+                job_title = "Unknown"
 
-        # word filter to skip positions not wanted
+        # Blacklisted titles were already filtered out with the card data in applications_loop
         if button is not False:
-            if any(word.lower() in job_title.lower() for word in self.blackListTitles):
-                log.info('Skipping this application, a blacklisted keyword was found in the job position')
-                string_easy = "* Contains blacklisted keyword"
-                result = False
-            else:
-                string_easy = "* has Easy Apply Button"
-                log.info(f"Clicking Easy Apply button for: {job_title}")
-                try:
+            string_easy = "* has Easy Apply Button"
+            log.info(f"Clicking Easy Apply button for: {job_title}")
+            try:
+                with self.phases.phase("modal_open"):
                     button.click()
-                    time.sleep(1)  # Wait for modal to open
-                    self.fill_out_fields()
-                    result: bool = self.send_resume()
-                    if result:
-                        string_easy = "*Applied: Sent Resume"
-                    else:
-                        string_easy = "*Did not apply: Failed to send Resume"
-                except Exception as e:
-                    log.error(f"Error clicking Easy Apply button: {e}")
-                    string_easy = "*Error clicking button"
-                    result = False
+                    # Wait for the first step button instead of a fixed second
+                    self.waiter.until("modal_open", EC.presence_of_element_located(self.locator["modal_ready"]), timeout=5)
+                self.fill_out_fields()
+                result: bool = self.send_resume()
+                if result:
+                    string_easy = "*Applied: Sent Resume"
+                else:
+                    string_easy = "*Did not apply: Failed to send Resume"
+            except Exception as e:
+                log.error(f"Error clicking Easy Apply button: {e}")
+                string_easy = "*Error clicking button"
+                result = False
         else:
             log.info(f"No Easy Apply button for: {job_title}")
             string_easy = "* Doesn't have Easy Apply Button"
@@ -504,7 +937,7 @@ class EasyApplyBot:
 
         log.info(f"\nPosition {jobID}: {job_title}\n {string_easy}\n")
 
-        self.write_to_file(button, jobID, job_title, result)
+        self.write_to_file(button, jobID, job_title + ("\n" + company if company else ""), result)
         return result
 
     def write_to_file(self, button, jobID, job_title, result) -> None:
@@ -518,10 +951,24 @@ class EasyApplyBot:
         company = lines[1] if len(lines) > 1 else "Unknown"
 
         toWrite: list = [timestamp, jobID, job, company, attempted, result]
+        self.appliedJobIDs.add(str(jobID))
+        self.seen_jobs.add(jobID, APPLIED if result else FAILED)
+        self.writer.submit("result", toWrite)
+
+    def write_results(self, rows) -> None:
+        """Background writer handler: append a batch of results to the output CSV and the history store"""
         with open(self.filename, 'a+') as f:
             writer = csv.writer(f)
-            writer.writerow(toWrite)
+            writer.writerows(rows)
+        self.history.record_many(rows)
+
+    def write_events(self, events) -> None:
+        """Background writer handler: append phase timing events as JSON lines"""
+        with open(self.events_file, 'a', encoding='utf-8') as f:
+            for event in events:
+                f.write(json.dumps(event) + "\n")
 
+    @timed("find_button")
     def get_easy_apply_button_from_card(self, job_card, jobID):
         """
         Find Easy Apply button after clicking on a job card in search results.
@@ -535,99 +982,21 @@ class EasyApplyBot:
             # Step 1: Click the job card to load the job details panel
             try:
                 self.browser.execute_script("arguments[0].scrollIntoView({block: 'center'});", job_card)
-                time.sleep(0.3)
+                self.waiter.arm()
                 job_card.click()
                 log.debug(f"Clicked job card for job {jobID}")
-                time.sleep(1.5)  # Wait longer for the job details panel to fully load
+                # Wait for the job details panel to re-render rather than a fixed 1.5s
+                self.waiter.settle("job_details", selector=self.locator["job_details"][1], quiet_ms=150, timeout=3)
             except Exception as e:
                 log.error(f"Failed to click job card: {e}")
                 return False
 
             # Step 2: Look for Easy Apply button in the job details panel (right side of page)
             # The button appears OUTSIDE the job card, in the job details section
-            
-            # Strategy 1: Find by ID (most specific)
-            # Try both possible IDs that LinkedIn uses
-            for button_id in ['jobs-apply-button', 'jobs-apply-button-id']:
-                try:
-                    button = self.browser.find_element(By.ID, button_id)
-                    if button.is_displayed() and button.is_enabled():
-                        log.info(f"✓ Found Easy Apply button by ID '{button_id}' for job {jobID}")
-                        return button
-                except:
-                    log.debug(f"ID '{button_id}' not found")
-                    continue
-
-            # Strategy 2: Find by class name (from your HTML)
-            try:
-                buttons = self.browser.find_elements(By.CSS_SELECTOR, 'button.jobs-apply-button')
-                log.debug(f"Found {len(buttons)} buttons with class 'jobs-apply-button'")
-                for button in buttons:
-                    try:
-                        if button.is_displayed() and button.is_enabled():
-                            # Verify this button is for the correct job
-                            button_job_id = button.get_attribute('data-job-id')
-                            aria_label = button.get_attribute('aria-label') or ''
-                            log.debug(f"Button data-job-id: {button_job_id}, aria-label: {aria_label[:50]}...")
-                            
-                            # Match by job ID if available, otherwise just take the visible button
-                            if button_job_id == str(jobID) or not button_job_id:
-                                log.info(f"✓ Found Easy Apply button for job {jobID}")
-                                return button
-                    except Exception as e:
-                        log.debug(f"Button check failed: {e}")
-                        continue
-            except Exception as e:
-                log.debug(f"Strategy 2 (class) failed: {e}")
-
-            # Strategy 3: Find by aria-label containing "Easy Apply"
-            try:
-                buttons = self.browser.find_elements(By.XPATH, '//button[contains(@aria-label, "Easy Apply")]')
-                log.debug(f"Found {len(buttons)} buttons with 'Easy Apply' in aria-label")
-                for button in buttons:
-                    try:
-                        if button.is_displayed() and button.is_enabled():
-                            button_job_id = button.get_attribute('data-job-id')
-                            if button_job_id == str(jobID) or not button_job_id:
-                                log.info(f"✓ Found Easy Apply button by aria-label for job {jobID}")
-                                return button
-                    except:
-                        continue
-            except Exception as e:
-                log.debug(f"Strategy 3 (aria-label) failed: {e}")
-
-            # Strategy 4: Find button with text "Easy Apply"
-            try:
-                buttons = self.browser.find_elements(By.XPATH, '//button[contains(., "Easy Apply")]')
-                log.debug(f"Found {len(buttons)} buttons with 'Easy Apply' text")
-                for button in buttons:
-                    try:
-                        if button.is_displayed() and button.is_enabled():
-                            button_text = button.text.strip()
-                            if 'easy apply' in button_text.lower():
-                                log.info(f"✓ Found Easy Apply button by text for job {jobID}")
-                                return button
-                    except:
-                        continue
-            except Exception as e:
-                log.debug(f"Strategy 4 (text) failed: {e}")
-
-            # Strategy 5: Look for any artdeco-button with primary styling that might be Easy Apply
-            try:
-                buttons = self.browser.find_elements(By.CSS_SELECTOR, 'button.artdeco-button--primary')
-                log.debug(f"Found {len(buttons)} primary buttons")
-                for button in buttons:
-                    try:
-                        button_text = button.text.strip().lower()
-                        aria_label = (button.get_attribute('aria-label') or '').lower()
-                        if 'easy apply' in button_text or 'easy apply' in aria_label:
-                            if button.is_displayed() and button.is_enabled():
-                                log.info(f"✓ Found Easy Apply button (primary button) for job {jobID}")
-                                return button
-                    except:
-                        continue
-            except Exception as e:
-                log.debug(f"Strategy 5 (primary button) failed: {e}")
+            button = self.selectors.find("easy_apply_button", jobID, expected=False)
+            if button:
+                log.info(f"✓ Found Easy Apply button for job {jobID}")
+                return button
 
             log.info(f"No Easy Apply button found for job {jobID} - job may not have Easy Apply option")
             return False
@@ -636,9 +1005,24 @@ class EasyApplyBot:
             log.error(f"Error finding Easy Apply button for job {jobID}: {e}")
             return False
 
+    @timed("find_button")
+    def get_easy_apply_button_from_job_page(self, jobID):
+        """Open the job's own page and find its Easy Apply button"""
+        try:
+            self.browser.get(self.BASE_URL + '/jobs/view/' + str(jobID))
+            self.waiter.until("job_page", EC.presence_of_element_located(self.locator["job_details"]), timeout=5)
+            button = self.selectors.find("easy_apply_button", jobID, expected=False)
+            if button:
+                log.info(f"✓ Found Easy Apply button on job page for job {jobID}")
+                return button
+            log.info(f"No Easy Apply button found on job page for job {jobID}")
+        except Exception as e:
+            log.error(f"Error opening job page for {jobID}: {e}")
+        return False
+
     def get_job_page(self, jobID):
         """Navigate to a specific job page"""
-        job: str = 'https://www.linkedin.com/jobs/view/' + str(jobID)
+        job: str = self.BASE_URL + '/jobs/view/' + str(jobID)
         log.info(f"Navigating to job: {job}")
         self.browser.get(job)
 
@@ -736,77 +1120,35 @@ class EasyApplyBot:
 
         return EasyApplyButton
 
+    @timed("close_modal")
     def close_easy_apply_modal(self):
         """Close the Easy Apply modal if it's open"""
         try:
             # First, check for and handle "Discard" confirmation dialog
-            try:
-                discard_button_selectors = [
-                    (By.XPATH, '//button[@data-test-dialog-primary-btn]'),  # "Discard" button
-                    (By.XPATH, '//button[contains(text(), "Discard")]'),
-                    (By.XPATH, '//button[contains(@aria-label, "Discard")]'),
-                ]
-
-                for selector in discard_button_selectors:
-                    try:
-                        discard_btn = self.browser.find_element(selector[0], selector[1])
-                        if discard_btn.is_displayed():
-                            discard_btn.click()
-                            log.debug("Clicked Discard button on confirmation dialog")
-                            time.sleep(0.5)
-                            break
-                    except:
-                        continue
-            except:
-                pass
+            self.click_discard("Clicked Discard button on confirmation dialog")
 
             # Then try to close the main Easy Apply modal
-            close_button_selectors = [
-                (By.CSS_SELECTOR, 'button[aria-label="Dismiss"]'),
-                (By.CSS_SELECTOR, 'button[data-test-modal-close-btn]'),
-                (By.XPATH, '//button[contains(@aria-label, "Dismiss")]'),
-                (By.XPATH, '//button[contains(@class, "artdeco-modal__dismiss")]'),
-                (By.CSS_SELECTOR, 'button.artdeco-modal__dismiss'),
-            ]
-
-            for selector in close_button_selectors:
+            close_button = self.selectors.find("modal_close", expected=False)
+            if close_button:
                 try:
-                    close_button = self.browser.find_element(selector[0], selector[1])
-                    if close_button.is_displayed():
-                        close_button.click()
-                        log.debug("Closed Easy Apply modal")
-                        time.sleep(0.5)
+                    close_button.click()
+                    log.debug("Closed Easy Apply modal")
+                    self.wait_for_modal_dismissed("modal_close")
 
-                        # After clicking X, check again for discard dialog
-                        try:
-                            discard_btn = self.browser.find_element(By.XPATH, '//button[@data-test-dialog-primary-btn]')
-                            if discard_btn.is_displayed():
-                                discard_btn.click()
-                                log.debug("Clicked Discard after closing modal")
-                                time.sleep(0.5)
-                        except:
-                            pass
-
-                        return True
-                except:
-                    continue
+                    # After clicking X, check again for discard dialog
+                    self.click_discard("Clicked Discard after closing modal", fallbacks=False)
+                    return True
+                except Exception as e:
+                    log.debug(f"Could not click modal close button: {e}")
 
             # If no close button found, try pressing ESC key
             try:
                 ActionChains(self.browser).send_keys(Keys.ESCAPE).perform()
                 log.debug("Closed modal with ESC key")
-                time.sleep(0.5)
+                self.wait_for_modal_dismissed("modal_escape")
 
                 # Check for discard dialog after ESC
-                try:
-                    discard_btn = self.browser.find_element(By.XPATH, '//button[@data-test-dialog-primary-btn]')
-                    if discard_btn.is_displayed():
-                        discard_btn.click()
-                        log.debug("Clicked Discard after ESC")
-                        time.sleep(0.5)
-                except:
-                    pass
-
+                self.click_discard("Clicked Discard after ESC", fallbacks=False)
                 return True
             except:
                 pass
@@ -818,16 +1160,35 @@ class EasyApplyBot:
             log.debug(f"Error closing modal: {e}")
             return False
 
-    def fill_out_fields(self):
-        fields = self.browser.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-section__grouping")
-        for field in fields:
-
-            if "Mobile phone number" in field.text:
-                field_input = field.find_element(By.TAG_NAME, "input")
-                field_input.clear()
-                field_input.send_keys(self.phone_number)
+    def wait_for_modal_dismissed(self, name) -> None:
+        """Wait until the modal is gone or LinkedIn asks whether to discard the application"""
+        discard, modal = self.locator["discard"], self.locator["modal"]
+        self.waiter.until(name, lambda d: d.find_elements(*discard) or not d.find_elements(*modal), timeout=2)
 
+    def click_discard(self, message, fallbacks=True) -> bool:
+        """Click the "Discard" confirmation if it is showing; without fallbacks only the primary dialog button is checked"""
+        try:
+            if fallbacks:
+                discard_btn = self.selectors.find("discard", expected=False)
+            else:
+                discard_btn = next((button for button in self.browser.find_elements(*self.locator["discard"])
+                                    if button.is_displayed()), None)
+            if not discard_btn:
+                return False
+            discard_btn.click()
+            log.debug(message)
+            self.waiter.until("discard", EC.invisibility_of_element_located(self.locator["discard"]), timeout=2)
+            return True
+        except Exception as e:
+            log.debug(f"Could not click Discard: {e}")
+            return False
 
+    @timed("fill_out_fields")
+    def fill_out_fields(self):
+        actions = [{"index": field["index"], "action": "first_input", "value": str(self.phone_number)}
+                   for field in self.get_form_snapshot()
+                   if "Mobile phone number" in field["text"] and field["has_input"]]
+        self.apply_form_answers(actions)
         return
 
 
@@ -842,31 +1203,57 @@ class EasyApplyBot:
         return len(self.browser.find_elements(locator[0],
                                               locator[1])) > 0
 
-    def send_resume(self) -> bool:
-        def is_present(button_locator) -> bool:
-            return len(self.browser.find_elements(button_locator[0],
-                                                  button_locator[1])) > 0
+    # Locators whose state get_modal_state reports on every send_resume pass
+    MODAL_PROBE = ["next", "review", "submit", "error", "follow", "easy_apply_button",
+                   "upload_resume_section", "upload_cv_section"]
 
+    def get_modal_state(self) -> dict:
+        """
+        Snapshot the Easy Apply modal in a single execute_script call.
+        Returns: {"elements": {name: {count, displayed, enabled, texts}}, "upload_slots": [...],
+                  "follow_checked": bool | None, "submitted": bool}
+        """
+        locators = {name: page_scripts.locator_query(self.locator[name]) for name in self.MODAL_PROBE}
+        try:
+            return self.browser.execute_script(page_scripts.MODAL_STATE, locators)
+        except Exception as e:
+            log.debug(f"Modal state probe failed: {e}")
+            empty = {"count": 0, "displayed": False, "enabled": False, "texts": []}
+            return {"elements": {name: empty for name in self.MODAL_PROBE},
+                    "upload_slots": [], "follow_checked": None, "submitted": False}
+
+    def click_modal_button(self, name) -> None:
+        """Resolve a modal button only when we are about to click it"""
+        with self.phases.phase(f"click_{name}"):
+            element = self.browser.find_element(*self.locator[name])
+            button = self.wait.until(EC.element_to_be_clickable(element))
+            self.waiter.arm()
+            button.click()
+
+    def upload_slot(self, state, *id_parts):
+        """File input from the modal snapshot whose id contains one of id_parts, resolved by ID"""
+        for slot in state["upload_slots"]:
+            if slot["id"] and any(part in slot["id"] for part in id_parts):
+                return self.browser.find_element(By.ID, slot["id"])
+        return None
+
+    @timed("send_resume")
+    def send_resume(self) -> bool:
+        submitted = False
         try:
             #time.sleep(random.uniform(1.5, 2.5))
-            next_locator = (By.CSS_SELECTOR,
-                            "button[aria-label='Continue to next step']")
-            review_locator = (By.CSS_SELECTOR,
-                              "button[aria-label='Review your application']")
-            submit_locator = (By.CSS_SELECTOR,
-                              "button[aria-label='Submit application']")
-            error_locator = (By.CLASS_NAME,"artdeco-inline-feedback__message")
-            upload_resume_locator = (By.XPATH, '//span[text()="Upload resume"]')
-            upload_cv_locator = (By.XPATH, '//span[text()="Upload cover letter"]')
-            # WebElement upload_locator = self.browser.find_element(By.NAME, "file")
-            follow_locator = (By.CSS_SELECTOR, "label[for='follow-company-checkbox']")
-
-            submitted = False
+            idle_passes = 0
             loop = 0
             while loop < 2:
-                time.sleep(0.3)  # Brief wait for form elements
+                with self.phases.phase("modal_step"):
+                    # Wait for the step the last click triggered to finish rendering
+                    self.waiter.settle("modal_step", selector=self.locator["modal_ready"][1], quiet_ms=100, timeout=2)
+                    # One round trip tells us everything about the current step
+                    state = self.get_modal_state()
+                elements = state["elements"]
+
                 # Upload resume
-                if is_present(upload_resume_locator):
+                if elements["upload_resume_section"]["count"] > 0:
                     log.info("Resume upload section detected")
                     resume_path = self.uploads.get("Resume")
 
@@ -877,33 +1264,30 @@ class EasyApplyBot:
                     else:
                         log.info(f"Attempting to upload resume from: {resume_path}")
 
-                        # Try multiple strategies to find upload element
+                        # Use the upload slot the snapshot found, then fall back to the selector chain
                         resume_uploaded = False
-                        upload_strategies = [
-                            (By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-resume')]"),
-                            (By.XPATH, "//input[@type='file' and contains(@id, 'resume')]"),
-                            (By.XPATH, "//input[@type='file'][contains(@name, 'resume')]"),
-                            (By.CSS_SELECTOR, "input[type='file'][id*='resume']"),
-                        ]
-
-                        for strategy in upload_strategies:
+                        try:
+                            resume_locator = self.upload_slot(state, "upload-resume", "resume")
+                        except Exception as e:
+                            log.debug(f"Upload slot from modal snapshot not usable: {e}")
+                            resume_locator = None
+                        if resume_locator is None:
+                            resume_locator = self.selectors.find("upload_resume")
+
+                        if resume_locator is not None:
                             try:
-                                resume_locator = self.browser.find_element(strategy[0], strategy[1])
-                                log.debug(f"Found resume upload element using: {strategy}")
                                 resume_locator.send_keys(resume_path)
                                 log.info("✓ Resume uploaded successfully")
                                 resume_uploaded = True
-                                break
                             except Exception as e:
-                                log.debug(f"Strategy {strategy} failed: {e}")
-                                continue
+                                log.debug(f"Resume upload failed: {e}")
 
                         if not resume_uploaded:
                             log.error(f"Failed to upload resume - could not find upload element")
                             log.error("LinkedIn may use a cached document from your profile instead")
 
                 # Upload cover letter if possible
-                if is_present(upload_cv_locator):
+                if elements["upload_cv_section"]["count"] > 0:
                     log.info("Cover letter upload section detected")
                     cv_path = self.uploads.get("Cover Letter")
 
@@ -914,84 +1298,74 @@ class EasyApplyBot:
                     else:
                         log.info(f"Attempting to upload cover letter from: {cv_path}")
                         try:
-                            cv_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]")
+                            cv_locator = self.upload_slot(state, "upload-cover-letter")
+                            if cv_locator is None:
+                                cv_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]")
                             cv_locator.send_keys(cv_path)
                             log.info("✓ Cover letter uploaded successfully")
                         except Exception as e:
                             log.error(f"Failed to upload cover letter: {e}")
 
                     #time.sleep(random.uniform(4.5, 6.5))
-                elif len(self.get_elements("follow")) > 0:
-                    elements = self.get_elements("follow")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-
-                if len(self.get_elements("submit")) > 0:
-                    elements = self.get_elements("submit")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
+                elif elements["follow"]["count"] > 0 and state["follow_checked"]:
+                    self.click_modal_button("follow")
+
+                if elements["submit"]["count"] > 0:
+                    self.click_modal_button("submit")
+                    log.info("Application Submitted")
+                    submitted = True
+                    break
+
+                elif elements["error"]["count"] > 0:
+                    if state["submitted"]:
                         log.info("Application Submitted")
                         submitted = True
                         break
 
-                elif len(self.get_elements("error")) > 0:
-                    elements = self.get_elements("error")
-                    if "application was sent" in self.browser.page_source:
-                        log.info("Application Submitted")
-                        submitted = True
+                    discarded = False
+                    retry_count = 0
+                    while elements["error"]["count"] > 0 and retry_count < 3:
+                        log.info("Please answer the questions, waiting for the form to settle...")
+                        self.waiter.settle("error_retry", quiet_ms=200, timeout=2)
+                        retry_count += 1
+
+                        should_continue = self.process_questions()
+                        # If user chose to discard, stop trying to apply
+                        if should_continue == False:
+                            log.info("Discarding application as requested by user")
+                            discarded = True
+                            break
+
+                        state = self.get_modal_state()
+                        elements = state["elements"]
+                        if state["submitted"]:
+                            log.info("Application Submitted")
+                            submitted = True
+                            break
+                        elif elements["easy_apply_button"]["count"] > 0:
+                            log.info("Skipping application")
+                            break
+                    if submitted or discarded:
                         break
-                    elif len(elements) > 0:
-                        retry_count = 0
-                        while len(elements) > 0 and retry_count < 3:
-                            log.info("Please answer the questions, waiting 2 seconds...")
-                            time.sleep(2)  # Reduced from 5s to 2s
-                            elements = self.get_elements("error")
-                            retry_count += 1
-
-                            for element in elements:
-                                should_continue = self.process_questions()
-                                # If user chose to discard, break out of retry loop
-                                if should_continue == False:
-                                    log.info("Discarding application as requested by user")
-                                    submitted = False
-                                    break
-
-                            if "application was sent" in self.browser.page_source:
-                                log.info("Application Submitted")
-                                submitted = True
-                                break
-                            elif is_present(self.locator["easy_apply_button"]):
-                                log.info("Skipping application")
-                                submitted = False
-                                break
-                        continue
-                        #add explicit wait
-                    
-                    else:
+                    continue
+
+                elif elements["next"]["count"] > 0:
+                    self.click_modal_button("next")
+
+                elif elements["review"]["count"] > 0:
+                    self.click_modal_button("review")
+
+                elif elements["follow"]["count"] > 0 and state["follow_checked"]:
+                    self.click_modal_button("follow")
+
+                else:
+                    # Nothing to click: the modal never opened or is already gone
+                    idle_passes += 1
+                    if idle_passes >= 3:
                         log.info("Application not submitted")
-                        time.sleep(2)
                         break
-                    # self.process_questions()
-
-                elif len(self.get_elements("next")) > 0:
-                    elements = self.get_elements("next")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-
-                elif len(self.get_elements("review")) > 0:
-                    elements = self.get_elements("review")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-
-                elif len(self.get_elements("follow")) > 0:
-                    elements = self.get_elements("follow")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
+                    continue
+                idle_passes = 0
 
         except Exception as e:
             log.error(e)
@@ -1013,16 +1387,18 @@ class EasyApplyBot:
 
         self.unanswered_questions.add(question)
 
-        try:
-            with open(self.unanswered_questions_file, 'a', encoding='utf-8') as f:
+        self.writer.submit("unanswered", question)
+        log.info(f"Saved unanswered question to {self.unanswered_questions_file}")
+
+    def write_unanswered_questions(self, questions) -> None:
+        """Background writer handler: append a batch of unanswered questions"""
+        with open(self.unanswered_questions_file, 'a', encoding='utf-8') as f:
+            for question in questions:
                 # Extract potential keywords from the question
                 keywords = ' '.join(question.lower().split()[:5])  # First 5 words
                 f.write(f"- keywords: [\"TODO\"]  # Suggested: {keywords}...\n")
                 f.write(f"  answer: \"TODO\"\n")
                 f.write(f"  # Question: {question}\n\n")
-            log.info(f"Saved unanswered question to {self.unanswered_questions_file}")
-        except Exception as e:
-            log.error(f"Error saving unanswered question: {e}")
 
     def ask_user_for_answer(self, question):
         """
@@ -1063,64 +1439,76 @@ class EasyApplyBot:
                     keywords = [question.lower().split()[:3]]  # First 3 words
                     keywords = [' '.join(keywords[0])]
 
-                # Append to questions.yaml
-                try:
-                    with open("questions.yaml", 'a', encoding='utf-8') as f:
-                        f.write(f"\n# Auto-added from interactive mode\n")
-                        f.write(f"- keywords: {keywords}\n")
-                        f.write(f"  answer: \"{user_input}\"\n")
-                    log.info(f"Saved answer to questions.yaml with keywords: {keywords}")
-                    print(f"✓ Answer saved to questions.yaml!")
-                except Exception as e:
-                    log.error(f"Error saving to questions.yaml: {e}")
-                    print(f"✗ Failed to save: {e}")
+                # Append to questions.yaml (in the background)
+                self.writer.submit("saved_answer", {"keywords": keywords, "answer": user_input})
+                log.info(f"Saved answer to questions.yaml with keywords: {keywords}")
+                print(f"✓ Answer saved to questions.yaml!")
 
             return user_input
         else:
             log.info(f"User provided empty answer, skipping question: '{question}'")
             return None
 
-    def is_field_required(self, section):
-        """
-        Detect if a form field is required or optional.
-        Returns: True if required, False if optional
-        """
-        try:
-            # Strategy 1: Check for asterisk (*) or "required" text in the section
-            section_html = section.get_attribute('innerHTML')
-            if '*' in section.text or 'required' in section.text.lower():
-                return True
-
-            # Strategy 2: Check for aria-required attribute
-            inputs = section.find_elements(By.CSS_SELECTOR, 'input, textarea, select')
-            for input_elem in inputs:
-                aria_required = input_elem.get_attribute('aria-required')
-                if aria_required == 'true':
-                    return True
+    def write_saved_answers(self, entries) -> None:
+        """Background writer handler: append interactive answers to questions.yaml"""
+        with open("questions.yaml", 'a', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(f"\n# Auto-added from interactive mode\n")
+                f.write(f"- keywords: {entry['keywords']}\n")
+                f.write(f"  answer: \"{entry['answer']}\"\n")
 
-                # Check for 'required' attribute
-                if input_elem.get_attribute('required'):
-                    return True
-
-            # Strategy 3: Check for label with required indicator
-            labels = section.find_elements(By.TAG_NAME, 'label')
-            for label in labels:
-                if '*' in label.text or 'required' in label.text.lower():
-                    return True
+    def get_form_snapshot(self) -> list:
+        """Structured model of every form section in the modal, from one execute_script call"""
+        try:
+            return self.browser.execute_script(page_scripts.FORM_SNAPSHOT) or []
+        except Exception as e:
+            log.debug(f"Could not snapshot form: {e}")
+            return []
 
-            # If none of the above, assume it's optional
-            return False
+    def get_form_field(self, index):
+        """Form section tagged by the last get_form_snapshot call"""
+        return self.browser.find_element(By.CSS_SELECTOR, page_scripts.FORM_FIELD_SELECTOR.format(index))
 
+    def apply_form_answers(self, actions) -> None:
+        """
+        Apply a batch of text, radio and select answers in one execute_script call.
+        Any field the script could not set is retried the old way, with send_keys or a click.
+        """
+        if not actions:
+            return
+        try:
+            failed = set(self.browser.execute_script(page_scripts.APPLY_FORM_ANSWERS, actions) or [])
         except Exception as e:
-            log.debug(f"Error checking if field is required: {e}")
-            # If we can't determine, assume it's required to be safe
-            return True
+            log.debug(f"Batched form fill failed, falling back to WebDriver: {e}")
+            failed = {action["index"] for action in actions}
+
+        for action in actions:
+            if action["index"] not in failed:
+                continue
+            try:
+                section = self.get_form_field(action["index"])
+                if action["action"] == "radio":
+                    section.find_elements(By.CSS_SELECTOR, "input[type='radio']")[action["option"]].click()
+                elif action["action"] == "select":
+                    section.find_elements(By.CSS_SELECTOR, "select option")[action["option"]].click()
+                else:
+                    selector = {"text": "input[type='text']", "textarea": "textarea"}.get(action["action"], "input")
+                    field_input = section.find_element(By.CSS_SELECTOR, selector)
+                    field_input.clear()
+                    field_input.send_keys(action["value"])
+            except Exception as e:
+                log.error(f"Error filling form field {action['index']}: {e}")
 
+    @timed("process_questions")
     def process_questions(self):
-        time.sleep(0.3)  # Brief wait for form sections to load
-        form_sections = self.get_elements("fields")
-        for section in form_sections:
-            question = section.text
+        self.waiter.settle("form_sections", selector=".jobs-easy-apply-form-section__grouping", quiet_ms=50, timeout=1)
+        fields = self.get_form_snapshot()
+
+        # Work out every answer first, then fill the form in one pass
+        actions = []
+        dropdowns = []
+        for field in fields:
+            question = field["text"]
             answer = self.ans_question(question)
 
             # Check if user chose to discard application
@@ -1129,89 +1517,100 @@ class EasyApplyBot:
                 return False  # Signal that application should be discarded
 
             if not answer:
-                # Check if field is required
-                is_required = self.is_field_required(section)
-                if is_required:
+                if field["required"]:
                     log.warning(f"No answer found for REQUIRED question: '{question}'. Skipping - question logged for review.")
                 else:
                     log.info(f"No answer found for optional question: '{question}'. Skipping as it's not required.")
                 continue  # Don't block, just skip this question
 
             log.info(f"Answering question '{question}' with '{answer}'")
+            answer = str(answer)
+            input_type = field["input_type"]
+
+            if input_type == "dropdown":
+                dropdowns.append((field, answer))
+            elif input_type in ("radio", "select"):
+                # First option whose label contains the answer
+                for option, label in enumerate(field["options"]):
+                    if answer.lower() in label.lower():
+                        actions.append({"index": field["index"], "action": input_type, "option": option})
+                        break
+            elif input_type in ("text", "textarea"):
+                if field["value"] != answer:
+                    actions.append({"index": field["index"], "action": input_type, "value": answer})
 
-            try:
-                # Type 1: Dropdowns
-                dropdown_trigger = section.find_elements(By.CSS_SELECTOR, "button[aria-haspopup='listbox']")
-                if dropdown_trigger:
-                    dropdown_trigger[0].click()
-                    time.sleep(0.3)  # Brief wait for dropdown to open
-                    
-                    option_xpath = f"//li[contains(@class, 'artdeco-dropdown__item')][contains(normalize-space(), '{answer}')]"
-                    option = self.wait.until(EC.element_to_be_clickable((By.XPATH, option_xpath)))
-                    option.click()
-                    continue
-
-                # Type 2: Radio Buttons
-                radio_buttons = section.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                if radio_buttons:
-                    for radio in radio_buttons:
-                        label = radio.find_element(By.XPATH, "./following-sibling::label")
-                        if answer.lower() in label.text.lower():
-                            radio.click()
-                            break
-                    continue
-
-                # Type 3: Text Inputs
-                text_inputs = section.find_elements(By.CSS_SELECTOR, "input[type='text']")
-                if text_inputs:
-                    text_inputs[0].clear()
-                    text_inputs[0].send_keys(answer)
-                    continue
-                
-                # Type 4: Text Areas
-                text_areas = section.find_elements(By.TAG_NAME, 'textarea')
-                if text_areas:
-                    text_areas[0].clear()
-                    text_areas[0].send_keys(answer)
-                    continue
+        self.apply_form_answers(actions)
 
+        # Dropdowns open a listbox outside the section, so they still need real clicks
+        for field, answer in dropdowns:
+            try:
+                self.get_form_field(field["index"]).find_element(By.CSS_SELECTOR, "button[aria-haspopup='listbox']").click()
+                # The clickable wait below doubles as the wait for the dropdown to open
+                option_xpath = f"//li[contains(@class, 'artdeco-dropdown__item')][contains(normalize-space(), '{answer}')]"
+                option = self.wait.until(EC.element_to_be_clickable((By.XPATH, option_xpath)))
+                option.click()
             except Exception as e:
-                log.error(f"Error answering question '{question}': {e}")
+                log.error(f"Error answering question '{field['text']}': {e}")
 
 
     def ans_question(self, question):
+        # Strategy 0: Answer already resolved for this question in this or an earlier run
+        answer = self.answer_store.get(question)
+        self.answer_matcher.record("stored", answer is not None)
+        if answer is not None:
+            log.info(f"[Stored answer] Answering question '{question}' with: '{answer}'")
+            return answer
+
         question_lower = question.lower()
 
         # Strategy 1: Exact keyword match from questions.yaml
-        if self.user_answers:
-            for qa_pair in self.user_answers:
-                if 'keywords' not in qa_pair or 'answer' not in qa_pair:
-                    continue
-
-                # Use any() to match if any keyword is in the question
-                if any(keyword.lower() in question_lower for keyword in qa_pair['keywords']):
-                    answer = qa_pair['answer']
-                    log.info(f"[Exact match] Found keywords '{qa_pair['keywords']}' for question '{question}'. Answering with: '{answer}'")
-                    self.answers[question] = answer
-                    return answer
+        qa_pair = self.answer_matcher.exact(question_lower)
+        if qa_pair is not None:
+            answer = qa_pair['answer']
+            log.info(f"[Exact match] Found keywords '{qa_pair['keywords']}' for question '{question}'. Answering with: '{answer}'")
+            self.answer_store.put(question, answer, "exact")
+            return answer
 
         # Strategy 2: Fuzzy keyword match (handle typos/variations)
-        if self.user_answers:
-            for qa_pair in self.user_answers:
-                if 'keywords' not in qa_pair or 'answer' not in qa_pair:
-                    continue
-
-                for keyword in qa_pair['keywords']:
-                    # Use fuzzy matching with 75% similarity threshold
-                    similarity = SequenceMatcher(None, keyword.lower(), question_lower).ratio()
-                    if similarity > 0.75:
-                        answer = qa_pair['answer']
-                        log.info(f"[Fuzzy match {similarity:.2%}] Matched keyword '{keyword}' for question '{question}'. Answering with: '{answer}'")
-                        self.answers[question] = answer
-                        return answer
+        fuzzy = self.answer_matcher.fuzzy(question_lower)
+        if fuzzy is not None:
+            qa_pair, keyword, similarity = fuzzy
+            answer = qa_pair['answer']
+            log.info(f"[Fuzzy match {similarity:.2%}] Matched keyword '{keyword}' for question '{question}'. Answering with: '{answer}'")
+            self.answer_store.put(question, answer, "fuzzy")
+            return answer
 
         # Strategy 3: Question type detection with smart defaults
+        answer = self.smart_default_answer(question, question_lower)
+        self.answer_matcher.record("smart_default", answer is not None)
+        if answer is not None:
+            self.answer_store.put(question, answer, "smart_default")
+            return answer
 
+        # Strategy 4: Interactive mode or log unanswered question
+        log.warning(f"[No match] Could not find answer for question: '{question}'")
+
+        # If interactive mode is enabled, ask user for answer
+        if self.interactive_mode:
+            user_answer = self.ask_user_for_answer(question)
+            if user_answer == 'DISCARD_APPLICATION':
+                # Signal to discard the application
+                return 'DISCARD_APPLICATION'
+            elif user_answer:
+                self.answer_store.put(question, user_answer, "user")
+                return user_answer
+            # If user skipped or provided empty answer, fall through to save and return None
+
+        # Save unanswered question for later review
+        self.save_unanswered_question(question)
+        log.info("Skipping this question - will be saved for manual review")
+        return None
+
+    def smart_default_answer(self, question, question_lower):
+        """
+        Detect common question types and answer them from config or sensible defaults.
+        Returns: the answer, or None if the question type is not recognised
+        """
         # Years of experience questions (check this first before general yes/no)
         experience_patterns = ["how many years", "years of experience", "years' experience", "years experience"]
         if any(pattern in question_lower for pattern in experience_patterns):
@@ -1313,39 +1712,43 @@ class EasyApplyBot:
                 log.info(f"[Smart default] Detected yes/no question: '{question}'. Answering: 'Yes'")
                 return "Yes"
 
-        # Strategy 4: Interactive mode or log unanswered question
-        log.warning(f"[No match] Could not find answer for question: '{question}'")
-
-        # If interactive mode is enabled, ask user for answer
-        if self.interactive_mode:
-            user_answer = self.ask_user_for_answer(question)
-            if user_answer == 'DISCARD_APPLICATION':
-                # Signal to discard the application
-                return 'DISCARD_APPLICATION'
-            elif user_answer:
-                return user_answer
-            # If user skipped or provided empty answer, fall through to save and return None
-
-        # Save unanswered question for later review
-        self.save_unanswered_question(question)
-        log.info("Skipping this question - will be saved for manual review")
         return None
 
-    def load_page(self, sleep=0.1):
-        scroll_page = 0
-        while scroll_page < 4000:
-            self.browser.execute_script("window.scrollTo(0," + str(scroll_page) + " );")
-            scroll_page += 500
-            time.sleep(sleep)
+    @timed("load_page")
+    def load_page(self, sleep=0.1, browser=None):
+        """
+        Scroll down until the job card count stops growing (at most 4000px), in one call.
+        Returns a LazyPage; page_source is only pulled and parsed if the caller reads it.
+        """
+        browser = browser or self.browser
+        started = time.perf_counter()
+        result = {}
+        try:
+            browser.set_script_timeout(int(4000 / self.SCROLL_STEP_PX * sleep) + 5)
+            result = browser.execute_async_script(
+                SCROLL_UNTIL_STABLE, self.SCROLL_STEP_PX, 4000, int(sleep * 1000), self.SCROLL_STABLE_STEPS) or {}
+        except Exception as e:
+            log.debug(f"Scroll until stable failed, falling back to fixed steps: {e}")
+            for scroll_page in range(0, 4000, self.SCROLL_STEP_PX):
+                browser.execute_script("window.scrollTo(0," + str(scroll_page) + " );")
+                time.sleep(sleep)
 
         if sleep != 0.1:
-            self.browser.execute_script("window.scrollTo(0,0);")
+            browser.execute_script("window.scrollTo(0,0);")
             time.sleep(sleep)
 
-        page = BeautifulSoup(self.browser.page_source, "lxml")
-        return page
+        elapsed = time.perf_counter() - started
+        self.page_loads.append(elapsed)
+        log.debug(f"Page loaded in {elapsed:.2f}s: {result.get('cards', '?')} cards after {result.get('steps', '?')} scroll steps")
+        if self.network is not None:
+            weight = self.network.drain(browser)
+            log.debug(f"Transferred {weight.get('bytes', 0) / 1024:.0f} KiB in {weight.get('requests', 0)} requests "
+                      f"since the last page, {weight.get('blocked', 0)} blocked")
+        return LazyPage(browser)
 
     def avoid_lock(self) -> None:
+        # Only needed when the screen locks; importing pyautogui costs more than the rest of the startup
+        import pyautogui
         x, _ = pyautogui.position()
         pyautogui.moveTo(x + 200, pyautogui.position().y, duration=1.0)
         pyautogui.moveTo(x, pyautogui.position().y, duration=0.5)
@@ -1355,26 +1758,37 @@ class EasyApplyBot:
         time.sleep(0.5)
         pyautogui.press('esc')
 
-    def next_jobs_page(self, position, location, jobs_per_page, experience_level=[]):
+    def search_url(self, position, location, start, experience_level=None) -> str:
+        """URL of one Easy Apply search results page; location is the "&location=..." query part"""
+        if experience_level is None:
+            experience_level = self.experience_level
         # Construct the experience level part of the URL
         experience_level_str = ",".join(map(str, experience_level)) if experience_level else ""
         experience_level_param = f"&f_E={experience_level_str}" if experience_level_str else ""
-        self.browser.get(
-            # URL for jobs page
-            "https://www.linkedin.com/jobs/search/?f_LF=f_AL&keywords=" +
-            position + location + "&start=" + str(jobs_per_page) + experience_level_param)
+        return (self.BASE_URL + "/jobs/search/?f_LF=f_AL&keywords=" +
+                position + location + "&start=" + str(start) + experience_level_param)
+
+    @timed("next_jobs_page")
+    def next_jobs_page(self, position, location, jobs_per_page, experience_level=[]):
+        self.current_search = (position, location, jobs_per_page)
+        self.browser.get(self.search_url(position, location, jobs_per_page, experience_level))
         #self.avoid_lock()
         log.info(f"Loading jobs page (start={jobs_per_page})")
         self.load_page()
+        log.info(f"Jobs page (start={jobs_per_page}) loaded in {self.page_loads[-1]:.2f}s")
         # Increment page number for next call (LinkedIn shows 25 jobs per page)
         jobs_per_page += 25
         return (self.browser, jobs_per_page)
 
-    # def finish_apply(self) -> None:
-    #     self.browser.close()
-
 
 if __name__ == '__main__':
+    import argparse
+
+    from profiling import RunProfiler, add_profile_arguments
+
+    parser = argparse.ArgumentParser(description="Apply to LinkedIn Easy Apply jobs using config.yaml")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
 
     with open("config.yaml", 'r') as stream:
         try:
@@ -1408,19 +1822,39 @@ if __name__ == '__main__':
     locations: list = [l for l in parameters['locations'] if l is not None]
     positions: list = [p for p in parameters['positions'] if p is not None]
 
-    bot = EasyApplyBot(parameters['username'],
-                       parameters['password'],
-                       parameters['phone_number'],
-                       parameters['salary'],
-                       parameters['rate'],
-                       uploads=uploads,
-                       filename=output_filename,
-                       blacklist=blacklist,
-                       blackListTitles=blackListTitles,
-                       experience_level=parameters.get('experience_level', []),
-                       years_of_experience=parameters.get('years_of_experience', 8),
-                       interactive_mode=parameters.get('interactive_mode', False)
-                       )
-    bot.start_apply(positions, locations)
+    profiler = RunProfiler.from_args(args) if args.profile else contextlib.nullcontext()
+    with profiler:
+        bot = EasyApplyBot(parameters['username'],
+                           parameters['password'],
+                           parameters['phone_number'],
+                           parameters['salary'],
+                           parameters['rate'],
+                           uploads=uploads,
+                           filename=output_filename,
+                           blacklist=blacklist,
+                           blackListTitles=blackListTitles,
+                           experience_level=parameters.get('experience_level', []),
+                           years_of_experience=parameters.get('years_of_experience', 8),
+                           interactive_mode=parameters.get('interactive_mode', False),
+                           history_days=parameters.get('history_days', 2),
+                           scroll_steps=parameters.get('scroll_steps', 30),
+                           scroll_timeout=parameters.get('scroll_timeout', 10),
+                           discovery_worker=parameters.get('discovery_worker', False),
+                           search_budget_minutes=parameters.get('search_budget_minutes'),
+                           audit_commands=parameters.get('audit_commands', False),
+                           profile_path=parameters.get('profile_path'),
+                           reuse_session=parameters.get('reuse_session', True),
+                           headless=parameters.get('headless', False),
+                           block_resources=parameters.get('block_resources') or [],
+                           block_urls=parameters.get('block_urls') or [],
+                           network_stats=parameters.get('network_stats', False),
+                           memory_limit_mb=parameters.get('memory_limit_mb'),
+                           recycle_jobs=parameters.get('recycle_jobs', 0)
+                           )
+        if args.profile:
+            profiler.watch(bot)
+        # Leaving the block (normally, on Ctrl+C, SIGTERM or an error) flushes pending writes and quits Chrome
+        with bot:
+            bot.start_apply(positions, locations)
 
 
@@ -0,0 +1,318 @@
+"""
+Precompiled string matchers used on the bot's hot paths.
+
+Everything here is built once from config / questions.yaml and then queried
+many times, so the per-call work is a single pass over the text instead of a
+loop over every configured keyword.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import Counter, deque
+from difflib import SequenceMatcher
+
+log = logging.getLogger(__name__)
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick multi-pattern matcher.
+
+    Every pattern carries a priority (lower wins). first_match() returns the
+    lowest priority among all patterns occurring anywhere in the text, which is
+    exactly what a "first entry in list order whose keyword is a substring"
+    loop would return, in one pass over the text.
+    """
+
+    def __init__(self) -> None:
+        self.goto = [{}]
+        self.fail = [0]
+        self.best = [None]  # lowest priority ending at this node, including via fail links
+        self.matches_empty = None  # an empty pattern is a substring of every text
+        self.built = False
+
+    def add(self, pattern, priority) -> None:
+        if not pattern:
+            if self.matches_empty is None or priority < self.matches_empty:
+                self.matches_empty = priority
+            return
+        node = 0
+        for char in pattern:
+            nxt = self.goto[node].get(char)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][char] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.best.append(None)
+            node = nxt
+        if self.best[node] is None or priority < self.best[node]:
+            self.best[node] = priority
+        self.built = False
+
+    def build(self) -> "KeywordAutomaton":
+        queue = deque()
+        for child in self.goto[0].values():
+            self.fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                inherited = self.best[self.fail[child]]
+                if inherited is not None and (self.best[child] is None or inherited < self.best[child]):
+                    self.best[child] = inherited
+        self.built = True
+        return self
+
+    def first_match(self, text):
+        """Lowest priority of any pattern found in text, or None"""
+        if not self.built:
+            self.build()
+        found = self.matches_empty
+        goto, fail, best = self.goto, self.fail, self.best
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            priority = best[node]
+            if priority is not None and (found is None or priority < found):
+                found = priority
+                if found == 0:
+                    break
+        return found
+
+
+class AnswerMatcher:
+    """
+    Keyword and fuzzy lookup over the questions.yaml entries used by ans_question.
+
+    Exact matching keeps the old semantics (first entry, in file order, with any
+    keyword contained in the question) but runs as one automaton pass. Fuzzy
+    matching keeps the old SequenceMatcher ratio and threshold, but skips any
+    keyword whose character-count profile proves it cannot reach the threshold
+    and reuses the question's SequenceMatcher index across keywords.
+    """
+
+    FUZZY_THRESHOLD = 0.75
+
+    def __init__(self, qa_pairs) -> None:
+        self.entries = []
+        self.automaton = KeywordAutomaton()
+        self.fuzzy_keywords = []  # (entry index, keyword, lowercased keyword, length, char counts)
+        self.stats = Counter()
+
+        for qa_pair in qa_pairs or []:
+            if not isinstance(qa_pair, dict) or 'keywords' not in qa_pair or 'answer' not in qa_pair:
+                continue
+            index = len(self.entries)
+            self.entries.append(qa_pair)
+            for keyword in qa_pair['keywords'] or []:
+                keyword_lower = str(keyword).lower()
+                self.automaton.add(keyword_lower, index)
+                self.fuzzy_keywords.append((index, keyword, keyword_lower, len(keyword_lower), Counter(keyword_lower)))
+        self.automaton.build()
+        log.debug(f"Compiled {len(self.fuzzy_keywords)} keywords from {len(self.entries)} answers")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, strategy, hit) -> None:
+        self.stats[f"{strategy}.{'hit' if hit else 'miss'}"] += 1
+
+    def exact(self, question_lower) -> dict | None:
+        """First questions.yaml entry with a keyword contained in the question"""
+        index = self.automaton.first_match(question_lower) if self.entries else None
+        self.record("exact", index is not None)
+        return self.entries[index] if index is not None else None
+
+    def fuzzy(self, question_lower):
+        """First (entry, keyword, similarity) whose keyword is more than 75% similar to the question"""
+        if not self.fuzzy_keywords:
+            self.record("fuzzy", False)
+            return None
+
+        question_length = len(question_lower)
+        question_counts = None
+        matcher = SequenceMatcher(None)
+        matcher.set_seq2(question_lower)
+        for index, keyword, keyword_lower, length, counts in self.fuzzy_keywords:
+            total = length + question_length
+            if not total:
+                continue
+            # ratio() = 2 * matches / total and matches can't exceed the shorter string
+            if 2.0 * min(length, question_length) / total <= self.FUZZY_THRESHOLD:
+                continue
+            if question_counts is None:
+                question_counts = Counter(question_lower)
+            # ...nor the number of characters the two strings have in common
+            common = sum(min(count, question_counts[char]) for char, count in counts.items())
+            if 2.0 * common / total <= self.FUZZY_THRESHOLD:
+                continue
+            matcher.set_seq1(keyword_lower)
+            similarity = matcher.ratio()
+            if similarity > self.FUZZY_THRESHOLD:
+                self.record("fuzzy", True)
+                return self.entries[index], keyword, similarity
+        self.record("fuzzy", False)
+        return None
+
+
+class RelevanceScorer:
+    """
+    Job title relevance scoring, compiled once per start_apply.
+
+    Produces exactly the scores the per-call calculate_job_relevance did:
+    0 if the title contains an irrelevant keyword the user is not searching
+    for, +100 for an exact position match, +50 for a contained position plus
+    +20 per related term, and a SequenceMatcher fallback when nothing matched.
+    Scores are memoized by lowercased title across pages and search combos.
+    """
+
+    IRRELEVANT_KEYWORDS = [
+        'intern', 'internship',  # Unless specifically searching for these
+        'entry level data entry', 'data entry clerk',  # Not analytics
+        'senior manager', 'director', 'vp ', 'vice president',  # Too senior unless specified
+        'recruiter', 'recruitment',  # Not technical roles
+        'sales', 'account executive',  # Not technical
+        'customer service', 'customer support',
+        'administrative', 'secretary', 'clerk'
+    ]
+
+    # Bonus terms that indicate a good match for a position keyword
+    RELATED_TERMS = {
+        'data': ['analyst', 'scientist', 'engineer', 'analytics'],
+        'analytics': ['analyst', 'engineer', 'specialist'],
+        'analyst': ['data', 'business', 'analytics'],
+        'engineer': ['data', 'analytics', 'software', 'machine learning'],
+        'scientist': ['data', 'machine learning', 'research']
+    }
+
+    FUZZY_THRESHOLD = 0.6
+    CACHE_SIZE = 10000
+
+    def __init__(self, positions) -> None:
+        self.positions = [(position.lower(), self.RELATED_TERMS.get(position.lower(), []))
+                          for position in positions]
+        position_lowers = [position for position, _ in self.positions]
+        # Irrelevant keywords stay allowed when the user searches for them explicitly
+        excluded = [keyword for keyword in self.IRRELEVANT_KEYWORDS
+                    if not any(position in keyword for position in position_lowers)]
+        self.exclusions = re.compile("|".join(re.escape(keyword) for keyword in excluded)) if excluded else None
+        self.cache = {}
+
+    def score(self, job_title) -> int:
+        job_title_lower = job_title.lower()
+        score = self.cache.get(job_title_lower)
+        if score is None:
+            score = self._score(job_title_lower)
+            if len(self.cache) >= self.CACHE_SIZE:
+                self.cache.clear()
+            self.cache[job_title_lower] = score
+        return score
+
+    def score_many(self, job_titles) -> list:
+        """Scores for a whole page of titles in one call"""
+        return [self.score(job_title) for job_title in job_titles]
+
+    def _score(self, job_title_lower) -> int:
+        if self.exclusions is not None:
+            excluded = self.exclusions.search(job_title_lower)
+            if excluded:
+                log.debug(f"Excluding due to irrelevant keyword '{excluded.group(0)}': {job_title_lower}")
+                return 0
+
+        score = 0
+        for position_lower, related_terms in self.positions:
+            # Exact match = high score
+            if position_lower == job_title_lower:
+                score += 100
+                continue
+            # Position keyword is in the title, with a bonus per related term
+            if position_lower in job_title_lower:
+                score += 50
+                for related_term in related_terms:
+                    if related_term in job_title_lower:
+                        score += 20
+
+        # Fuzzy matching for partial keyword matches
+        if score == 0 and self.positions:
+            matcher = SequenceMatcher(None)
+            matcher.set_seq2(job_title_lower)
+            for position_lower, _ in self.positions:
+                matcher.set_seq1(position_lower)
+                similarity = matcher.ratio()
+                if similarity > self.FUZZY_THRESHOLD:
+                    score += int(similarity * 30)
+        return score
+
+
+class BlacklistMatcher:
+    """
+    Company or title blacklist compiled once from config.
+
+    Entries are plain strings matched case-insensitively as substrings (the
+    original behaviour), all in a single automaton pass. An entry can also be
+    a mapping for stricter rules:
+        - word: IT          # whole word only, so "Digital" does not match
+        - regex: '^Meta\\b'  # Python regex, case-insensitive
+    Word and regex rules are searched one by one, in config order, and only up
+    to the first plain entry the automaton found. match() returns the label of
+    the first entry (in config order) that matches, and hits counts how many
+    texts every entry rejected.
+    """
+
+    def __init__(self, entries) -> None:
+        self.labels = []
+        self.automaton = KeywordAutomaton()
+        self.has_substrings = False
+        # (entry index, compiled regex) of the word and regex rules; searched separately so an overlapping
+        # match of one rule can't hide another's
+        self.regexes = []
+        self.hits = Counter()
+
+        for entry in entries or []:
+            index = len(self.labels)
+            if isinstance(entry, dict) and entry.get('word'):
+                self.labels.append(f"word:{entry['word']}")
+                self.regexes.append((index, re.compile(f"\\b{re.escape(str(entry['word']))}\\b", re.IGNORECASE)))
+            elif isinstance(entry, dict) and entry.get('regex'):
+                try:
+                    self.regexes.append((index, re.compile(str(entry['regex']), re.IGNORECASE)))
+                    self.labels.append(f"regex:{entry['regex']}")
+                except re.error as e:
+                    log.error(f"Ignoring invalid blacklist regex '{entry['regex']}': {e}")
+            elif entry is not None and not isinstance(entry, dict):
+                self.labels.append(str(entry))
+                self.automaton.add(str(entry).lower(), index)
+                self.has_substrings = True
+        self.automaton.build()
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def match(self, text):
+        """Label of the first blacklist entry matching text, or None"""
+        if not self.labels or not text:
+            return None
+        text_lower = text.lower()
+        best = self.automaton.first_match(text_lower) if self.has_substrings else None
+        for index, regex in self.regexes:
+            if best is not None and index > best:
+                break
+            if regex.search(text):
+                best = index
+                break
+        if best is None:
+            return None
+        label = self.labels[best]
+        self.hits[label] += 1
+        return label
@@ -0,0 +1,108 @@
+"""
+Lightweight timing helpers shared by the bot, the benchmark and the reports.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+def percentile(values, pct) -> float:
+    """Return the pct-th percentile (0-100) of values using linear interpolation"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return float(ordered[low])
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values) -> dict:
+    """Count, mean and p50/p95/max of a list of durations in seconds"""
+    if not values:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values),
+    }
+
+
+class PhaseRecorder:
+    """
+    Times named phases of a run and emits one structured event per phase.
+
+    Fields passed to phase() (a job ID, say) are attached to that event and to
+    every phase nested inside it; set_context() attaches fields (the search
+    combo) to everything that follows on the current thread. Each event is a
+    dict handed to sink, e.g. a BackgroundWriter appending JSON lines.
+    """
+
+    def __init__(self, sink=None, run_id=None) -> None:
+        self.sink = sink
+        self.run_id = run_id or time.strftime("%Y%m%d-%H%M%S")
+        self.durations = defaultdict(list)
+        self._local = threading.local()
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = [{}]
+        return self._local.stack
+
+    def set_context(self, **fields) -> None:
+        self._stack()[0].update(fields)
+
+    def context(self) -> dict:
+        """Fields of the innermost phase running on this thread (job ID, combo, ...)"""
+        return self._stack()[-1]
+
+    @contextmanager
+    def phase(self, name, **fields):
+        """Time the block; the yielded dict can be filled with extra fields (result, counts, ...)"""
+        stack = self._stack()
+        context = dict(stack[-1], **fields)
+        stack.append(context)
+        event = {}
+        started = time.perf_counter()
+        ok = True
+        try:
+            yield event
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            stack.pop()
+            self.record(name, time.perf_counter() - started, ok=ok, **context, **event)
+
+    def record(self, name, seconds, **fields) -> None:
+        self.durations[name].append(seconds)
+        if self.sink is not None:
+            self.sink({"ts": round(time.time(), 3), "run": self.run_id, "phase": name,
+                       "seconds": round(seconds, 4), **fields})
+
+    def summary(self) -> dict:
+        """Count, mean and percentiles of every phase, in seconds"""
+        return {name: summarize(values) for name, values in self.durations.items()}
+
+
+def timed(name):
+    """Method decorator timing every call as phase name on self.phases"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.phases.phase(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,137 @@
+"""
+Request blocking and page weight for the bot's browsers.
+
+Blocking goes through the DevTools protocol (Network.setBlockedURLs), so
+blocked requests never leave Chrome. Resource types are mapped to URL
+patterns since that is what the protocol matches on. NetworkStats reads
+Chrome's performance log for the bytes actually transferred and the
+requests that were blocked, and estimates what the blocked requests would
+have cost to see what a blocking setup buys.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import Counter
+
+log = logging.getLogger(__name__)
+
+# URL patterns (* wildcards) per resource type the bot never needs
+RESOURCE_PATTERNS = {
+    "images": ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico", "*.ico?*", "*media.licdn.com/dms/image*"),
+    "media": ("*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*", "*dms/playlist*"),
+    "fonts": ("*.woff*", "*.ttf*", "*.otf*", "*.eot*"),
+    "analytics": ("*/li/track*", "*px.ads.linkedin.com*", "*/sensorCollect*", "*google-analytics.com*",
+                  "*googletagmanager.com*", "*doubleclick.net*", "*bat.bing.com*"),
+}
+
+# Rough encoded size of one LinkedIn response per DevTools resource type, for blocked
+# requests of a type that was never seen unblocked in the baseline or this run
+TYPICAL_BYTES = {"Image": 15_000, "Media": 250_000, "Font": 35_000, "Script": 30_000,
+                 "Stylesheet": 20_000, "XHR": 2_000, "Fetch": 2_000, "Ping": 500, "Other": 5_000}
+
+
+def blocked_url_patterns(resource_types=(), urls=()) -> list:
+    """URL patterns for the configured resource types plus any extra patterns"""
+    patterns = []
+    for resource_type in resource_types or ():
+        if resource_type not in RESOURCE_PATTERNS:
+            log.error(f"Unknown resource type to block: {resource_type} (known: {', '.join(RESOURCE_PATTERNS)})")
+            continue
+        patterns.extend(RESOURCE_PATTERNS[resource_type])
+    patterns.extend(urls or ())
+    return list(dict.fromkeys(patterns))
+
+
+def block_requests(browser, patterns) -> None:
+    """Have browser fail every request matching one of patterns before it is sent"""
+    if not patterns:
+        return
+    browser.execute_cdp_cmd("Network.enable", {})
+    browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+def enable_performance_log(options) -> None:
+    """Chrome options for NetworkStats: network events only, in the performance log"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+class NetworkStats:
+    """
+    Bytes transferred and requests blocked, per resource type, from the performance log.
+
+    drain(browser) consumes the log entries collected since the last call and
+    returns that interval's totals; call it once per page so the log stays short.
+
+    Blocked requests are priced at the mean size of their resource type in
+    baseline (the report() of an unblocked run), else in this run's own
+    unblocked requests of that type, else TYPICAL_BYTES.
+    """
+
+    def __init__(self, baseline=None) -> None:
+        self.baseline = baseline or {}
+        self.lock = threading.Lock()
+        self.bytes = Counter()  # resource type -> encoded bytes received
+        self.requests = Counter()  # resource type -> finished requests
+        self.blocked = Counter()  # resource type -> blocked requests
+        self.page_bytes = []  # bytes of every drained interval
+
+    def drain(self, browser) -> dict:
+        try:
+            entries = browser.get_log("performance")
+        except Exception as e:
+            log.debug(f"Could not read the performance log: {e}")
+            return {}
+        types = {}
+        received, finished, blocked = Counter(), Counter(), Counter()
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.responseReceived":
+                types[params.get("requestId")] = params.get("type", "Other")
+            elif method == "Network.loadingFinished":
+                resource_type = types.pop(params.get("requestId"), "Other")
+                received[resource_type] += int(params.get("encodedDataLength", 0))
+                finished[resource_type] += 1
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked[params.get("type", "Other")] += 1
+        page = {"bytes": sum(received.values()), "requests": sum(finished.values()), "blocked": sum(blocked.values())}
+        with self.lock:
+            self.bytes.update(received)
+            self.requests.update(finished)
+            self.blocked.update(blocked)
+            self.page_bytes.append(page["bytes"])
+        return page
+
+    def mean_bytes(self, resource_type) -> int:
+        """Estimated encoded size of one request of resource_type"""
+        for totals, counts in ((self.baseline.get("bytes_by_type", {}), self.baseline.get("requests_by_type", {})),
+                               (self.bytes, self.requests)):
+            if counts.get(resource_type):
+                return round(totals.get(resource_type, 0) / counts[resource_type])
+        return TYPICAL_BYTES.get(resource_type, TYPICAL_BYTES["Other"])
+
+    def report(self) -> dict:
+        with self.lock:
+            pages = len(self.page_bytes)
+            saved = {resource_type: count * self.mean_bytes(resource_type)
+                     for resource_type, count in self.blocked.most_common()}
+            return {
+                "bytes": sum(self.bytes.values()),
+                "requests": sum(self.requests.values()),
+                "blocked": sum(self.blocked.values()),
+                "bytes_per_page": round(sum(self.page_bytes) / pages) if pages else 0,
+                "saved_bytes": sum(saved.values()),
+                "saved_bytes_per_page": round(sum(saved.values()) / pages) if pages else 0,
+                "bytes_by_type": dict(self.bytes.most_common()),
+                "requests_by_type": dict(self.requests.most_common()),
+                "blocked_by_type": dict(self.blocked.most_common()),
+                "saved_by_type": saved,
+            }
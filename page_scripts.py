@@ -0,0 +1,193 @@
+"""
+JavaScript snippets injected with execute_script.
+
+Each script collapses what used to be many WebDriver round trips into a single
+call that returns plain JSON-compatible data, so the bot can do its filtering
+in Python and only touch element handles when it actually needs to click.
+"""
+
+# parseCard(card) reads one //div[@data-job-id] card into {job_id, title, company,
+# already_applied, easy_apply}. Title and company are the first two non-empty lines
+# of the card text, same as link.text.splitlines() gave us; both are '' for a card
+# that has not rendered its text yet. Scripts that look at cards start with this.
+PARSE_CARD = r"""
+function parseCard(card) {
+    var text = card.innerText || card.textContent || '';
+    var lines = text.split('\n').map(function (l) { return l.trim(); }).filter(function (l) { return l; });
+    return {
+        job_id: card.getAttribute('data-job-id'),
+        title: lines.length > 0 ? lines[0] : '',
+        company: lines.length > 1 ? lines[1] : '',
+        already_applied: text.indexOf('Applied') !== -1,
+        easy_apply: /easy apply/i.test(text)
+    };
+}
+"""
+
+# Returns parseCard() of every //div[@data-job-id] card on the search page.
+JOB_CARDS = PARSE_CARD + r"""
+return Array.from(document.querySelectorAll('div[data-job-id]')).map(parseCard);
+"""
+
+def locator_query(locator) -> list:
+    """Turn a (By, value) locator from EasyApplyBot.locator into ['css' | 'xpath', selector] for the scripts below"""
+    by, value = locator
+    if by == "xpath":
+        return ["xpath", value]
+    if by == "class name":
+        return ["css", "." + value]
+    if by == "id":
+        return ["css", "#" + value]
+    if by == "name":
+        return ["css", f'[name="{value}"]']
+    return ["css", value]  # css selector and tag name
+
+
+# Snapshot of the Easy Apply modal in one call. arguments[0] is {name: [kind, selector]};
+# for every name it reports how many elements match and whether one is displayed and enabled.
+# Also returns error messages, file upload slots, the follow checkbox state and whether
+# the "application was sent" confirmation is on the page.
+MODAL_STATE = r"""
+var locators = arguments[0];
+function find(kind, selector) {
+    if (kind === 'xpath') {
+        var result = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+        return nodes;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(selector));
+}
+function visible(el) { return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length); }
+function enabled(el) { return visible(el) && !el.disabled && el.getAttribute('aria-disabled') !== 'true'; }
+
+var state = {elements: {}};
+Object.keys(locators).forEach(function (name) {
+    var nodes = find(locators[name][0], locators[name][1]);
+    state.elements[name] = {
+        count: nodes.length,
+        displayed: nodes.some(visible),
+        enabled: nodes.some(enabled),
+        texts: nodes.slice(0, 10).map(function (el) { return (el.innerText || el.textContent || '').trim(); })
+    };
+});
+state.upload_slots = Array.prototype.map.call(document.querySelectorAll("input[type='file']"), function (el) {
+    return {id: el.id, name: el.name, accept: el.accept};
+});
+var follow = document.getElementById('follow-company-checkbox');
+state.follow_checked = follow ? follow.checked : null;
+state.submitted = ((document.body && document.body.textContent) || '').indexOf('application was sent') !== -1;
+return state;
+"""
+
+
+# Serializes every Easy Apply form section into a structured model in one call.
+# Each section is tagged with data-eab-field="<index>" so it can be found again
+# later (FORM_FIELD_SELECTOR). Input type precedence matches process_questions:
+# dropdown, then radio, then text input, then textarea, then select.
+# "required" is set by an asterisk or "required" in the text, or aria-required/required on an input.
+FORM_SNAPSHOT = r"""
+var sections = document.querySelectorAll('.jobs-easy-apply-form-section__grouping');
+function text(el) { return ((el && (el.innerText || el.textContent)) || '').trim(); }
+function radioLabel(radio) {
+    var el = radio.nextElementSibling;
+    while (el && el.tagName !== 'LABEL') { el = el.nextElementSibling; }
+    return text(el);
+}
+return Array.prototype.map.call(sections, function (section, index) {
+    section.setAttribute('data-eab-field', String(index));
+    var sectionText = text(section);
+    var dropdown = section.querySelector("button[aria-haspopup='listbox']");
+    var radios = section.querySelectorAll("input[type='radio']");
+    var textInput = section.querySelector("input[type='text']");
+    var textarea = section.querySelector('textarea');
+    var select = section.querySelector('select');
+    var type = dropdown ? 'dropdown' : radios.length ? 'radio' : textInput ? 'text'
+             : textarea ? 'textarea' : select ? 'select' : 'unknown';
+
+    var options = [], value = '';
+    if (type === 'radio') {
+        options = Array.prototype.map.call(radios, radioLabel);
+        Array.prototype.forEach.call(radios, function (radio, i) { if (radio.checked) { value = options[i]; } });
+    } else if (type === 'select') {
+        options = Array.prototype.map.call(select.options, function (o) { return text(o); });
+        value = select.selectedIndex >= 0 ? options[select.selectedIndex] : '';
+    } else if (type === 'dropdown') {
+        value = text(dropdown);
+    } else if (type === 'text') {
+        value = textInput.value;
+    } else if (type === 'textarea') {
+        value = textarea.value;
+    }
+
+    var required = sectionText.indexOf('*') !== -1 || sectionText.toLowerCase().indexOf('required') !== -1;
+    Array.prototype.forEach.call(section.querySelectorAll('input, textarea, select'), function (el) {
+        if (el.getAttribute('aria-required') === 'true' || el.required) { required = true; }
+    });
+    var label = section.querySelector('label, legend');
+
+    return {
+        index: index,
+        text: sectionText,
+        label: label ? text(label) : sectionText.split('\n')[0],
+        input_type: type,
+        options: options,
+        value: value,
+        required: required,
+        has_input: section.querySelector('input') !== null
+    };
+});
+"""
+
+FORM_FIELD_SELECTOR = '[data-eab-field="{}"]'
+
+# Applies answers computed in Python to the sections tagged by FORM_SNAPSHOT, all in one call.
+# arguments[0] is a list of {index, action, value, option}; action is one of
+# text, textarea, first_input (set the value), radio (click option number) or select.
+# Values are set through the native setter and followed by input/change events so the
+# page's framework sees them as typed. Returns the indexes that could not be applied.
+APPLY_FORM_ANSWERS = r"""
+var actions = arguments[0], failed = [];
+function setValue(el, value) {
+    var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype
+              : el.tagName === 'SELECT' ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    el.focus();
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+}
+actions.forEach(function (action) {
+    try {
+        var section = document.querySelector('[data-eab-field="' + action.index + '"]');
+        var el = null;
+        if (!section) { failed.push(action.index); return; }
+        if (action.action === 'radio') {
+            el = section.querySelectorAll("input[type='radio']")[action.option];
+            if (el) { el.click(); }
+        } else if (action.action === 'select') {
+            el = section.querySelector('select');
+            if (el) { el.selectedIndex = action.option; el.dispatchEvent(new Event('change', {bubbles: true})); }
+        } else {
+            var selector = action.action === 'text' ? "input[type='text']"
+                         : action.action === 'textarea' ? 'textarea' : 'input';
+            el = section.querySelector(selector);
+            if (el) { setValue(el, action.value); }
+        }
+        if (!el) { failed.push(action.index); }
+    } catch (e) {
+        failed.push(action.index);
+    }
+});
+return failed;
+"""
+
+
+# One HEAD request for the feed with the browser's cookies; true when it answers
+# without redirecting to the login page. execute_async_script(SESSION_CHECK, feed_url)
+SESSION_CHECK = r"""
+var done = arguments[arguments.length - 1];
+fetch(arguments[0], {method: 'HEAD', credentials: 'include', redirect: 'manual', cache: 'no-store'})
+    .then(function (response) { done(response.type !== 'opaqueredirect' && response.ok); })
+    .catch(function () { done(false); });
+"""
@@ -0,0 +1,245 @@
+"""
+Profiling mode for bot runs (--profile on easyapplybot.py and run_bot.py).
+
+Wraps a run in either cProfile (deterministic, written as pstats) or a
+sampling profiler that walks every thread's stack at a fixed interval
+(written as collapsed stacks for flamegraph.pl / speedscope). tracemalloc
+snapshots are taken at intervals. The report at the end separates time spent
+waiting on WebDriver from Python CPU time in the answer matching, relevance
+scoring and string handling code.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+# A frame in one of these files means the thread is waiting on the browser
+WEBDRIVER_PATHS = ("selenium" + os.sep + "webdriver", "urllib3", "http" + os.sep + "client.py", "socket.py")
+
+# Python hot spots reported on their own: (label, file, function names)
+CPU_HOT_SPOTS = (
+    ("ans_question", "easyapplybot.py", ("ans_question", "smart_default_answer")),
+    ("answer matching", "matching.py", ("exact", "fuzzy", "first_match")),
+    ("job relevance", "easyapplybot.py", ("calculate_job_relevance", "select_jobs")),
+    ("relevance scoring", "matching.py", ("score", "score_many", "_score")),
+    ("blacklists", "matching.py", ("match",)),
+)
+# str and re.Pattern methods counted as string handling in cProfile output
+STRING_METHODS = ("lower", "split", "splitlines", "strip", "replace", "join", "format", "startswith", "endswith",
+                  "encode", "decode", "search", "sub", "match", "findall", "finditer")
+
+
+class ProfileLimitReached(BaseException):
+    """Raised once --profile-jobs jobs were processed; BaseException so the bot's handlers let it through"""
+
+
+def add_profile_arguments(parser) -> None:
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true", help="profile the run and write reports to --profile-dir")
+    group.add_argument("--profile-mode", choices=("sample", "cprofile"), default="sample",
+                       help="sample stacks at an interval (low overhead) or trace every call with cProfile")
+    group.add_argument("--profile-interval", type=float, default=0.01, help="seconds between stack samples")
+    group.add_argument("--profile-jobs", type=int, default=0, help="stop after this many jobs (0 = no limit)")
+    group.add_argument("--profile-memory-interval", type=float, default=60.0,
+                       help="seconds between tracemalloc snapshots (0 disables memory tracking)")
+    group.add_argument("--profile-dir", default="profile", help="where to write the profile output")
+
+
+class StackSampler(threading.Thread):
+    """Samples the stacks of every other thread and counts them as collapsed stacks"""
+
+    def __init__(self, interval=0.01) -> None:
+        super().__init__(name="profile-sampler", daemon=True)
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self.webdriver_samples = 0
+        self.stop_event = threading.Event()
+
+    def run(self) -> None:
+        names = {}
+        while not self.stop_event.wait(self.interval):
+            for thread in threading.enumerate():
+                names[thread.ident] = thread.name
+            for ident, frame in sys._current_frames().items():
+                # Leave out this thread and the memory snapshot thread
+                if names.get(ident, "").startswith("profile-"):
+                    continue
+                stack = []
+                waiting = False
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                    if not waiting and any(part in code.co_filename for part in WEBDRIVER_PATHS):
+                        waiting = True
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(stack))] += 1
+                self.samples += 1
+                self.webdriver_samples += waiting
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self.join(timeout=5)
+
+    def write_collapsed(self, path) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def function_seconds(self, filename, names) -> float:
+        """Sampled time spent inside any of the named functions of filename (inclusive)"""
+        frames = {f"{filename}:{name}" for name in names}
+        hits = sum(count for stack, count in self.stacks.items()
+                   if any(frame in frames for frame in stack.split(";")))
+        return hits * self.interval
+
+
+class RunProfiler:
+    """
+    Context manager around a whole run.
+
+    watch(bot) counts apply_to_job calls and raises ProfileLimitReached once
+    max_jobs is reached, so a profile covers a bounded amount of work.
+    """
+
+    def __init__(self, mode="sample", interval=0.01, max_jobs=0, memory_interval=60.0, output_dir="profile") -> None:
+        self.mode = mode
+        self.interval = interval
+        self.max_jobs = max_jobs
+        self.memory_interval = memory_interval
+        self.output_dir = Path(output_dir) / time.strftime("%Y%m%d-%H%M%S")
+        self.jobs = 0
+        self.profile = None
+        self.sampler = None
+        self.memory_thread = None
+        self.memory_stop = threading.Event()
+        self.snapshots = 0
+        self.started = None
+
+    @classmethod
+    def from_args(cls, args) -> "RunProfiler":
+        return cls(mode=args.profile_mode, interval=args.profile_interval, max_jobs=args.profile_jobs,
+                   memory_interval=args.profile_memory_interval, output_dir=args.profile_dir)
+
+    def watch(self, bot) -> None:
+        apply_to_job = bot.apply_to_job
+
+        def counted(*args, **kwargs):
+            try:
+                return apply_to_job(*args, **kwargs)
+            finally:
+                self.jobs += 1
+                if self.max_jobs and self.jobs >= self.max_jobs:
+                    raise ProfileLimitReached()
+
+        bot.apply_to_job = counted
+
+    def __enter__(self) -> "RunProfiler":
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.started = time.perf_counter()
+        if self.memory_interval > 0:
+            tracemalloc.start(25)
+            self.memory_thread = threading.Thread(target=self._snapshot_loop, name="profile-memory", daemon=True)
+            self.memory_thread.start()
+        if self.mode == "cprofile":
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        else:
+            self.sampler = StackSampler(self.interval)
+            self.sampler.start()
+        log.info(f"Profiling ({self.mode}) into {self.output_dir}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self.profile is not None:
+            self.profile.disable()
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self.memory_thread is not None:
+            self.memory_stop.set()
+            self.memory_thread.join(timeout=5)
+            self._snapshot("final")
+            tracemalloc.stop()
+        self.write_report(time.perf_counter() - self.started)
+        # Reaching the job limit is a normal end of a profiled run
+        return exc_type is ProfileLimitReached
+
+    def _snapshot_loop(self) -> None:
+        while not self.memory_stop.wait(self.memory_interval):
+            self._snapshot(f"{self.snapshots:03d}")
+
+    def _snapshot(self, label) -> None:
+        try:
+            snapshot = tracemalloc.take_snapshot()
+            snapshot.dump(str(self.output_dir / f"memory-{label}.tracemalloc"))
+            current, peak = tracemalloc.get_traced_memory()
+            with open(self.output_dir / f"memory-{label}.txt", 'w', encoding='utf-8') as f:
+                f.write(f"current {current / 2 ** 20:.1f} MiB, peak {peak / 2 ** 20:.1f} MiB\n\n")
+                for stat in snapshot.statistics("lineno")[:30]:
+                    f.write(f"{stat}\n")
+            self.snapshots += 1
+        except Exception as e:
+            log.debug(f"tracemalloc snapshot failed: {e}")
+
+    def write_report(self, elapsed) -> None:
+        lines = [f"Profiled {elapsed:.1f}s, {self.jobs} jobs, mode {self.mode}"]
+        if self.profile is not None:
+            stats_path = self.output_dir / "run.pstats"
+            self.profile.dump_stats(str(stats_path))
+            stats = pstats.Stats(str(stats_path))
+            lines += self._pstats_breakdown(stats)
+            with open(self.output_dir / "top.txt", 'w', encoding='utf-8') as f:
+                pstats.Stats(str(stats_path), stream=f).sort_stats("cumulative").print_stats(60)
+        if self.sampler is not None:
+            self.sampler.write_collapsed(self.output_dir / "stacks.collapsed")
+            lines += self._sample_breakdown()
+        if self.snapshots:
+            lines.append(f"{self.snapshots} tracemalloc snapshots (memory-*.txt, load *.tracemalloc with tracemalloc.Snapshot.load)")
+        report = "\n".join(lines)
+        with open(self.output_dir / "report.txt", 'w', encoding='utf-8') as f:
+            f.write(report + "\n")
+        log.info("Profile report:\n" + report)
+
+    def _pstats_breakdown(self, stats) -> list:
+        webdriver = 0.0
+        hot = Counter()
+        strings = 0.0
+        for (filename, _, name), (_, _, tottime, cumtime, _) in stats.stats.items():
+            if name == "execute" and ("selenium" + os.sep + "webdriver") in filename:
+                webdriver = max(webdriver, cumtime)  # WebDriver.execute: every browser command goes through it
+            for label, hot_file, names in CPU_HOT_SPOTS:
+                if name in names and Path(filename).name == hot_file:
+                    hot[label] += tottime
+            if filename == "~" and ("of 'str' objects" in name or "of 're.Pattern' objects" in name) \
+                    and any(f"'{method}'" in name for method in STRING_METHODS):
+                strings += tottime
+        # cProfile only traces the main thread, so a discovery worker's page loads are not in here
+        lines = [f"WebDriver I/O (WebDriver.execute, cumulative, main thread): {webdriver:.2f}s"]
+        lines += [f"Python CPU in {label} (own time): {seconds:.3f}s" for label, seconds in hot.items()]
+        lines.append(f"Python CPU in string and regex builtins (own time): {strings:.3f}s")
+        return lines
+
+    def _sample_breakdown(self) -> list:
+        sampler = self.sampler
+        if not sampler.samples:
+            return ["No stack samples taken"]
+        lines = [f"{sampler.samples} samples every {sampler.interval * 1000:.0f}ms across all threads",
+                 f"WebDriver I/O: {sampler.webdriver_samples / sampler.samples:.0%} of samples "
+                 f"(~{sampler.webdriver_samples * sampler.interval:.1f}s)"]
+        for label, hot_file, names in CPU_HOT_SPOTS:
+            lines.append(f"Python in {label}: ~{sampler.function_seconds(hot_file, names):.2f}s")
+        # Samples only see Python frames; str builtins run in C inside their callers
+        lines.append("String builtins are included in their callers above; use --profile-mode cprofile to split them out")
+        return lines
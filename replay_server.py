@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the LinkedIn pages the bot drives.
+
+Serves a login form, paginated job search results, a job details panel and a
+multi-step Easy Apply modal using the same markup the locators in
+EasyApplyBot.locator look for (data-job-id cards, jobs-apply-button,
+jobs-easy-apply-form-section__grouping sections and aria-label buttons).
+Job records are generated deterministically from a seed, or replayed from a
+JSON file of recorded jobs, so every run sees exactly the same pages.
+
+Usage: python3 replay_server.py --port 8000 [--jobs recorded_jobs.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import logging
+import random
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+log = logging.getLogger(__name__)
+
+TITLE_SUFFIXES = ["Analyst", "Engineer", "Scientist", "Specialist", "Manager", "Consultant"]
+TITLE_PREFIXES = ["", "Senior ", "Junior ", "Lead ", "Staff "]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Analytics", "Hooli", "Stark Industries",
+             "Wayne Enterprises", "Soylent", "Vandelay Industries", "Cyberdyne Systems"]
+
+# Body of every /static/ asset: the size of a typical company logo
+STATIC_ASSET = bytes(24 * 1024)
+
+# Set by a login, like LinkedIn's li_at; the HEAD /feed/ session check looks for it
+SESSION_COOKIE = "li_at=replay-session"
+
+# Modal steps every Easy Apply job walks through; "questions" is dropped for quick-apply jobs
+FULL_STEPS = ["contact", "resume", "questions", "review"]
+QUICK_STEPS = ["contact", "resume", "review"]
+
+
+class ReplayFixtures:
+    """Deterministic set of job records served by ReplayServer"""
+
+    def __init__(self, positions=("Data", "Analytics"), pages=3, jobs_per_page=25,
+                 easy_apply_ratio=0.8, applied_ratio=0.1, latency_ms=0, seed=7, jobs=None) -> None:
+        self.jobs_per_page = jobs_per_page
+        self.latency_ms = latency_ms
+        if jobs is not None:
+            self.jobs = jobs
+            return
+
+        rng = random.Random(seed)
+        self.jobs = []
+        for index in range(pages * jobs_per_page):
+            position = positions[index % len(positions)]
+            easy_apply = rng.random() < easy_apply_ratio
+            self.jobs.append({
+                "job_id": str(3900000000 + index * 7919),
+                "title": rng.choice(TITLE_PREFIXES) + position + " " + rng.choice(TITLE_SUFFIXES),
+                "company": rng.choice(COMPANIES),
+                "easy_apply": easy_apply,
+                "applied": rng.random() < applied_ratio,
+                "steps": FULL_STEPS if index % 3 else QUICK_STEPS,
+            })
+
+    @classmethod
+    def from_file(cls, path, jobs_per_page=25, latency_ms=0) -> "ReplayFixtures":
+        """Load recorded job records (a JSON list of job dicts) instead of generating them"""
+        with open(path, 'r', encoding='utf-8') as f:
+            jobs = json.load(f)
+        for job in jobs:
+            job["job_id"] = str(job["job_id"])
+            job.setdefault("easy_apply", True)
+            job.setdefault("applied", False)
+            job.setdefault("steps", FULL_STEPS)
+        return cls(jobs=jobs, jobs_per_page=jobs_per_page, latency_ms=latency_ms)
+
+    def page(self, start) -> list:
+        return self.jobs[start:start + self.jobs_per_page]
+
+    def job(self, job_id) -> dict | None:
+        for job in self.jobs:
+            if job["job_id"] == job_id:
+                return job
+        return None
+
+    @property
+    def easy_apply_count(self) -> int:
+        return sum(1 for job in self.jobs if job["easy_apply"] and not job["applied"])
+
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>LinkedIn Login</title></head>
+<body>
+<div id="organic-div">
+  <form method="post" action="/login">
+    <div><input id="username" name="session_key" type="text"></div>
+    <div><input id="password" name="session_password" type="password"></div>
+    <div><button type="submit" class="btn__primary--large">Sign in</button></div>
+  </form>
+</div>
+</body></html>
+"""
+
+FEED_PAGE = """<!DOCTYPE html>
+<html><head><title>Feed | LinkedIn</title></head>
+<body><main class="scaffold-layout__main"><h1>Feed</h1></main></body></html>
+"""
+
+# Client side of the replay: renders cards, the details panel and the Easy Apply modal
+# from the embedded job records. Every transition is delayed by LATENCY ms to mimic the network.
+APP_SCRIPT = r"""
+const JOBS = __JOBS__;
+const LATENCY = __LATENCY__;
+
+function later(fn) { if (LATENCY > 0) { setTimeout(fn, LATENCY); } else { fn(); } }
+function esc(s) { const d = document.createElement('div'); d.textContent = s; return d.innerHTML; }
+function findJob(id) { return JOBS.find(j => j.job_id === id); }
+
+function renderCards() {
+  const list = document.getElementById('results');
+  if (!JOBS.length) { list.innerHTML = '<div class="jobs-search-no-results-banner">No matching jobs found.</div>'; return; }
+  list.innerHTML = '<ul class="scaffold-layout__list-container">' + JOBS.map(j =>
+    '<li class="jobs-search-results__list-item">' +
+    '<div data-job-id="' + j.job_id + '" class="job-card-container" onclick="showDetails(\'' + j.job_id + '\')">' +
+    '<img class="job-card-list__logo" alt="" src="/static/logos/' + encodeURIComponent(j.company) + '.png">' +
+    '<div class="job-card-list__title">' + esc(j.title) + '</div>' +
+    '<div class="job-card-container__primary-description">' + esc(j.company) + '</div>' +
+    (j.applied ? '<div class="job-card-container__footer-item">Applied</div>' : '') +
+    (j.easy_apply ? '<div class="job-card-container__apply-method">Easy Apply</div>' : '') +
+    '</div></li>').join('') + '</ul>';
+}
+
+function detailsHtml(job) {
+  let button = '<div class="jobs-details-top-card__apply-error">Apply on company website</div>';
+  if (job.easy_apply && !job.applied) {
+    button = '<button id="jobs-apply-button" data-job-id="' + job.job_id + '" ' +
+      'class="jobs-apply-button artdeco-button artdeco-button--primary" ' +
+      'aria-label="Easy Apply to ' + esc(job.title) + ' at ' + esc(job.company) + '" ' +
+      'onclick="openModal(\'' + job.job_id + '\')"><span class="artdeco-button__text">Easy Apply</span></button>';
+  }
+  return '<h2 class="jobs-details-top-card__job-title">' + esc(job.title) + '</h2>' +
+    '<div class="jobs-details-top-card__company-url">' + esc(job.company) + '</div>' + button;
+}
+
+function showDetails(id) {
+  const panel = document.getElementById('details');
+  panel.innerHTML = '<div class="jobs-ghost-fadein-placeholder">Loading...</div>';
+  later(() => { panel.innerHTML = detailsHtml(findJob(id)); });
+}
+
+function grouping(label, inner, required) {
+  return '<div class="jobs-easy-apply-form-section__grouping"' + (required ? ' data-required="true"' : '') + '>' +
+    '<label class="fb-dash-form-element__label">' + label + (required ? ' *' : '') + '</label>' + inner + '</div>';
+}
+
+function radios(name, options) {
+  return '<fieldset>' + options.map((o, i) =>
+    '<div class="fb-text-selectable__option"><input type="radio" id="' + name + i + '" name="' + name + '" value="' + o + '">' +
+    '<label for="' + name + i + '">' + o + '</label></div>').join('') + '</fieldset>';
+}
+
+function stepHtml(step, last) {
+  let body = '';
+  if (step === 'contact') {
+    body = grouping('Mobile phone number', '<input class="artdeco-text-input--input" type="text" value="">', true);
+  } else if (step === 'resume') {
+    body = '<div class="jobs-document-upload"><span>Upload resume</span>' +
+      '<input type="file" name="file" id="jobs-document-upload-file-input-upload-resume"></div>';
+  } else if (step === 'questions') {
+    body = grouping('How many years of experience do you have with SQL?',
+                    '<input class="artdeco-text-input--input" type="text" value="">', true) +
+      grouping('Are you legally authorized to work in this country?', radios('auth', ['Yes', 'No']), true) +
+      grouping('Will you now or in the future require visa sponsorship?', radios('visa', ['Yes', 'No']), true);
+  } else if (step === 'review') {
+    body = '<h3>Review your application</h3>' +
+      '<input type="checkbox" id="follow-company-checkbox" checked>' +
+      '<label for="follow-company-checkbox">Follow company</label>';
+  }
+  let button;
+  if (step === 'review') {
+    button = '<button class="artdeco-button--primary" aria-label="Submit application" onclick="submitApplication()">Submit application</button>';
+  } else if (last) {
+    button = '<button class="artdeco-button--primary" aria-label="Review your application" onclick="advance()">Review</button>';
+  } else {
+    button = '<button class="artdeco-button--primary" aria-label="Continue to next step" onclick="advance()">Next</button>';
+  }
+  return '<div class="jobs-easy-apply-content">' + body + '</div><footer>' + button + '</footer>';
+}
+
+let modalJob = null, modalStep = 0, submitted = false;
+
+function renderStep() {
+  const steps = modalJob.steps;
+  const last = modalStep === steps.length - 2;
+  document.getElementById('modal-body').innerHTML = stepHtml(steps[modalStep], last);
+}
+
+function openModal(id) {
+  modalJob = findJob(id); modalStep = 0; submitted = false;
+  later(() => {
+    const modal = document.createElement('div');
+    modal.id = 'modal';
+    modal.className = 'artdeco-modal jobs-easy-apply-modal';
+    modal.setAttribute('role', 'dialog');
+    modal.innerHTML = '<button aria-label="Dismiss" data-test-modal-close-btn class="artdeco-modal__dismiss" onclick="dismiss()">X</button>' +
+      '<div id="modal-body"></div>';
+    document.body.appendChild(modal);
+    renderStep();
+  });
+}
+
+function validate() {
+  let ok = true;
+  document.querySelectorAll('#modal .jobs-easy-apply-form-section__grouping[data-required]').forEach(section => {
+    const old = section.querySelector('.artdeco-inline-feedback__message');
+    if (old) { old.remove(); }
+    const text = section.querySelector('input[type=text], textarea');
+    const radio = section.querySelectorAll('input[type=radio]');
+    const filled = text ? text.value.trim() !== '' : Array.from(radio).some(r => r.checked);
+    if (!filled) {
+      ok = false;
+      section.insertAdjacentHTML('beforeend', '<span class="artdeco-inline-feedback__message">Please enter a valid answer</span>');
+    }
+  });
+  return ok;
+}
+
+// Like the real form, a field's error message goes away as soon as it is answered
+function clearFeedback(event) {
+  const section = event.target.closest('.jobs-easy-apply-form-section__grouping');
+  const message = section ? section.querySelector('.artdeco-inline-feedback__message') : null;
+  if (message) { message.remove(); }
+}
+document.addEventListener('input', clearFeedback, true);
+document.addEventListener('change', clearFeedback, true);
+
+function advance() {
+  if (!validate()) { return; }
+  later(() => { modalStep += 1; renderStep(); });
+}
+
+function submitApplication() {
+  later(() => {
+    submitted = true;
+    modalJob.applied = true;
+    document.getElementById('modal-body').innerHTML =
+      '<h3 class="jobs-post-apply__title">Your application was sent to ' + esc(modalJob.company) + '!</h3>';
+  });
+}
+
+function closeModal() {
+  const modal = document.getElementById('modal');
+  if (modal) { modal.remove(); }
+  const dialog = document.getElementById('discard-dialog');
+  if (dialog) { dialog.remove(); }
+}
+
+function dismiss() {
+  if (submitted) { closeModal(); return; }
+  const dialog = document.createElement('div');
+  dialog.id = 'discard-dialog';
+  dialog.setAttribute('role', 'alertdialog');
+  dialog.innerHTML = '<p>Discard application?</p><button data-test-dialog-primary-btn onclick="closeModal()">Discard</button>';
+  document.body.appendChild(dialog);
+}
+"""
+
+SEARCH_PAGE = """<!DOCTYPE html>
+<html><head><title>__TITLE__ | LinkedIn</title>
+<style>
+  .jobs-search-results-list { float: left; width: 40%; height: 600px; overflow-y: auto; }
+  .job-card-container { height: 120px; border-bottom: 1px solid #ccc; cursor: pointer; }
+  #details { float: left; width: 55%; padding-left: 2%; }
+  #modal { position: fixed; top: 10%; left: 20%; width: 60%; background: #fff; border: 1px solid #000; padding: 16px; }
+  #discard-dialog { position: fixed; top: 30%; left: 35%; background: #fff; border: 1px solid #000; padding: 16px; z-index: 10; }
+</style>
+</head>
+<body>
+<main class="scaffold-layout__main">
+  <div class="jobs-search-results-list" id="results"></div>
+  <div class="jobs-search__job-details" id="details"></div>
+</main>
+<script>__SCRIPT__</script>
+<script>renderCards();__ONLOAD__</script>
+</body></html>
+"""
+
+
+def render_search_page(jobs, latency_ms, title="Jobs", onload="") -> str:
+    script = (APP_SCRIPT.replace("__JOBS__", json.dumps(jobs).replace("</", "<\\/"))
+              .replace("__LATENCY__", str(int(latency_ms))))
+    return (SEARCH_PAGE.replace("__TITLE__", html.escape(title))
+            .replace("__SCRIPT__", script)
+            .replace("__ONLOAD__", onload))
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    fixtures: ReplayFixtures = None
+    requests: Counter = None
+
+    def log_message(self, format, *args) -> None:
+        log.debug("replay: " + format % args)
+
+    def _send(self, body, status=200, content_type="text/html; charset=utf-8") -> None:
+        self._send_bytes(body.encode("utf-8"), content_type, status)
+
+    def _send_bytes(self, payload, content_type, status=200) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        self.requests[url.path] += 1
+        query = parse_qs(url.query)
+
+        if url.path.startswith("/login"):
+            self._send(LOGIN_PAGE)
+        elif url.path.startswith("/feed"):
+            self._send(FEED_PAGE)
+        elif url.path.startswith("/jobs/search"):
+            try:
+                start = int(query.get("start", ["0"])[0])
+            except ValueError:
+                start = 0
+            jobs = self.fixtures.page(start)
+            self._send(render_search_page(jobs, self.fixtures.latency_ms, title="Search"))
+        elif url.path.startswith("/jobs/view/"):
+            job = self.fixtures.job(url.path.rstrip("/").rsplit("/", 1)[-1])
+            if job is None:
+                self._send("<html><body>Job not found</body></html>", status=404)
+            else:
+                onload = "document.getElementById('details').innerHTML = detailsHtml(JOBS[0]);"
+                self._send(render_search_page([job], 0, title=job["title"], onload=onload))
+        elif url.path.startswith("/static/"):
+            # Stand-in for LinkedIn's logos and images, so request blocking has something to save
+            self._send_bytes(STATIC_ASSET, "image/png")
+        elif url.path == "/robots.txt":
+            self._send("User-agent: *\n", content_type="text/plain")
+        elif url.path == "/fixtures.json":
+            self._send(json.dumps(self.fixtures.jobs), content_type="application/json")
+        else:
+            self._send("<html><body>Not found</body></html>", status=404)
+
+    def do_HEAD(self) -> None:
+        # The bot's session check: signed in when the feed answers without sending it to the login page
+        url = urlparse(self.path)
+        self.requests["HEAD " + url.path] += 1
+        signed_in = SESSION_COOKIE in (self.headers.get("Cookie") or "")
+        self.send_response(200 if signed_in or not url.path.startswith("/feed") else 303)
+        if not signed_in and url.path.startswith("/feed"):
+            self.send_header("Location", "/login")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        self.requests[url.path] += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if url.path.startswith("/login"):
+            self.send_response(303)
+            self.send_header("Location", "/feed/")
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}; Path=/; Max-Age=86400")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._send("<html><body>Not found</body></html>", status=404)
+
+
+class ReplayServer:
+    """Serves ReplayFixtures over HTTP from a background thread"""
+
+    def __init__(self, fixtures=None, host="127.0.0.1", port=0) -> None:
+        self.fixtures = fixtures if fixtures is not None else ReplayFixtures()
+        self.requests = Counter()
+        handler = type("ReplayHandler", (_ReplayHandler,), {"fixtures": self.fixtures, "requests": self.requests})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="replay-server", daemon=True)
+        self.thread.start()
+        log.info(f"Replay server listening on {self.url}")
+        return self.url
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self) -> "ReplayServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve offline LinkedIn fixtures for the Easy Apply bot")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--jobs", help="JSON file of recorded job records to replay")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--jobs-per-page", type=int, default=25)
+    parser.add_argument("--latency-ms", type=int, default=0, help="simulated delay for every page transition")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.jobs:
+        fixtures = ReplayFixtures.from_file(args.jobs, args.jobs_per_page, args.latency_ms)
+    else:
+        fixtures = ReplayFixtures(pages=args.pages, jobs_per_page=args.jobs_per_page,
+                                  latency_ms=args.latency_ms, seed=args.seed)
+    server = ReplayServer(fixtures, args.host, args.port)
+    print(f"Serving {len(fixtures.jobs)} jobs on {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,15 @@ LinkedIn Easy Apply Bot Launcher
 This script checks prerequisites and launches the bot safely.
 """
 
+import argparse
+import contextlib
 import os
 import sys
 import yaml
 from pathlib import Path
 
+from profiling import RunProfiler, add_profile_arguments
+
 def check_prerequisites():
     """Check if all prerequisites are met."""
     print("🔍 Checking prerequisites...")
@@ -53,6 +57,10 @@ def check_prerequisites():
 
 def main():
     """Main launcher function."""
+    parser = argparse.ArgumentParser(description="Check prerequisites and launch the LinkedIn Easy Apply bot")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
     print("=" * 60)
     print("LinkedIn Easy Apply Bot Launcher")
     print("=" * 60)
@@ -89,22 +97,44 @@ def main():
         with open("config.yaml", 'r') as stream:
             parameters = yaml.safe_load(stream)
         
-        # Create bot instance
-        bot = EasyApplyBot(
-            parameters['username'],
-            parameters['password'],
-            parameters['phone_number'],
-            parameters['salary'],
-            parameters['rate'],
-            uploads=parameters.get('uploads', {}),
-            filename=parameters.get('output_filename', ['output.csv'])[0],
-            blacklist=parameters.get('blacklist', []),
-            blackListTitles=parameters.get('blackListTitles', []),
-            experience_level=parameters.get('experience_level', [])
-        )
+        # Profile the whole run, bot startup included, when --profile is given
+        profiler = RunProfiler.from_args(args) if args.profile else contextlib.nullcontext()
+        with profiler:
+            # Create bot instance
+            bot = EasyApplyBot(
+                parameters['username'],
+                parameters['password'],
+                parameters['phone_number'],
+                parameters['salary'],
+                parameters['rate'],
+                uploads=parameters.get('uploads', {}),
+                filename=parameters.get('output_filename', ['output.csv'])[0],
+                blacklist=parameters.get('blacklist', []),
+                blackListTitles=parameters.get('blackListTitles', []),
+                experience_level=parameters.get('experience_level', []),
+                history_days=parameters.get('history_days', 2),
+                scroll_steps=parameters.get('scroll_steps', 30),
+                scroll_timeout=parameters.get('scroll_timeout', 10),
+                discovery_worker=parameters.get('discovery_worker', False),
+                search_budget_minutes=parameters.get('search_budget_minutes'),
+                audit_commands=parameters.get('audit_commands', False),
+                profile_path=parameters.get('profile_path'),
+                reuse_session=parameters.get('reuse_session', True),
+                headless=parameters.get('headless', False),
+                block_resources=parameters.get('block_resources') or [],
+                block_urls=parameters.get('block_urls') or [],
+                network_stats=parameters.get('network_stats', False),
+                memory_limit_mb=parameters.get('memory_limit_mb'),
+                recycle_jobs=parameters.get('recycle_jobs', 0)
+            )
+        
+            if args.profile:
+                profiler.watch(bot)
+
+            # Start applying; leaving the block (also on Ctrl+C) flushes pending writes and quits Chrome
+            with bot:
+                bot.start_apply(parameters['positions'], parameters['locations'])
         
-        # Start applying
-        bot.start_apply(parameters['positions'], parameters['locations'])
         
     except KeyboardInterrupt:
         print("\n\n⏹️  Bot stopped by user.")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Summarize the phase timing events of a bot run.
+
+Reads the JSON lines the bot writes next to its output CSV
+(output_events.jsonl) and prints throughput, latency percentiles per phase
+and the slowest jobs with where their time went. Runs made with
+audit_commands also get WebDriver commands per job, page source bytes and
+the slowest call sites. Runs with the browser watchdog get memory over time
+and the browser recycles.
+
+Usage: python3 run_report.py output_events.jsonl [--run RUN_ID] [--top 10] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+from metrics import summarize
+
+
+def load_events(path, run=None) -> list:
+    """Events of one run from a JSONL file; the most recent run unless run is given"""
+    events = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+    if not events:
+        return []
+    if run is None:
+        run = max(events, key=lambda event: event.get("ts", 0)).get("run")
+    return [event for event in events if event.get("run") == run]
+
+
+def summarize_run(events, top=10) -> dict:
+    if not events:
+        return {}
+    audits = [event for event in events if event["phase"] == "webdriver_audit"]
+    events = [event for event in events if event["phase"] != "webdriver_audit"]
+    if not events:
+        return {}
+    started = min(event["ts"] - event["seconds"] for event in events)
+    finished = max(event["ts"] for event in events)
+    wall = max(finished - started, 1e-9)
+
+    durations = defaultdict(list)
+    by_job = defaultdict(lambda: defaultdict(float))
+    for event in events:
+        durations[event["phase"]].append(event["seconds"])
+        if event.get("job_id") is not None and event["phase"] != "apply_job":
+            by_job[event["job_id"]][event["phase"]] += event["seconds"]
+
+    jobs = [event for event in events if event["phase"] == "apply_job"]
+    applied = sum(1 for event in jobs if event.get("result") is True)
+
+    phases = {}
+    for name, values in durations.items():
+        stats = summarize(values)
+        stats["total"] = sum(values)
+        stats["share"] = stats["total"] / wall
+        phases[name] = {key: round(value, 3) for key, value in stats.items()}
+
+    slowest = []
+    for event in sorted(jobs, key=lambda event: event["seconds"], reverse=True)[:top]:
+        breakdown = sorted(by_job[event["job_id"]].items(), key=lambda item: item[1], reverse=True)
+        slowest.append({
+            "job_id": event["job_id"],
+            "combo": event.get("combo"),
+            "seconds": event["seconds"],
+            "result": event.get("result"),
+            "commands": event.get("commands"),
+            "phases": {name: round(seconds, 3) for name, seconds in breakdown[:4]},
+        })
+
+    commands = {}
+    audited = [event for event in jobs if "commands" in event]
+    if audited:
+        commands = {
+            "per_job": {key: round(value, 1) for key, value in summarize([event["commands"] for event in audited]).items()},
+            "job_page_source_bytes": sum(event.get("page_source_bytes", 0) for event in audited),
+        }
+        if audits:
+            audit = max(audits, key=lambda event: event["ts"])
+            commands.update(total=audit["commands"], page_source_bytes=audit["page_source_bytes"],
+                            slowest_sites=audit["slowest_sites"][:top])
+
+    memory = []
+    for event in events:
+        if event["phase"] == "memory_sample" and "chrome_mb" in event:
+            memory.append({"minute": round((event["ts"] - started) / 60, 1), "chrome_mb": event["chrome_mb"],
+                           "driver_mb": event["driver_mb"], "python_mb": event["python_mb"]})
+    recycles = [event.get("reason") for event in events if event["phase"] == "recycle_browser"]
+
+    return {
+        "run": events[0].get("run"),
+        "wall_seconds": round(wall, 1),
+        "jobs": len(jobs),
+        "applied": applied,
+        "jobs_per_minute": round(len(jobs) / wall * 60, 2),
+        "applications_per_minute": round(applied / wall * 60, 2),
+        "phases": phases,
+        "slowest_jobs": slowest,
+        "commands": commands,
+        "memory": memory,
+        "recycles": recycles,
+    }
+
+
+def print_summary(summary) -> None:
+    print("=" * 72)
+    print(f"Run {summary['run']}")
+    print("=" * 72)
+    print(f"Wall time   : {summary['wall_seconds'] / 60:.1f} minutes")
+    print(f"Jobs        : {summary['jobs']} opened, {summary['applied']} applied")
+    print(f"Throughput  : {summary['jobs_per_minute']:.2f} jobs/minute, "
+          f"{summary['applications_per_minute']:.2f} applications/minute")
+    print()
+    print(f"{'phase':<20} {'count':>6} {'total':>9} {'share':>6} {'p50':>8} {'p95':>8} {'max':>8}")
+    for name, stats in sorted(summary["phases"].items(), key=lambda item: item[1]["total"], reverse=True):
+        print(f"{name:<20} {stats['count']:>6} {stats['total']:>8.1f}s {stats['share']:>6.0%} "
+              f"{stats['p50']:>7.2f}s {stats['p95']:>7.2f}s {stats['max']:>7.2f}s")
+    if summary["slowest_jobs"]:
+        print()
+        print("Slowest jobs:")
+        for job in summary["slowest_jobs"]:
+            breakdown = [f"{name} {seconds:.1f}s" for name, seconds in job["phases"].items()]
+            if job.get("commands") is not None:
+                breakdown.append(f"{job['commands']} commands")
+            print(f"  {job['job_id']:<12} {job['seconds']:>6.1f}s  {'applied' if job['result'] else 'not applied':<11} "
+                  f"{job['combo'] or ''}  ({', '.join(breakdown)})")
+    if summary.get("memory"):
+        print_memory(summary["memory"], summary["recycles"])
+    commands = summary.get("commands")
+    if commands:
+        per_job = commands["per_job"]
+        print()
+        print(f"WebDriver commands per job: p50 {per_job['p50']:.0f}  p95 {per_job['p95']:.0f}  max {per_job['max']:.0f}")
+        print(f"Page source transferred   : {commands['job_page_source_bytes'] / 1024:.0f} KiB while applying"
+              + (f", {commands['page_source_bytes'] / 1024:.0f} KiB in total" if "page_source_bytes" in commands else ""))
+        if commands.get("slowest_sites"):
+            print("Slowest call sites:")
+            for site in commands["slowest_sites"]:
+                print(f"  {site['site']:<32} {site['count']:>6} commands  {site['seconds']:>7.2f}s  max {site['max']:.3f}s")
+
+
+def print_memory(memory, recycles, points=12) -> None:
+    """Browser and Python memory at up to points evenly spaced samples, plus the peak"""
+    print()
+    print(f"Memory over time ({len(memory)} samples, {len(recycles)} browser recycles):")
+    print(f"  {'minute':>7} {'chrome':>9} {'driver':>9} {'python':>9}")
+    step = max(1, -(-len(memory) // points))
+    shown = memory[::step]
+    if shown[-1] is not memory[-1]:
+        shown.append(memory[-1])
+    for sample in shown:
+        print(f"  {sample['minute']:>7.1f} {sample['chrome_mb']:>7.0f}MB {sample['driver_mb']:>7.0f}MB {sample['python_mb']:>7.0f}MB")
+    peak = max(memory, key=lambda sample: sample["chrome_mb"])
+    print(f"  peak Chrome {peak['chrome_mb']:.0f}MB at minute {peak['minute']:.1f}")
+    for reason in recycles:
+        print(f"  recycled: {reason}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Summarize the phase timings of a bot run")
+    parser.add_argument("events", help="events file written by the bot, e.g. output_events.jsonl")
+    parser.add_argument("--run", help="run ID to report on (default: the most recent run)")
+    parser.add_argument("--top", type=int, default=10, help="how many of the slowest jobs to list")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args()
+
+    summary = summarize_run(load_events(args.events, args.run), top=args.top)
+    if not summary:
+        print(f"No events found in {args.events}", file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Order and time budget for the position/location search combos.
+
+Every combo is searched once, in a deterministic order: the ones that sent
+the most applications per minute in earlier runs go first. One global time
+budget is split across them, weighted by that yield, and whatever a combo
+does not use (because it ran out of new matches) is shared by the rest.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class ComboScheduler:
+    """
+    Iterate (position, location, seconds) for every combo, best past yield first.
+
+    yields maps (position, location) to (applications, minutes) from earlier
+    runs. Combos without history are assumed to do as well as the average
+    known combo. Each combo is guaranteed MIN_SHARE of an even split of the
+    remaining budget; the rest is divided by yield. Call spent() with the
+    seconds a combo actually used before asking for the next one.
+    """
+
+    MIN_SHARE = 0.25
+
+    def __init__(self, positions, locations, yields, budget) -> None:
+        self.combos = list(dict.fromkeys(itertools.product(positions, locations)))
+        known = {combo: applied / minutes for combo, (applied, minutes) in (yields or {}).items()
+                 if combo in self.combos and minutes > 0}
+        prior = sum(known.values()) / len(known) if known else 1.0
+        self.rates = {combo: known.get(combo, prior) for combo in self.combos}
+        # sorted() is stable, so combos with equal yield keep the positions x locations order
+        self.order = sorted(self.combos, key=lambda combo: -self.rates[combo])
+        self.remaining = float(budget)
+
+    def __len__(self) -> int:
+        return len(self.combos)
+
+    def __iter__(self):
+        for index, (position, location) in enumerate(self.order):
+            if self.remaining <= 0:
+                log.info(f"Search budget used up, skipping {len(self.order) - index} remaining combos")
+                return
+            yield position, location, self.allocate((position, location), self.order[index:])
+
+    def allocate(self, combo, pending) -> float:
+        """Seconds for combo out of the remaining budget, given the combos still to run (combo included)"""
+        even = self.remaining / len(pending)
+        total_rate = sum(self.rates[other] for other in pending)
+        if total_rate <= 0:
+            return even
+        floor = even * self.MIN_SHARE
+        spare = self.remaining - floor * len(pending)
+        return floor + spare * self.rates[combo] / total_rate
+
+    def spent(self, seconds) -> None:
+        self.remaining = max(0.0, self.remaining - seconds)
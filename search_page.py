@@ -0,0 +1,152 @@
+"""
+Loading the job search results page.
+
+The page is scrolled from inside the browser until the number of job cards
+stops growing, in a single execute_async_script call. The HTML is only
+pulled and parsed if somebody actually asks for it. Job cards are harvested
+from the results list in batches while it is still being scrolled.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from page_scripts import PARSE_CARD
+
+log = logging.getLogger(__name__)
+
+# Scrolls the window stepPx at a time, waiting stepMs after each step, until the
+# number of job cards has not grown for stableSteps steps or maxPx is reached.
+# Resolves with {steps, cards, height}.
+SCROLL_UNTIL_STABLE = r"""
+var stepPx = arguments[0], maxPx = arguments[1], stepMs = arguments[2], stableSteps = arguments[3];
+var done = arguments[arguments.length - 1];
+var y = 0, steps = 0, stable = 0;
+var count = document.querySelectorAll('div[data-job-id]').length;
+function step() {
+    window.scrollTo(0, y);
+    steps += 1;
+    setTimeout(function () {
+        var now = document.querySelectorAll('div[data-job-id]').length;
+        stable = now > count ? 0 : stable + 1;
+        count = now;
+        y += stepPx;
+        if (stable >= stableSteps || y >= maxPx) {
+            done({steps: steps, cards: count, height: document.body ? document.body.scrollHeight : 0});
+            return;
+        }
+        step();
+    }, stepMs);
+}
+step();
+"""
+
+# Scrolls the results list (arguments[0]) and collects cards it has not returned before.
+# Resolves as soon as batchSize new cards are collected or the scroll is finished, keeping
+# its position in window.__eabHarvest so the next call carries on where this one stopped.
+# The scroll is finished once the list is at the bottom and no new card appeared for
+# stableSteps steps, or after maxSteps steps. Cards still rendered as empty placeholders
+# are left for a later batch. Resolves with {cards, finished, steps}; cards have the
+# same fields as page_scripts.JOB_CARDS.
+HARVEST_CARDS = PARSE_CARD + r"""
+var selector = arguments[0], stepPx = arguments[1], stepMs = arguments[2], maxSteps = arguments[3];
+var stableSteps = arguments[4], batchSize = arguments[5], reset = arguments[6];
+var done = arguments[arguments.length - 1];
+var h = window.__eabHarvest;
+if (reset || !h) { h = window.__eabHarvest = {seen: {}, y: 0, steps: 0, stable: 0, finished: false}; }
+var list = document.querySelector(selector);
+var batch = [];
+function collect() {
+    var fresh = 0;
+    document.querySelectorAll('div[data-job-id]').forEach(function (card) {
+        var id = card.getAttribute('data-job-id');
+        if (!id || h.seen[id]) { return; }
+        var parsed = parseCard(card);
+        if (!parsed.title) { return; }
+        h.seen[id] = true;
+        fresh += 1;
+        batch.push(parsed);
+    });
+    return fresh;
+}
+function finish() { done({cards: batch, finished: h.finished, steps: h.steps}); }
+collect();
+if (!list) { h.finished = true; }
+function step() {
+    if (h.finished || batch.length >= batchSize) { finish(); return; }
+    h.y += stepPx;
+    h.steps += 1;
+    list.scrollTo(0, h.y);
+    setTimeout(function () {
+        var atBottom = list.scrollTop + list.clientHeight >= list.scrollHeight - 2;
+        h.stable = collect() ? 0 : h.stable + 1;
+        if ((atBottom && h.stable >= stableSteps) || h.steps >= maxSteps) { h.finished = true; }
+        step();
+    }, stepMs);
+}
+step();
+"""
+
+
+def harvest_cards(browser, selector, step_px=200, step_ms=50, max_steps=30, stable_steps=3,
+                  batch_size=10, timeout=10.0):
+    """
+    Scroll the results list matching selector and yield lists of new job cards as they render.
+    Stops when the list is fully scrolled, after max_steps scroll steps or after timeout seconds.
+    """
+    started = time.perf_counter()
+    reset = True
+    while True:
+        remaining = timeout - (time.perf_counter() - started)
+        if remaining <= 0:
+            log.debug(f"Card harvest stopped after {timeout}s")
+            return
+        browser.set_script_timeout(remaining + 2)
+        result = browser.execute_async_script(HARVEST_CARDS, selector, step_px, step_ms, max_steps,
+                                              stable_steps, batch_size, reset) or {}
+        reset = False
+        if result.get("cards"):
+            yield result["cards"]
+        if result.get("finished", True):
+            log.debug(f"Card harvest finished after {result.get('steps', 0)} scroll steps")
+            return
+
+
+class LazyPage:
+    """
+    The page as it was after load_page, parsed only on first use.
+
+    source pulls page_source once; soup builds the BeautifulSoup tree from it.
+    Any other attribute is looked up on the soup, so callers can keep treating
+    the result of load_page as a BeautifulSoup object.
+    """
+
+    def __init__(self, browser) -> None:
+        self._browser = browser
+        self._source = None
+        self._soup = None
+
+    @property
+    def parsed(self) -> bool:
+        return self._soup is not None
+
+    @property
+    def source(self) -> str:
+        if self._source is None:
+            self._source = self._browser.page_source
+        return self._source
+
+    @property
+    def soup(self):
+        if self._soup is None:
+            from bs4 import BeautifulSoup
+            started = time.perf_counter()
+            self._soup = BeautifulSoup(self.source, "lxml")
+            log.debug(f"Parsed page source in {(time.perf_counter() - started) * 1000:.0f}ms")
+        return self._soup
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.soup, name)
@@ -0,0 +1,238 @@
+"""
+Compact index of every job the bot has already dealt with.
+
+LinkedIn job IDs are integers, so the index is a file of sorted int64
+records memory-mapped at startup: opening it costs nothing however many
+jobs it holds, and a lookup is a binary search over the mapped pages. Jobs
+seen during the run are kept in a small dict and merged into the file by
+flush().
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+from array import array
+from datetime import date, datetime
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+APPLIED = 1  # application sent
+FAILED = 2  # opened but not sent: no Easy Apply button, errors, discarded
+BLACKLISTED = 3  # company or title blacklisted
+SKIPPED = 4  # not relevant to the searched positions
+
+STATUS_NAMES = {APPLIED: "applied", FAILED: "failed", BLACKLISTED: "blacklisted", SKIPPED: "skipped"}
+
+# Blacklisted and skipped jobs depend on the config, so they only count for the generation they were recorded in
+CONFIG_DEPENDENT = (BLACKLISTED, SKIPPED)
+
+_MAGIC = b"EABSEEN1"
+_HEADER = struct.Struct("<8sq")  # magic, generation
+_EPOCH = date(2020, 1, 1)
+
+# record = job ID << 20 | day << 4 | status, so sorting records sorts by job ID
+_ID_SHIFT = 20
+_DAY_SHIFT = 4
+
+
+def _pack(job_id, day, status) -> int:
+    return (job_id << _ID_SHIFT) | (day << _DAY_SHIFT) | status
+
+
+def _unpack(record):
+    return record >> _ID_SHIFT, (record >> _DAY_SHIFT) & 0xFFFF, record & 0xF
+
+
+def _day(when=None) -> int:
+    when = when or date.today()
+    return max(0, min(0xFFFF, (when - _EPOCH).days))
+
+
+class SeenJobIndex:
+    """
+    Memory-mapped set of job IDs with the status and day each was last seen.
+
+    skip_reason(jobID) says why a job can be skipped without touching the
+    browser: applied jobs are never retried, failed ones are retried after
+    retry_days, and blacklisted/skipped ones only count while the generation
+    set by set_generation() (a hash of the filter config) is unchanged.
+    """
+
+    def __init__(self, path="seen_jobs.idx", retry_days=2) -> None:
+        self.path = Path(path)
+        self.retry_days = retry_days
+        self.lock = threading.Lock()
+        self.pending = {}  # job ID -> record, seen this run and not flushed yet
+        self.generation = 0
+        self.file_generation = 0
+        self._file = None
+        self._mmap = None
+        self._records = memoryview(b"").cast("q")
+        self._open()
+
+    def _open(self) -> None:
+        self._close_map()
+        if not self.path.is_file() or self.path.stat().st_size < _HEADER.size:
+            return
+        try:
+            self._file = open(self.path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self.file_generation = _HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC:
+                raise ValueError("not a seen-job index")
+            count = (len(self._mmap) - _HEADER.size) // 8
+            self._records = memoryview(self._mmap)[_HEADER.size:_HEADER.size + count * 8].cast("q")
+            log.info(f"Seen-job index: {count} jobs in {self.path}")
+        except Exception as e:
+            log.error(f"Ignoring unreadable seen-job index {self.path}: {e}")
+            self._close_map()
+
+    def _close_map(self) -> None:
+        self._records.release()
+        self._records = memoryview(b"").cast("q")
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._records) + len(self.pending)
+
+    @property
+    def empty(self) -> bool:
+        return not len(self)
+
+    def set_generation(self, *inputs) -> None:
+        """Hash of the filter config (blacklists, positions, ...) that blacklisted/skipped entries depend on"""
+        digest = hashlib.sha1(repr(inputs).encode("utf-8")).digest()
+        self.generation = int.from_bytes(digest[:8], "little", signed=True)
+
+    def lookup(self, jobID):
+        """(status, day) of the last time jobID was seen, or None"""
+        try:
+            job_id = int(jobID)
+        except (TypeError, ValueError):
+            return None
+        # flush() remaps the file under the same lock, so the records can't be released mid-search
+        with self.lock:
+            return self._lookup(job_id)
+
+    def _lookup(self, job_id):
+        record = self.pending.get(job_id)
+        if record is None:
+            records = self._records
+            # The last record inside [job_id << 20, (job_id + 1) << 20) is the latest one for this job
+            index = bisect.bisect_left(records, (job_id + 1) << _ID_SHIFT) - 1
+            if index < 0 or records[index] >> _ID_SHIFT != job_id:
+                return None
+            record = records[index]
+            _, day, status = _unpack(record)
+            if status in CONFIG_DEPENDENT and self.file_generation != self.generation:
+                return None
+            return status, day
+        _, day, status = _unpack(record)
+        return status, day
+
+    def skip_reason(self, jobID):
+        """Name of the status that lets the card filter skip jobID, or None"""
+        seen = self.lookup(jobID)
+        if seen is None:
+            return None
+        status, day = seen
+        if status == FAILED and _day() - day >= self.retry_days:
+            return None
+        return STATUS_NAMES[status]
+
+    def add(self, jobID, status, when=None) -> None:
+        try:
+            job_id = int(jobID)
+        except (TypeError, ValueError):
+            return
+        with self.lock:
+            self.pending[job_id] = _pack(job_id, _day(when), status)
+
+    def seed(self, attempts) -> int:
+        """Fill a new index from (jobID, timestamp, result) history rows. Returns how many were added"""
+        added = 0
+        for jobID, timestamp, result in attempts:
+            try:
+                when = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").date()
+            except (TypeError, ValueError):
+                continue
+            self.add(jobID, APPLIED if result else FAILED, when)
+            added += 1
+        return added
+
+    def _merged(self, pending):
+        """Records of the file and pending merged in order, one per job ID (pending wins)"""
+        keep_config = self.file_generation == self.generation
+        records = self._records
+        i = 0
+        for job_id in sorted(pending):
+            # Copy every file record before this job ID
+            end = bisect.bisect_left(records, job_id << _ID_SHIFT, i)
+            yield from self._file_records(i, end, keep_config)
+            i = bisect.bisect_left(records, (job_id + 1) << _ID_SHIFT, end)
+            yield pending[job_id]
+        yield from self._file_records(i, len(records), keep_config)
+
+    def _file_records(self, start, end, keep_config):
+        records = self._records
+        for index in range(start, end):
+            record = records[index]
+            # Drop superseded records of the same job, and blacklisted/skipped ones from another config
+            if index + 1 < end and records[index + 1] >> _ID_SHIFT == record >> _ID_SHIFT:
+                continue
+            if not keep_config and record & 0xF in CONFIG_DEPENDENT:
+                continue
+            yield record
+
+    def flush(self) -> None:
+        """Merge the jobs seen this run into the file, written atomically"""
+        with self.lock:
+            if not self.pending and self.file_generation == self.generation:
+                return
+            pending, self.pending = self.pending, {}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        count = 0
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, self.generation))
+                chunk = array("q")
+                for record in self._merged(pending):
+                    chunk.append(record)
+                    if len(chunk) >= 65536:
+                        chunk.tofile(f)
+                        count += len(chunk)
+                        chunk = array("q")
+                chunk.tofile(f)
+                count += len(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+            with self.lock:
+                self._close_map()
+                try:
+                    os.replace(tmp, self.path)
+                finally:
+                    self._open()
+            log.debug(f"Seen-job index flushed: {count} jobs")
+        except Exception as e:
+            log.error(f"Could not write seen-job index {self.path}: {e}")
+            with self.lock:
+                pending.update(self.pending)
+                self.pending = pending
+
+    def close(self) -> None:
+        self.flush()
+        with self.lock:
+            self._close_map()
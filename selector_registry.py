@@ -0,0 +1,164 @@
+"""
+Central registry for the bot's selector fallback chains.
+
+Each logical target (the Easy Apply button, the modal close button, ...) has
+a list of candidate locators. The registry tries the candidate that won most
+recently first, then the others by how often they have succeeded, and keeps
+per-selector hit counts and latency in SQLite so the ordering survives
+between runs and a LinkedIn DOM change shows up as a falling hit rate.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from storage import connect
+
+log = logging.getLogger(__name__)
+
+
+class SelectorRegistry:
+    """
+    Success-ordered fallback chains with persisted health stats.
+
+    register(target, candidates) takes a list of (locator, check) pairs, where
+    check is None or a callable(element, *args) -> bool that a matching element
+    must also pass. find(target, *args) returns the first accepted element, or
+    None, and records which candidate produced it.
+    """
+
+    def __init__(self, browser, path="selectors.db") -> None:
+        self.browser = browser
+        self.path = path
+        self.candidates = {}  # target -> [(label, locator, check)] in registration order
+        self.stats = {}  # (target, label) -> {"hits", "misses", "total_ms", "last_win"}
+        self._loaded = False
+        self._dirty = False
+
+    def _connection(self):
+        conn = connect(self.path)
+        conn.execute("""CREATE TABLE IF NOT EXISTS selector_stats (
+                            target TEXT NOT NULL,
+                            selector TEXT NOT NULL,
+                            hits INTEGER NOT NULL DEFAULT 0,
+                            misses INTEGER NOT NULL DEFAULT 0,
+                            total_ms REAL NOT NULL DEFAULT 0,
+                            last_win REAL NOT NULL DEFAULT 0,
+                            PRIMARY KEY (target, selector))""")
+        return conn
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            conn = self._connection()
+            try:
+                for target, label, hits, misses, total_ms, last_win in conn.execute(
+                        "SELECT target, selector, hits, misses, total_ms, last_win FROM selector_stats"):
+                    self.stats[(target, label)] = {"hits": hits, "misses": misses,
+                                                   "total_ms": total_ms, "last_win": last_win}
+            finally:
+                conn.close()
+        except Exception as e:
+            log.debug(f"Could not load selector stats from {self.path}: {e}")
+
+    def _entry(self, target, label) -> dict:
+        return self.stats.setdefault((target, label), {"hits": 0, "misses": 0, "total_ms": 0.0, "last_win": 0.0})
+
+    def register(self, target, candidates) -> None:
+        if not self._loaded:
+            self._load()
+        self.candidates[target] = [(f"{locator[0]}={locator[1]}", locator, check) for locator, check in candidates]
+
+    def order(self, target) -> list:
+        """Candidates for target: most recent winner first, then by hits, then registration order"""
+        entries = self.candidates.get(target, [])
+
+        def rank(item):
+            position, (label, _, _) = item
+            entry = self.stats.get((target, label), {})
+            return -entry.get("last_win", 0.0), -entry.get("hits", 0), position
+
+        return [candidate for _, candidate in sorted(enumerate(entries), key=rank)]
+
+    def find(self, target, *args, expected=True):
+        """
+        First element accepted by a candidate of target, trying the best candidates first.
+
+        Candidates tried before the winner count a miss. When nothing is found
+        every candidate counts one only if the target was expected to be on the
+        page; pass expected=False for lookups of things that are often absent
+        (a confirmation dialog, a job without Easy Apply) so their absence does
+        not read as broken selectors.
+        """
+        tried = []
+        for label, locator, check in self.order(target):
+            started = time.perf_counter()
+            found = None
+            try:
+                for element in self.browser.find_elements(*locator):
+                    try:
+                        if check is None or check(element, *args):
+                            found = element
+                            break
+                    except Exception as e:
+                        log.debug(f"Selector check failed for {target} ({label}): {e}")
+            except Exception as e:
+                log.debug(f"Selector {label} failed for {target}: {e}")
+            entry = self._entry(target, label)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if found is not None:
+                entry["hits"] += 1
+                entry["total_ms"] += elapsed_ms
+                entry["last_win"] = time.time()
+                self._dirty = True
+                self._miss(tried)
+                log.debug(f"Found {target} using {label}")
+                return found
+            tried.append((entry, elapsed_ms))
+        if expected:
+            self._miss(tried)
+        return None
+
+    def _miss(self, tried) -> None:
+        for entry, elapsed_ms in tried:
+            entry["misses"] += 1
+            entry["total_ms"] += elapsed_ms
+            self._dirty = True
+
+    def report(self) -> dict:
+        """{target: {selector: {attempts, hit_rate, mean_ms}}} for every registered selector that was tried"""
+        report = {}
+        for target, entries in self.candidates.items():
+            for label, _, _ in entries:
+                entry = self.stats.get((target, label))
+                if not entry:
+                    continue
+                attempts = entry["hits"] + entry["misses"]
+                if not attempts:
+                    continue
+                report.setdefault(target, {})[label] = {
+                    "attempts": attempts,
+                    "hit_rate": round(entry["hits"] / attempts, 3),
+                    "mean_ms": round(entry["total_ms"] / attempts, 1),
+                }
+        return report
+
+    def save(self) -> None:
+        """Persist hit counts, latency and the last winner of every selector"""
+        if not self._dirty:
+            return
+        try:
+            conn = self._connection()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO selector_stats (target, selector, hits, misses, total_ms, last_win) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [(target, label, entry["hits"], entry["misses"], entry["total_ms"], entry["last_win"])
+                         for (target, label), entry in self.stats.items()])
+            finally:
+                conn.close()
+            self._dirty = False
+        except Exception as e:
+            log.error(f"Could not save selector stats to {self.path}: {e}")
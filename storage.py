@@ -0,0 +1,496 @@
+"""
+Persistent stores backing the bot's state between runs.
+
+The answer and history stores are SQLite databases in WAL mode: cheap to
+open, safe to read while another connection writes, and written
+incrementally instead of rewriting a whole CSV/YAML file. The session cookie
+jar is a small JSON file only the current user can read.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+# Lines LinkedIn adds to a form section that are not part of the question itself
+_NOISE_LINES = re.compile(r"^(required|please enter a valid answer|please make a selection|enter a whole number.*|enter a decimal number.*)$")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def question_fingerprint(question) -> str:
+    """Stable key for a question: lowercased, noise lines and punctuation stripped, hashed"""
+    lines = [line.strip() for line in str(question).lower().splitlines()]
+    text = " ".join(line for line in lines if line and not _NOISE_LINES.match(line))
+    normalized = _NON_WORD.sub(" ", text).strip()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def connect(path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class AnswerStore:
+    """
+    Question -> answer store keyed by question_fingerprint.
+
+    The database is opened on first use and every resolved answer is written
+    as soon as it is known. Lookups go through a bounded LRU in memory.
+    Answers derived from questions.yaml or config are tagged with a generation
+    (a hash of those inputs) and are ignored once the inputs change; answers a
+    person typed in, or imported from qa.csv, are always valid.
+    """
+
+    PERMANENT_SOURCES = ("user", "qa.csv")
+    _MISSING = object()
+
+    def __init__(self, path="answers.db", legacy_csv="qa.csv", cache_size=512, writer=None) -> None:
+        self.path = Path(path)
+        self.writer = writer
+        self.legacy_csv = Path(legacy_csv) if legacy_csv else None
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.generation = ""
+        self.conn = None
+        self.lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self.conn is None:
+            self.conn = connect(self.path)
+            self.conn.execute("""CREATE TABLE IF NOT EXISTS answers (
+                                     fingerprint TEXT PRIMARY KEY,
+                                     question TEXT,
+                                     answer TEXT,
+                                     source TEXT,
+                                     generation TEXT,
+                                     updated_at TEXT)""")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.conn.commit()
+            self._import_legacy_csv()
+        return self.conn
+
+    def _import_legacy_csv(self) -> None:
+        """Import the hand-edited qa.csv answers, again only when the file has changed since last time"""
+        if self.legacy_csv is None or not self.legacy_csv.is_file():
+            return
+        mtime = str(self.legacy_csv.stat().st_mtime)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'qa_csv_mtime'").fetchone()
+        if row and row[0] == mtime:
+            return
+        rows = []
+        with open(self.legacy_csv, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                question, answer = row.get("Question"), row.get("Answer")
+                if question and answer:
+                    rows.append((question_fingerprint(question), question, answer, "qa.csv", "",
+                                 datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        # Never overwrite an answer typed in interactively
+        self.conn.executemany("""INSERT INTO answers VALUES (?, ?, ?, ?, ?, ?)
+                                 ON CONFLICT(fingerprint) DO UPDATE SET
+                                     question = excluded.question, answer = excluded.answer,
+                                     source = excluded.source, updated_at = excluded.updated_at
+                                 WHERE answers.source != 'user'""", rows)
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('qa_csv_mtime', ?)", (mtime,))
+        self.conn.commit()
+        log.info(f"Imported {len(rows)} answers from {self.legacy_csv}")
+
+    def set_generation(self, *inputs) -> None:
+        """Tag answers with a hash of whatever they were derived from (questions.yaml, salary, ...)"""
+        generation = hashlib.sha1(repr(inputs).encode("utf-8")).hexdigest()[:16]
+        if generation != self.generation:
+            self.generation = generation
+            self.cache.clear()
+
+    def _remember(self, fingerprint, answer) -> None:
+        self.cache[fingerprint] = answer
+        self.cache.move_to_end(fingerprint)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def get(self, question):
+        """Stored answer for question, or None"""
+        fingerprint = question_fingerprint(question)
+        answer = self.cache.get(fingerprint, self._MISSING)
+        if answer is not self._MISSING:
+            self.cache.move_to_end(fingerprint)
+            return answer
+
+        with self.lock:
+            row = self._connection().execute(
+                "SELECT answer FROM answers WHERE fingerprint = ? AND (generation = ? OR source IN (?, ?))",
+                (fingerprint, self.generation) + self.PERMANENT_SOURCES).fetchone()
+        answer = row[0] if row else None
+        self._remember(fingerprint, answer)
+        return answer
+
+    def put(self, question, answer, source) -> None:
+        """Record a resolved answer, through the background writer when there is one"""
+        if answer is None:
+            return
+        fingerprint = question_fingerprint(question)
+        self._remember(fingerprint, str(answer))
+        row = [fingerprint, question, str(answer), source, self.generation, datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+        if self.writer is not None:
+            self.writer.submit("answer", row)
+        else:
+            self.write_many([row])
+
+    def write_many(self, rows) -> None:
+        with self.lock:
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)", rows)
+            conn.commit()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+class HistoryStore:
+    """
+    Application history: one row per jobID with the latest attempt.
+
+    Replaces parsing the whole output CSV with pandas on every start. The IDs
+    attempted inside the lookback window are loaded once through the timestamp
+    index into a set, so "already attempted?" is an O(1) check in the card
+    filter. Existing output CSVs are imported the first time they are seen.
+    """
+
+    TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    def __init__(self, path, lookback_days=2) -> None:
+        self.path = Path(path)
+        self.lookback_days = lookback_days
+        self.lock = threading.Lock()
+        self.conn = connect(self.path)
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS applications (
+                                 jobID TEXT PRIMARY KEY,
+                                 timestamp TEXT,
+                                 job TEXT,
+                                 company TEXT,
+                                 attempted INTEGER,
+                                 result INTEGER)""")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS applications_timestamp ON applications (timestamp)")
+        # One row per search combo run, so later runs can favour the combos that produce applications
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS combo_runs (
+                                 position TEXT,
+                                 location TEXT,
+                                 timestamp TEXT,
+                                 minutes REAL,
+                                 matched INTEGER,
+                                 applied INTEGER)""")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.commit()
+        self.recent = set()
+
+    def import_csv(self, filename) -> int:
+        """One-shot import of an output CSV written by write_to_file. Returns the number of rows imported"""
+        filename = Path(filename)
+        key = "imported:" + str(filename.resolve())
+        with self.lock:
+            if not filename.is_file() or self.conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                return 0
+            rows = []
+            with open(filename, newline='', encoding='utf-8', errors='replace') as f:
+                for row in csv.reader(f):
+                    if len(row) < 6:
+                        continue
+                    timestamp, jobID, job, company, attempted, result = row[:6]
+                    try:
+                        datetime.strptime(timestamp, self.TIME_FORMAT)
+                    except ValueError:
+                        continue
+                    rows.append((jobID, timestamp, job, company, attempted == "True", result == "True"))
+            # Keep the latest attempt per job, same as record() does going forward
+            self.conn.executemany("""INSERT INTO applications VALUES (?, ?, ?, ?, ?, ?)
+                                     ON CONFLICT(jobID) DO UPDATE SET
+                                         timestamp = excluded.timestamp, job = excluded.job,
+                                         company = excluded.company, attempted = excluded.attempted,
+                                         result = excluded.result
+                                     WHERE excluded.timestamp >= applications.timestamp""", rows)
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, str(len(rows))))
+            self.conn.commit()
+        log.info(f"Imported {len(rows)} applications from {filename}")
+        return len(rows)
+
+    def load_recent(self) -> set:
+        """Load the jobIDs attempted within the lookback window"""
+        since = (datetime.now() - timedelta(days=self.lookback_days)).strftime(self.TIME_FORMAT)
+        with self.lock:
+            rows = self.conn.execute("SELECT jobID FROM applications WHERE timestamp > ?", (since,)).fetchall()
+        self.recent = {row[0] for row in rows}
+        return self.recent
+
+    def __contains__(self, jobID) -> bool:
+        return str(jobID) in self.recent
+
+    def __len__(self) -> int:
+        return len(self.recent)
+
+    def record(self, timestamp, jobID, job, company, attempted, result) -> None:
+        self.record_many([(timestamp, jobID, job, company, attempted, result)])
+
+    def record_many(self, rows) -> None:
+        """Store attempts given as (timestamp, jobID, job, company, attempted, result) rows"""
+        with self.lock:
+            self.conn.executemany("INSERT OR REPLACE INTO applications VALUES (?, ?, ?, ?, ?, ?)",
+                                  [(str(jobID), timestamp, job, company, bool(attempted), bool(result))
+                                   for timestamp, jobID, job, company, attempted, result in rows])
+            self.conn.commit()
+        self.recent.update(str(row[1]) for row in rows)
+
+    def attempts(self) -> list:
+        """(jobID, timestamp, result) of every job ever attempted"""
+        with self.lock:
+            return self.conn.execute("SELECT jobID, timestamp, result FROM applications").fetchall()
+
+    def record_combo(self, position, location, minutes, matched, applied) -> None:
+        """Store how long one position/location search ran and what it produced"""
+        with self.lock:
+            self.conn.execute("INSERT INTO combo_runs VALUES (?, ?, ?, ?, ?, ?)",
+                              (position, location, datetime.now().strftime(self.TIME_FORMAT),
+                               float(minutes), int(matched), int(applied)))
+            self.conn.commit()
+
+    def combo_yields(self, days=30) -> dict:
+        """{(position, location): (applications, minutes)} over the combo runs of the last days"""
+        since = (datetime.now() - timedelta(days=days)).strftime(self.TIME_FORMAT)
+        with self.lock:
+            rows = self.conn.execute("""SELECT position, location, SUM(applied), SUM(minutes) FROM combo_runs
+                                        WHERE timestamp > ? GROUP BY position, location""", (since,)).fetchall()
+        return {(position, location): (applied or 0, minutes or 0.0) for position, location, applied, minutes in rows}
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+class SessionStore:
+    """
+    Cookie jar of the signed-in LinkedIn session, so the next run can skip the login form.
+
+    Cookies are saved together with a hash of the username they belong to and
+    are only handed back for that username. Expired cookies are dropped on load.
+    """
+
+    def __init__(self, path="linkedin_session.json") -> None:
+        self.path = Path(path)
+
+    @staticmethod
+    def _account(username) -> str:
+        return hashlib.sha1(str(username).strip().lower().encode("utf-8")).hexdigest()
+
+    def load(self, username) -> list:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if stored.get("account") != self._account(username):
+            return []
+        now = time.time()
+        return [cookie for cookie in stored.get("cookies", []) if cookie.get("expiry", now + 1) > now]
+
+    def save(self, username, cookies) -> None:
+        if not cookies:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            # Created private: these cookies sign in as the user
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"account": self._account(username), "saved": int(time.time()), "cookies": cookies}, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log.error(f"Could not save the LinkedIn session to {self.path}: {e}")
+
+    def clear(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class BackgroundWriter:
+    """
+    Single background thread that batches every disk append of a run.
+
+    The driver thread only calls submit(), which puts (kind, payload) on a
+    queue and returns. The writer thread groups items into batches, flushing
+    when batch_size items are waiting, when flush_interval seconds have passed
+    since the first one, on flush() and on close(). Handlers registered per
+    kind receive the list of payloads of a batch and apply them in one go.
+
+    Before a batch is applied its items are appended to a journal file with a
+    single fsync (group commit); kinds listed in unjournaled (phase timing
+    events, say) are not worth that and skip the journal. Items whose handler
+    raised stay in the journal and are retried with the next batch; once
+    nothing is left to retry the journal is truncated. Items left in the
+    journal by a crash are re-applied by start(), so results are written at
+    least once; register every handler before calling start().
+    """
+
+    def __init__(self, journal_path="pending_writes.journal", flush_interval=1.0, batch_size=50,
+                 unjournaled=()) -> None:
+        self.journal_path = Path(journal_path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.unjournaled = set(unjournaled)
+        self.handlers = {}
+        self.queue = queue.Queue()
+        self.thread = None
+        self.closed = False
+        self.batches_written = 0
+        self.items_written = 0
+        self.retry = []  # (kind, payload) whose handler raised, applied again with the next batch
+
+    def register(self, kind, handler) -> None:
+        self.handlers[kind] = handler
+
+    def start(self) -> "BackgroundWriter":
+        self.replay()
+        self.thread = threading.Thread(target=self._run, name="background-writer", daemon=True)
+        self.thread.start()
+        return self
+
+    def submit(self, kind, payload) -> None:
+        """Queue payload for the handler registered as kind; never touches the disk"""
+        if self.thread is None or self.closed:
+            self._apply([(kind, payload)])
+            return
+        self.queue.put((kind, payload))
+
+    def flush(self, timeout=10.0) -> None:
+        """Block until everything submitted so far is on disk"""
+        if self.thread is None or self.closed:
+            return
+        done = threading.Event()
+        self.queue.put(("__flush__", done))
+        done.wait(timeout)
+
+    def close(self, timeout=10.0) -> None:
+        if self.thread is None or self.closed:
+            return
+        self.queue.put(("__stop__", None))
+        self.thread.join(timeout)
+        self.closed = True
+
+    def replay(self) -> None:
+        """Re-apply the writes a previous run journaled but did not finish applying"""
+        if not self.journal_path.is_file() or self.journal_path.stat().st_size == 0:
+            return
+        items = []
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    kind, payload = json.loads(line)
+                except ValueError:
+                    break  # torn write at the end of the journal
+                items.append((kind, payload))
+        log.info(f"Replaying {len(items)} journaled writes from {self.journal_path}")
+        failed = self._apply(items)
+        self.retry = [(kind, payload) for kind, payload in items if kind in failed]
+        self._rewrite_journal()
+
+    def _run(self) -> None:
+        batch = []
+        waiters = []
+        first_at = None
+        stopping = False
+        while not stopping:
+            timeout = None if first_at is None else max(0.0, first_at + self.flush_interval - time.monotonic())
+            try:
+                kind, payload = self.queue.get(timeout=timeout)
+                if kind == "__flush__":
+                    waiters.append(payload)
+                elif kind == "__stop__":
+                    stopping = True
+                else:
+                    batch.append((kind, payload))
+                    if first_at is None:
+                        first_at = time.monotonic()
+            except queue.Empty:
+                pass
+
+            due = first_at is not None and time.monotonic() - first_at >= self.flush_interval
+            if batch and (len(batch) >= self.batch_size or due or waiters or stopping):
+                self._write_batch(batch)
+                batch = []
+                first_at = None
+            elif not batch:
+                first_at = None
+            for waiter in waiters:
+                waiter.set()
+            waiters = []
+
+    def _write_batch(self, batch) -> None:
+        journaled = [item for item in batch if item[0] not in self.unjournaled]
+        if journaled:
+            try:
+                with open(self.journal_path, 'a', encoding='utf-8') as f:
+                    f.writelines(json.dumps(item) + "\n" for item in journaled)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                log.error(f"Could not journal {len(journaled)} pending writes: {e}")
+        items = self.retry + batch
+        failed = self._apply(items)
+        self.retry = [(kind, payload) for kind, payload in items if kind in failed]
+        if self.retry:
+            log.error(f"Keeping {len(self.retry)} '{', '.join(sorted(failed))}' writes to retry with the next batch")
+        if journaled or failed:
+            self._rewrite_journal()
+        self.batches_written += 1
+        self.items_written += len(items) - len(self.retry)
+
+    def _apply(self, items) -> set:
+        """Hand items to their handlers, grouped by kind. Returns the kinds whose handler raised"""
+        grouped = {}
+        for kind, payload in items:
+            grouped.setdefault(kind, []).append(payload)
+        failed = set()
+        for kind, payloads in grouped.items():
+            handler = self.handlers.get(kind)
+            if handler is None:
+                log.error(f"No handler registered for '{kind}' writes, dropping {len(payloads)}")
+                continue
+            try:
+                handler(payloads)
+            except Exception as e:
+                log.error(f"Error writing {len(payloads)} '{kind}' records: {e}")
+                failed.add(kind)
+        return failed
+
+    def _rewrite_journal(self) -> None:
+        """Cut the journal down to the journaled items still waiting to be retried"""
+        pending = [item for item in self.retry if item[0] not in self.unjournaled]
+        try:
+            if not pending:
+                with open(self.journal_path, 'w', encoding='utf-8'):
+                    pass
+                return
+            tmp = self.journal_path.with_name(self.journal_path.name + ".tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.writelines(json.dumps(item) + "\n" for item in pending)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.journal_path)
+        except Exception as e:
+            log.error(f"Could not rewrite write journal {self.journal_path}: {e}")
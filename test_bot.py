@@ -25,11 +25,26 @@ def main():
         filename=parameters.get('output_filename', ['output.csv'])[0],
         blacklist=parameters.get('blacklist', []),
         blackListTitles=parameters.get('blackListTitles', []),
-        experience_level=parameters.get('experience_level', [])
+        experience_level=parameters.get('experience_level', []),
+        history_days=parameters.get('history_days', 2),
+        scroll_steps=parameters.get('scroll_steps', 30),
+        scroll_timeout=parameters.get('scroll_timeout', 10),
+        discovery_worker=parameters.get('discovery_worker', False),
+        search_budget_minutes=parameters.get('search_budget_minutes'),
+        audit_commands=parameters.get('audit_commands', False),
+        profile_path=parameters.get('profile_path'),
+        reuse_session=parameters.get('reuse_session', True),
+        headless=parameters.get('headless', False),
+        block_resources=parameters.get('block_resources') or [],
+        block_urls=parameters.get('block_urls') or [],
+        network_stats=parameters.get('network_stats', False),
+        memory_limit_mb=parameters.get('memory_limit_mb'),
+        recycle_jobs=parameters.get('recycle_jobs', 0)
     )
 
-    # Start applying
-    bot.start_apply(parameters['positions'], parameters['locations'])
+    # Start applying; leaving the block flushes pending writes and quits Chrome
+    with bot:
+        bot.start_apply(parameters['positions'], parameters['locations'])
 
 if __name__ == "__main__":
     main()
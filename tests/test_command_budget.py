@@ -0,0 +1,31 @@
+"""
+WebDriver command budget regression: one application against the replay server.
+
+Needs selenium and a local Chrome; skipped without them.
+"""
+
+import shutil
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from benchmark import make_parser, run_benchmark
+from driver_cache import CHROME_COMMANDS
+from replay_server import ReplayFixtures
+
+# Commands one Easy Apply application through every modal step may take
+COMMAND_BUDGET = 60
+
+
+@pytest.mark.skipif(not any(shutil.which(command) for command in CHROME_COMMANDS), reason="Chrome is not installed")
+def test_single_application_stays_within_command_budget():
+    fixtures = ReplayFixtures(positions=("Data",), pages=1, jobs_per_page=1, easy_apply_ratio=1.0, applied_ratio=0.0)
+    args = make_parser().parse_args(["--jobs", "1", "--positions", "Data", "--headless",
+                                     "--command-budget", str(COMMAND_BUDGET)])
+
+    result = run_benchmark(args, fixtures=fixtures)
+
+    assert result["jobs"] == 1
+    assert result["commands"]["commands"] > 0
+    assert result["commands"]["over_budget"] == []
@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+psutil = pytest.importorskip("psutil")
+
+from driver_registry import DriverRegistry
+
+
+@pytest.fixture
+def sleeper():
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    yield process
+    if process.poll() is None:
+        process.kill()
+    process.wait()
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def write_record(directory, owner, owner_started, processes):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{owner}.json"
+    path.write_text(json.dumps({"owner": owner, "owner_started": owner_started,
+                                "processes": {str(pid): started for pid, started in processes.items()}}))
+    return path
+
+
+def test_reaps_processes_of_a_dead_run(tmp_path, sleeper):
+    path = write_record(tmp_path, dead_pid(), 1.0, {sleeper.pid: psutil.Process(sleeper.pid).create_time()})
+    assert DriverRegistry(tmp_path).reap_orphans() == 1
+    assert sleeper.wait(timeout=10) is not None
+    assert not path.exists()
+
+
+def test_reused_pid_is_not_killed(tmp_path, sleeper):
+    started = psutil.Process(sleeper.pid).create_time()
+    path = write_record(tmp_path, dead_pid(), 1.0, {sleeper.pid: started - 100})
+    assert DriverRegistry(tmp_path).reap_orphans() == 0
+    time.sleep(0.2)
+    assert sleeper.poll() is None
+    assert not path.exists()
+
+
+def test_live_run_is_left_alone(tmp_path, sleeper):
+    me = psutil.Process(os.getpid())
+    path = write_record(tmp_path, me.pid, me.create_time(), {sleeper.pid: psutil.Process(sleeper.pid).create_time()})
+    assert DriverRegistry(tmp_path).reap_orphans() == 0
+    assert sleeper.poll() is None
+    assert path.exists()
+
+
+def test_unregistering_one_browser_keeps_the_other(tmp_path, sleeper):
+    other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    try:
+        registry = DriverRegistry(tmp_path)
+        main = SimpleNamespace(service=SimpleNamespace(process=sleeper))
+        discovery = SimpleNamespace(service=SimpleNamespace(process=other))
+        registry.register(main)
+        registry.register(discovery)
+        recorded = json.loads(registry.path.read_text())["processes"]
+        assert set(recorded) == {str(sleeper.pid), str(other.pid)}
+
+        registry.unregister(main)
+        assert set(json.loads(registry.path.read_text())["processes"]) == {str(other.pid)}
+        registry.unregister(discovery)
+        assert not registry.path.exists()
+    finally:
+        other.kill()
+        other.wait()
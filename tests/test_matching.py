@@ -0,0 +1,128 @@
+import random
+from difflib import SequenceMatcher
+
+from matching import AnswerMatcher, BlacklistMatcher, KeywordAutomaton, RelevanceScorer
+
+WORDS = ["years", "experience", "python", "sql", "salary", "visa", "sponsorship", "remote", "relocate",
+         "degree", "data", "analyst", "engineer", "senior", "intern", "sales", "director", "clerk", "vp"]
+
+
+def phrases(rng, count, longest=4):
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, longest))) for _ in range(count)]
+
+
+def old_exact(qa_pairs, question_lower):
+    for qa_pair in qa_pairs:
+        if any(keyword.lower() in question_lower for keyword in qa_pair['keywords']):
+            return qa_pair
+    return None
+
+
+def old_fuzzy(qa_pairs, question_lower):
+    for qa_pair in qa_pairs:
+        for keyword in qa_pair['keywords']:
+            similarity = SequenceMatcher(None, keyword.lower(), question_lower).ratio()
+            if similarity > 0.75:
+                return qa_pair, keyword, similarity
+    return None
+
+
+def old_relevance(positions, job_title):
+    job_title_lower = job_title.lower()
+    for irrelevant in RelevanceScorer.IRRELEVANT_KEYWORDS:
+        if irrelevant in job_title_lower and not any(pos.lower() in irrelevant for pos in positions):
+            return 0
+    score = 0
+    for position in positions:
+        position_lower = position.lower()
+        if position_lower == job_title_lower:
+            score += 100
+            continue
+        if position_lower in job_title_lower:
+            score += 50
+            for related_term in RelevanceScorer.RELATED_TERMS.get(position_lower, []):
+                if related_term in job_title_lower:
+                    score += 20
+    if score == 0:
+        for position in positions:
+            similarity = SequenceMatcher(None, position.lower(), job_title_lower).ratio()
+            if similarity > 0.6:
+                score += int(similarity * 30)
+    return score
+
+
+def test_automaton_returns_lowest_priority_found():
+    automaton = KeywordAutomaton()
+    for priority, pattern in enumerate(["she", "he", "hers", "his"]):
+        automaton.add(pattern, priority)
+    assert automaton.first_match("ushers") == 0
+    assert automaton.first_match("ahis") == 3
+    assert automaton.first_match("xyz") is None
+
+
+def test_exact_matches_old_substring_loop():
+    rng = random.Random(1)
+    qa_pairs = [{"keywords": phrases(rng, rng.randint(1, 3), longest=2), "answer": str(i)} for i in range(30)]
+    matcher = AnswerMatcher(qa_pairs)
+    for question in phrases(rng, 500, longest=8):
+        assert matcher.exact(question) is old_exact(qa_pairs, question)
+
+
+def test_fuzzy_matches_old_sequence_matcher_loop():
+    rng = random.Random(2)
+    qa_pairs = [{"keywords": phrases(rng, rng.randint(1, 3)), "answer": str(i)} for i in range(30)]
+    matcher = AnswerMatcher(qa_pairs)
+    questions = phrases(rng, 300) + [keyword[:-1] + "s" for pair in qa_pairs for keyword in pair["keywords"]]
+    for question in questions:
+        found, expected = matcher.fuzzy(question), old_fuzzy(qa_pairs, question)
+        if expected is None:
+            assert found is None
+        else:
+            assert found[0] is expected[0] and found[1] == expected[1]
+            assert abs(found[2] - expected[2]) < 1e-9
+
+
+def test_answer_matcher_skips_malformed_entries_and_counts_strategies():
+    matcher = AnswerMatcher([{"keywords": ["visa"]}, "junk", {"keywords": ["Visa"], "answer": "No"}])
+    assert len(matcher) == 1
+    assert matcher.exact("do you need visa sponsorship")["answer"] == "No"
+    assert matcher.exact("unrelated") is None
+    assert matcher.stats == {"exact.hit": 1, "exact.miss": 1}
+
+
+def test_blacklist_matches_old_substring_check():
+    rng = random.Random(3)
+    entries = phrases(rng, 20, longest=2)
+    matcher = BlacklistMatcher(entries)
+    for text in phrases(rng, 500, longest=6):
+        expected = next((entry for entry in entries if entry.lower() in text.lower()), None)
+        assert matcher.match(text) == expected
+
+
+def test_blacklist_word_and_regex_entries():
+    matcher = BlacklistMatcher([{"word": "IT"}, {"regex": r"^Meta\b"}, "Acme"])
+    assert matcher.match("Digital Agency") is None
+    assert matcher.match("Global IT Services") == "word:IT"
+    assert matcher.match("Meta Platforms") == "regex:^Meta\\b"
+    assert matcher.match("Metamorph") is None
+    assert matcher.match("ACME corp") == "Acme"
+    assert matcher.hits["Acme"] == 1
+
+
+def test_blacklist_overlapping_words_credit_the_first_rule():
+    matcher = BlacklistMatcher([{"word": "science"}, {"word": "data science"}, {"word": "data"}])
+    assert matcher.match("Data Science Lead") == "word:science"
+    assert matcher.match("Big Data Engineer") == "word:data"
+    matcher = BlacklistMatcher([{"word": "it"}, {"word": "it consulting"}, "consult"])
+    assert matcher.match("IT Consulting Group") == "word:it"
+    assert matcher.match("Consulting Group") == "consult"
+    assert dict(matcher.hits) == {"word:it": 1, "consult": 1}
+
+
+def test_relevance_matches_old_scoring():
+    rng = random.Random(4)
+    for positions in (["Data"], ["Data", "Analytics"], ["Engineer", "Intern"], ["Sales"]):
+        scorer = RelevanceScorer(positions)
+        titles = phrases(rng, 300) + positions + [position.upper() for position in positions]
+        for title in titles:
+            assert scorer.score(title) == old_relevance(positions, title), (positions, title)
@@ -0,0 +1,41 @@
+import pytest
+
+from metrics import PhaseRecorder, percentile, summarize
+
+
+def test_percentile_interpolates_between_ranks():
+    assert percentile([], 50) == 0.0
+    assert percentile([7], 95) == 7.0
+    assert percentile([4, 1, 3, 2], 50) == 2.5
+    assert percentile([1, 2, 3, 4, 5], 100) == 5.0
+    assert percentile(list(range(101)), 95) == pytest.approx(95.0)
+
+
+def test_summarize():
+    assert summarize([]) == {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    stats = summarize([1.0, 2.0, 3.0, 10.0])
+    assert stats["count"] == 4
+    assert stats["mean"] == 4.0
+    assert stats["p50"] == 2.5
+    assert stats["p95"] == pytest.approx(8.95)
+    assert stats["max"] == 10.0
+
+
+def test_phase_recorder_nests_context_and_marks_failures():
+    events = []
+    phases = PhaseRecorder(sink=events.append, run_id="run")
+    phases.set_context(combo="Data: Remote")
+    with phases.phase("apply_job", job_id="1") as event:
+        assert phases.context()["job_id"] == "1"
+        with phases.phase("modal_open"):
+            pass
+        event["result"] = True
+    with pytest.raises(ValueError):
+        with phases.phase("send_resume"):
+            raise ValueError()
+
+    modal, job, failed = events
+    assert (modal["phase"], modal["job_id"], modal["combo"]) == ("modal_open", "1", "Data: Remote")
+    assert job["result"] is True and job["ok"] is True
+    assert failed["ok"] is False and "job_id" not in failed
+    assert len(phases.summary()["apply_job"]) == 5
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from run_report import load_events, print_summary, summarize_run
+
+
+def event(phase, ts, seconds, run="b", **fields):
+    return {"ts": ts, "run": run, "phase": phase, "seconds": seconds, **fields}
+
+
+EVENTS = [
+    event("next_jobs_page", 102.0, 2.0),
+    event("find_button", 104.0, 1.0, job_id="1"),
+    event("apply_job", 110.0, 8.0, job_id="1", combo="Data: Remote", result=True, commands=40, page_source_bytes=2048),
+    event("find_button", 111.0, 0.5, job_id="2"),
+    event("apply_job", 112.0, 2.0, job_id="2", combo="Data: Remote", result=False, commands=20, page_source_bytes=0),
+    event("memory_sample", 112.5, 0.1, chrome_mb=900.0, driver_mb=20.0, python_mb=80.0),
+    event("recycle_browser", 115.0, 2.5, reason="Chrome uses 900MB, over the 800MB limit"),
+    event("webdriver_audit", 120.0, 3.0, commands=75, page_source_bytes=4096,
+          slowest_sites=[{"site": "send_resume:10", "count": 30, "seconds": 2.0, "max": 0.2}]),
+]
+
+
+def test_load_events_defaults_to_the_latest_run(tmp_path):
+    path = tmp_path / "output_events.jsonl"
+    lines = [json.dumps(event("apply_job", 50.0, 1.0, run="a", job_id="0"))] + [json.dumps(e) for e in EVENTS]
+    path.write_text("\n".join(lines[:3]) + "\nnot json\n\n" + "\n".join(lines[3:]) + "\n", encoding="utf-8")
+    assert len(load_events(path)) == len(EVENTS)
+    assert [e["job_id"] for e in load_events(path, run="a")] == ["0"]
+
+
+def test_summarize_run():
+    summary = summarize_run(EVENTS)
+    assert summary["run"] == "b"
+    assert summary["wall_seconds"] == pytest.approx(15.0)  # 100.0 (first start) to 115.0, audit excluded
+    assert (summary["jobs"], summary["applied"]) == (2, 1)
+    assert summary["jobs_per_minute"] == 8.0
+    assert summary["phases"]["apply_job"]["count"] == 2
+    assert summary["phases"]["apply_job"]["total"] == 10.0
+    assert "webdriver_audit" not in summary["phases"]
+
+    slowest = summary["slowest_jobs"]
+    assert [job["job_id"] for job in slowest] == ["1", "2"]
+    assert slowest[0]["phases"] == {"find_button": 1.0}
+    assert slowest[0]["commands"] == 40
+
+    commands = summary["commands"]
+    assert commands["per_job"]["max"] == 40
+    assert commands["job_page_source_bytes"] == 2048
+    assert commands["total"] == 75
+    assert commands["slowest_sites"][0]["site"] == "send_resume:10"
+
+    assert summary["memory"] == [{"minute": 0.2, "chrome_mb": 900.0, "driver_mb": 20.0, "python_mb": 80.0}]
+    assert summary["recycles"] == ["Chrome uses 900MB, over the 800MB limit"]
+
+
+def test_summarize_run_without_events():
+    assert summarize_run([]) == {}
+    assert summarize_run([event("webdriver_audit", 1.0, 0.0)]) == {}
+
+
+def test_print_summary(capsys):
+    print_summary(summarize_run(EVENTS, top=1))
+    output = capsys.readouterr().out
+    assert "2 opened, 1 applied" in output
+    assert "find_button 1.0s, 40 commands" in output
+    assert "peak Chrome 900MB" in output
+    assert "send_resume:10" in output
@@ -0,0 +1,56 @@
+import pytest
+
+from scheduler import ComboScheduler
+
+
+def test_order_follows_past_yield_and_is_stable():
+    yields = {("Data", "Remote"): (2, 60.0), ("Analytics", "Remote"): (12, 60.0)}
+    scheduler = ComboScheduler(["Data", "Analytics", "Engineer"], ["Remote"], yields, budget=3600)
+    # Engineer has no history and gets the average known rate, between the two
+    assert scheduler.order == [("Analytics", "Remote"), ("Engineer", "Remote"), ("Data", "Remote")]
+    assert scheduler.rates[("Engineer", "Remote")] == pytest.approx(7 / 60)
+
+
+def test_duplicate_combos_are_searched_once():
+    scheduler = ComboScheduler(["Data", "Data"], ["Remote", "Remote"], {}, budget=100)
+    assert len(scheduler) == 1
+
+
+def test_allocation_splits_budget_by_yield_with_a_floor():
+    yields = {("a", "x"): (30, 10.0), ("b", "x"): (0, 10.0)}
+    scheduler = ComboScheduler(["a", "b"], ["x"], yields, budget=1000)
+    pending = scheduler.order
+    best = scheduler.allocate(pending[0], pending)
+    worst = scheduler.allocate(pending[1], pending)
+    floor = 1000 / 2 * ComboScheduler.MIN_SHARE
+    assert worst == pytest.approx(floor)
+    assert best == pytest.approx(1000 - floor)
+
+
+def test_unknown_history_splits_evenly():
+    scheduler = ComboScheduler(["a", "b", "c", "d"], ["x"], {}, budget=400)
+    seconds = []
+    for position, location, allotted in scheduler:
+        seconds.append(allotted)
+        scheduler.spent(allotted)
+    assert seconds == pytest.approx([100, 100, 100, 100])
+
+
+def test_unused_time_goes_to_the_remaining_combos():
+    scheduler = ComboScheduler(["a", "b"], ["x"], {}, budget=200)
+    combos = iter(scheduler)
+    _, _, first = next(combos)
+    assert first == pytest.approx(100)
+    scheduler.spent(20)
+    _, _, second = next(combos)
+    assert second == pytest.approx(180)
+
+
+def test_iteration_stops_once_the_budget_is_spent():
+    scheduler = ComboScheduler(["a", "b", "c"], ["x"], {}, budget=60)
+    seen = []
+    for position, location, allotted in scheduler:
+        seen.append(position)
+        scheduler.spent(60)
+    assert seen == ["a"]
+    assert scheduler.remaining == 0
@@ -0,0 +1,122 @@
+import threading
+from datetime import date, timedelta
+
+from seen_index import APPLIED, BLACKLISTED, FAILED, SKIPPED, SeenJobIndex, _day
+
+
+def test_lookup_before_and_after_flush(tmp_path):
+    index = SeenJobIndex(tmp_path / "seen.idx")
+    assert index.empty
+    index.add("3900000007", APPLIED)
+    index.add(3900000001, FAILED)
+    index.add("not-a-number", APPLIED)
+    assert index.lookup("3900000007") == (APPLIED, _day())
+    index.flush()
+    assert not index.pending
+
+    reopened = SeenJobIndex(tmp_path / "seen.idx")
+    assert len(reopened) == 2
+    assert reopened.lookup("3900000007") == (APPLIED, _day())
+    assert reopened.lookup("3900000001") == (FAILED, _day())
+    assert reopened.lookup("3900000002") is None
+    assert reopened.lookup(None) is None
+    reopened.close()
+    index.close()
+
+
+def test_flush_keeps_latest_record_per_job(tmp_path):
+    index = SeenJobIndex(tmp_path / "seen.idx")
+    ids = [str(3900000000 + n * 7919) for n in range(1000)]
+    for job_id in ids:
+        index.add(job_id, FAILED, date.today() - timedelta(days=5))
+    index.flush()
+    index.add(ids[500], APPLIED)
+    index.flush()
+    assert len(index) == 1000
+    assert index.lookup(ids[500]) == (APPLIED, _day())
+    assert index.lookup(ids[499])[0] == FAILED
+    index.close()
+
+
+def test_skip_reason_retries_old_failures(tmp_path):
+    index = SeenJobIndex(tmp_path / "seen.idx", retry_days=2)
+    index.add(1, APPLIED, date.today() - timedelta(days=30))
+    index.add(2, FAILED, date.today())
+    index.add(3, FAILED, date.today() - timedelta(days=2))
+    assert index.skip_reason(1) == "applied"
+    assert index.skip_reason(2) == "failed"
+    assert index.skip_reason(3) is None
+    assert index.skip_reason(4) is None
+    index.close()
+
+
+def test_config_dependent_entries_only_count_for_their_generation(tmp_path):
+    index = SeenJobIndex(tmp_path / "seen.idx")
+    index.set_generation(["Acme"], [], ["Data"])
+    index.add(1, BLACKLISTED)
+    index.add(2, SKIPPED)
+    index.add(3, APPLIED)
+    index.close()
+
+    same = SeenJobIndex(tmp_path / "seen.idx")
+    same.set_generation(["Acme"], [], ["Data"])
+    assert same.skip_reason(1) == "blacklisted"
+    assert same.skip_reason(2) == "skipped"
+    same.close()
+
+    changed = SeenJobIndex(tmp_path / "seen.idx")
+    changed.set_generation(["Acme", "Globex"], [], ["Data"])
+    assert changed.lookup(1) is None
+    assert changed.lookup(2) is None
+    assert changed.skip_reason(3) == "applied"
+    # The next flush drops the stale entries from the file
+    changed.flush()
+    assert len(changed) == 1
+    changed.close()
+
+
+def test_seed_from_history_rows(tmp_path):
+    index = SeenJobIndex(tmp_path / "seen.idx")
+    added = index.seed([("1", "2026-01-02 10:00:00", 1), ("2", "2026-01-03 11:00:00", 0), ("3", "garbage", 1)])
+    assert added == 2
+    assert index.lookup("1") == (APPLIED, _day(date(2026, 1, 2)))
+    assert index.lookup("2") == (FAILED, _day(date(2026, 1, 3)))
+    index.close()
+
+
+def test_unreadable_file_is_ignored(tmp_path):
+    path = tmp_path / "seen.idx"
+    path.write_bytes(b"NOTANIDX" + bytes(16))
+    index = SeenJobIndex(path)
+    assert index.empty
+    index.add(1, APPLIED)
+    index.close()
+    assert SeenJobIndex(path).lookup(1) == (APPLIED, _day())
+
+
+def test_lookups_from_another_thread_survive_flushes(tmp_path):
+    index = SeenJobIndex(tmp_path / "seen.idx")
+    for job_id in range(2000):
+        index.add(job_id, APPLIED)
+    index.flush()
+    errors = []
+    stop = threading.Event()
+
+    def look_up():
+        try:
+            while not stop.is_set():
+                for job_id in range(0, 2000, 97):
+                    assert index.skip_reason(job_id) == "applied"
+        except Exception as e:
+            errors.append(e)
+            raise
+
+    reader = threading.Thread(target=look_up)
+    reader.start()
+    for job_id in range(2000, 2200):
+        index.add(job_id, FAILED)
+        index.flush()
+    stop.set()
+    reader.join()
+    index.close()
+    assert errors == []
@@ -0,0 +1,66 @@
+from selector_registry import SelectorRegistry
+
+
+class FakeBrowser:
+    """find_elements returns one element for every locator value in present"""
+
+    def __init__(self, present=()) -> None:
+        self.present = set(present)
+
+    def find_elements(self, by, value):
+        return [value] if value in self.present else []
+
+
+CANDIDATES = [(("css selector", "a"), None), (("css selector", "b"), None), (("css selector", "c"), None)]
+
+
+def make_registry(path, browser):
+    registry = SelectorRegistry(browser, path=path)
+    registry.register("target", CANDIDATES)
+    return registry
+
+
+def test_first_candidate_hits_are_saved_and_reloaded(tmp_path):
+    path = tmp_path / "selectors.db"
+    registry = make_registry(path, FakeBrowser(present={"a"}))
+    for _ in range(5):
+        assert registry.find("target") == "a"
+    registry.save()
+
+    reloaded = make_registry(path, FakeBrowser())
+    assert reloaded.report()["target"]["css selector=a"]["attempts"] == 5
+    assert reloaded.report()["target"]["css selector=a"]["hit_rate"] == 1.0
+    assert [label for label, _, _ in reloaded.order("target")][0] == "css selector=a"
+
+
+def test_winner_moves_to_the_front_across_runs(tmp_path):
+    path = tmp_path / "selectors.db"
+    registry = make_registry(path, FakeBrowser(present={"c"}))
+    assert registry.find("target") == "c"
+    registry.save()
+
+    reloaded = make_registry(path, FakeBrowser(present={"b", "c"}))
+    assert [label for label, _, _ in reloaded.order("target")] == ["css selector=c", "css selector=a", "css selector=b"]
+    # The last winner is tried first, so b is never reached
+    assert reloaded.find("target") == "c"
+    stats = reloaded.report()["target"]
+    # a and b missed once each in the first run, before c won
+    assert {label: (entry["attempts"], entry["hit_rate"]) for label, entry in stats.items()} == \
+        {"css selector=a": (1, 0.0), "css selector=b": (1, 0.0), "css selector=c": (2, 1.0)}
+
+
+def test_misses_are_only_counted_for_expected_targets(tmp_path):
+    registry = make_registry(tmp_path / "selectors.db", FakeBrowser())
+    assert registry.find("target", expected=False) is None
+    assert registry.report() == {}
+    assert registry.find("target") is None
+    assert {label: stats["attempts"] for label, stats in registry.report()["target"].items()} == \
+        {"css selector=a": 1, "css selector=b": 1, "css selector=c": 1}
+
+
+def test_check_filters_elements(tmp_path):
+    registry = SelectorRegistry(FakeBrowser(present={"a", "b"}), path=tmp_path / "selectors.db")
+    registry.register("target", [(("css selector", "a"), lambda element, wanted: element == wanted),
+                                 (("css selector", "b"), None)])
+    assert registry.find("target", "a") == "a"
+    assert registry.find("target", "zzz") == "b"
@@ -0,0 +1,213 @@
+import json
+import os
+import stat
+import threading
+import time
+
+from storage import AnswerStore, BackgroundWriter, HistoryStore, SessionStore, question_fingerprint
+
+
+def test_question_fingerprint_ignores_noise_and_punctuation():
+    assert question_fingerprint("How many years of Python?\nRequired") == question_fingerprint("how many years of python")
+    assert question_fingerprint("Salary?") != question_fingerprint("Sponsorship?")
+
+
+def test_answer_store_lru_evicts_least_recently_used(tmp_path):
+    store = AnswerStore(tmp_path / "answers.db", legacy_csv=None, cache_size=2)
+    store.put("one", "1", "yaml")
+    store.put("two", "2", "yaml")
+    assert store.get("one") == "1"  # one is now the most recent
+    store.put("three", "3", "yaml")
+    assert list(store.cache) == [question_fingerprint("one"), question_fingerprint("three")]
+    # Evicted entries are read back from SQLite
+    assert store.get("two") == "2"
+    assert len(store.cache) == 2
+    store.close()
+
+
+def test_answer_store_generation_invalidates_derived_answers(tmp_path):
+    store = AnswerStore(tmp_path / "answers.db", legacy_csv=None)
+    store.set_generation(["questions.yaml v1"], "100000")
+    store.put("Expected salary?", "100000", "config")
+    store.put("Do you need a visa?", "No", "user")
+    store.close()
+
+    reopened = AnswerStore(tmp_path / "answers.db", legacy_csv=None)
+    reopened.set_generation(["questions.yaml v1"], "100000")
+    assert reopened.get("Expected salary?") == "100000"
+    reopened.set_generation(["questions.yaml v1"], "120000")
+    assert reopened.get("Expected salary?") is None
+    assert reopened.get("Do you need a visa?") == "No"
+    reopened.close()
+
+
+def test_answer_store_imports_qa_csv_without_overwriting_user_answers(tmp_path):
+    qa_csv = tmp_path / "qa.csv"
+    qa_csv.write_text("Question,Answer\nDo you need a visa?,Yes\nYears of SQL?,5\n", encoding="utf-8")
+    store = AnswerStore(tmp_path / "answers.db", legacy_csv=qa_csv)
+    store.put("Do you need a visa?", "No", "user")
+    store.cache.clear()
+    assert store.get("Years of SQL?") == "5"
+    assert store.get("Do you need a visa?") == "No"
+    store.close()
+
+
+def test_answer_store_writes_through_the_writer(tmp_path):
+    writer = BackgroundWriter(tmp_path / "writes.journal")
+    store = AnswerStore(tmp_path / "answers.db", legacy_csv=None, writer=writer)
+    writer.register("answer", store.write_many)
+    writer.start()
+    store.put("Years of Python?", 4, "yaml")
+    writer.close()
+    store.cache.clear()
+    assert store.get("Years of Python?") == "4"
+    store.close()
+
+
+def test_writer_batches_items_by_kind(tmp_path):
+    batches = []
+    writer = BackgroundWriter(tmp_path / "writes.journal", flush_interval=60, batch_size=3)
+    writer.register("row", batches.append)
+    writer.start()
+    for n in range(7):
+        writer.submit("row", n)
+    writer.flush()
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert writer.batches_written == 3 and writer.items_written == 7
+    writer.close()
+    assert (tmp_path / "writes.journal").read_text() == ""
+
+
+def test_writer_journals_a_batch_before_applying_it_and_replays_on_start(tmp_path):
+    journal = tmp_path / "writes.journal"
+    applying = threading.Event()
+    release = threading.Event()
+
+    def stuck(rows):
+        applying.set()
+        release.wait(5)
+
+    writer = BackgroundWriter(journal, flush_interval=60, batch_size=3, unjournaled=("event",))
+    writer.register("row", stuck)
+    writer.register("event", lambda events: None)
+    writer.start()
+    writer.submit("event", {"phase": "apply_job"})
+    writer.submit("row", [2, "two"])
+    writer.submit("event", {"phase": "modal_open"})
+    assert applying.wait(5)
+    # The batch is on disk before its handler runs; events are never journaled
+    assert [json.loads(line) for line in journal.read_text().splitlines()] == [["row", [2, "two"]]]
+
+    # A new run replays it before accepting anything new
+    applied = []
+    replaying = BackgroundWriter(journal)
+    replaying.register("row", applied.extend)
+    replaying.start()
+    assert applied == [[2, "two"]]
+    assert journal.read_text() == ""
+    replaying.close()
+    release.set()
+    writer.close()
+
+
+def test_writer_keeps_and_retries_writes_whose_handler_raised(tmp_path):
+    journal = tmp_path / "writes.journal"
+    written = []
+    failures = [RuntimeError("database is locked")]
+
+    def flaky(rows):
+        if failures:
+            raise failures.pop()
+        written.extend(rows)
+
+    writer = BackgroundWriter(journal, flush_interval=60)
+    writer.register("row", flaky)
+    writer.start()
+    writer.submit("row", 1)
+    writer.flush()
+    assert written == []
+    assert [json.loads(line) for line in journal.read_text().splitlines()] == [["row", 1]]
+
+    writer.submit("row", 2)
+    writer.flush()
+    assert written == [1, 2]
+    assert journal.read_text() == ""
+    writer.close()
+
+
+def test_writer_failed_replay_stays_in_the_journal(tmp_path):
+    journal = tmp_path / "writes.journal"
+    journal.write_text('["row", 1]\n["other", 2]\n', encoding="utf-8")
+    other = []
+    writer = BackgroundWriter(journal)
+    writer.register("row", lambda rows: 1 / 0)
+    writer.register("other", other.extend)
+    writer.replay()
+    assert other == [2]
+    assert [json.loads(line) for line in journal.read_text().splitlines()] == [["row", 1]]
+
+
+def test_writer_replay_stops_at_a_torn_line(tmp_path):
+    journal = tmp_path / "writes.journal"
+    journal.write_text('["row", 1]\n["row", 2]\n["row", 3', encoding="utf-8")
+    applied = []
+    writer = BackgroundWriter(journal)
+    writer.register("row", applied.extend)
+    writer.replay()
+    assert applied == [1, 2]
+
+
+def test_writer_applies_synchronously_when_not_started(tmp_path):
+    applied = []
+    writer = BackgroundWriter(tmp_path / "writes.journal")
+    writer.register("row", applied.extend)
+    writer.submit("row", 1)
+    writer.submit("unknown", 2)  # logged and dropped
+    assert applied == [1]
+    assert not (tmp_path / "writes.journal").exists()
+
+
+def test_history_store_records_and_loads_recent(tmp_path):
+    history = HistoryStore(tmp_path / "output.db", lookback_days=2)
+    now = time.strftime(HistoryStore.TIME_FORMAT)
+    history.record_many([(now, 1, "Data Analyst", "Acme", True, True),
+                         ("2020-01-01 00:00:00", "2", "Old Job", "Globex", True, False)])
+    assert "1" in history and 1 in history
+    assert history.load_recent() == {"1"}
+    assert sorted(history.attempts()) == [("1", now, 1), ("2", "2020-01-01 00:00:00", 0)]
+    history.close()
+
+
+def test_history_store_imports_output_csv_once(tmp_path):
+    output = tmp_path / "output.csv"
+    output.write_text("2026-01-01 10:00:00,11,Analyst,Acme,True,False\n"
+                      "2026-01-02 10:00:00,11,Analyst,Acme,True,True\n"
+                      "not a row\n", encoding="utf-8")
+    history = HistoryStore(tmp_path / "output.db")
+    assert history.import_csv(output) == 2
+    assert history.import_csv(output) == 0
+    assert history.attempts() == [("11", "2026-01-02 10:00:00", 1)]
+    history.close()
+
+
+def test_history_store_combo_yields(tmp_path):
+    history = HistoryStore(tmp_path / "output.db")
+    history.record_combo("Data", "Remote", 10, 8, 3)
+    history.record_combo("Data", "Remote", 5, 2, 1)
+    history.record_combo("Analytics", "Remote", 4, 0, 0)
+    assert history.combo_yields() == {("Data", "Remote"): (4, 15.0), ("Analytics", "Remote"): (0, 4.0)}
+    history.close()
+
+
+def test_session_store_round_trip(tmp_path):
+    store = SessionStore(tmp_path / "session.json")
+    cookies = [{"name": "li_at", "value": "x", "expiry": int(time.time()) + 3600},
+               {"name": "old", "value": "y", "expiry": int(time.time()) - 10},
+               {"name": "session", "value": "z"}]
+    store.save("Me@Example.com ", cookies)
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+    assert [cookie["name"] for cookie in store.load("me@example.com")] == ["li_at", "session"]
+    assert store.load("someone@else.com") == []
+    store.clear()
+    store.clear()
+    assert store.load("me@example.com") == []
@@ -0,0 +1,142 @@
+import json
+import shutil
+import subprocess
+import textwrap
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from waits import ARM_OBSERVER, WAIT_FOR_SETTLE, DomWaiter
+
+
+class FakeTimeouts:
+    def __init__(self, browser):
+        self.browser = browser
+
+    @property
+    def script(self):
+        self.browser.reads += 1
+        return self.browser.script_timeout
+
+
+class FakeBrowser:
+    def __init__(self, script_timeout=30, result=True):
+        self.script_timeout = script_timeout
+        self.result = result
+        self.reads = 0
+        self.timeouts = FakeTimeouts(self)
+        self.timeout_during_script = None
+
+    def set_script_timeout(self, seconds):
+        self.script_timeout = seconds
+
+    def execute_async_script(self, script, *args):
+        self.timeout_during_script = self.script_timeout
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_settle_restores_the_script_timeout():
+    browser = FakeBrowser(script_timeout=30)
+    waiter = DomWaiter(browser)
+
+    assert waiter.settle("modal", timeout=3.0)
+    assert browser.timeout_during_script == 5.0
+    assert browser.script_timeout == 30
+
+    assert waiter.settle("modal", timeout=1.0)
+    assert browser.script_timeout == 30
+    assert browser.reads == 1
+
+
+def test_settle_restores_the_script_timeout_when_the_script_fails():
+    browser = FakeBrowser(script_timeout=30, result=RuntimeError("script timeout"))
+    waiter = DomWaiter(browser)
+
+    assert not waiter.settle("modal")
+    assert browser.script_timeout == 30
+    assert waiter.summary()["modal"]["count"] == 1
+
+
+def test_new_browser_reads_its_own_script_timeout():
+    waiter = DomWaiter(FakeBrowser(script_timeout=30))
+    waiter.settle("modal")
+
+    browser = FakeBrowser(script_timeout=12)
+    waiter.browser = browser
+    waiter.settle("modal")
+    assert browser.script_timeout == 12
+
+
+# Minimal page for node: a MutationObserver whose callbacks the test fires by hand
+PAGE = textwrap.dedent("""
+    var clock = 0;
+    global.performance = {now: function () { return clock; }};
+    global.window = global;
+    global.document = {documentElement: {}, querySelector: function () { return null; }};
+    var observers = [];
+    global.MutationObserver = function (callback) {
+        this.callback = callback;
+        this.connected = false;
+        observers.push(this);
+    };
+    MutationObserver.prototype.observe = function () { this.connected = true; };
+    MutationObserver.prototype.disconnect = function () { this.connected = false; };
+    function mutate() {
+        observers.forEach(function (o) { if (o.connected) { o.callback([{}]); } });
+    }
+    var timers = [];
+    global.setTimeout = function (fn, ms) { timers.push({at: clock + ms, fn: fn}); };
+    function run(until) {
+        while (timers.length) {
+            timers.sort(function (a, b) { return a.at - b.at; });
+            var t = timers.shift();
+            if (t.at > until) { timers.unshift(t); clock = until; return; }
+            clock = t.at;
+            t.fn();
+        }
+    }
+    function arm() { new Function(ARM)(); }
+    function settle(timeoutMs) {
+        var result = null;
+        new Function(WAIT).apply(null, [null, 100, timeoutMs, function (ok) { result = ok; }]);
+        run(clock + timeoutMs + 100);
+        return result;
+    }
+""")
+
+
+def run_page(script):
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not installed")
+    source = f"var ARM = {json.dumps(ARM_OBSERVER)}, WAIT = {json.dumps(WAIT_FOR_SETTLE)};\n" + PAGE + script
+    out = subprocess.run([node, "-e", source], capture_output=True, text=True, check=True).stdout
+    return json.loads(out)
+
+
+def test_each_arm_starts_from_zero_mutations():
+    results = run_page(textwrap.dedent("""
+        arm(); mutate();
+        var first = settle(1000);
+        arm();
+        var second = settle(1000);
+        arm(); mutate();
+        var third = settle(1000);
+        console.log(JSON.stringify([first, second, third]));
+    """))
+    assert results == [True, False, True]
+
+
+def test_mutations_after_a_settle_do_not_satisfy_the_next_arm():
+    results = run_page(textwrap.dedent("""
+        arm(); mutate();
+        var first = settle(1000);
+        mutate();
+        arm();
+        var second = settle(1000);
+        console.log(JSON.stringify([first, second, window.__eabWait === null]));
+    """))
+    assert results == [True, False, True]
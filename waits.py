@@ -0,0 +1,129 @@
+"""
+Event-driven waits for the apply path.
+
+Replaces fixed time.sleep() calls with waits that return as soon as the page
+actually changes: either a targeted WebDriverWait predicate, or a
+MutationObserver that is armed before an action and then waited on until the
+DOM has changed and gone quiet. Every wait records how long it really took.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from metrics import summarize
+
+log = logging.getLogger(__name__)
+
+# Starts counting DOM mutations from zero; call right before the click that should change the page
+ARM_OBSERVER = r"""
+if (window.__eabObserver) { window.__eabObserver.disconnect(); }
+var state = {mutations: 0, last: performance.now()};
+window.__eabWait = state;
+window.__eabObserver = new MutationObserver(function (records) {
+    state.mutations += records.length;
+    state.last = performance.now();
+});
+window.__eabObserver.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+"""
+
+# Resolves once the armed observer has seen a mutation, the optional selector
+# matches, and no further mutation happened for quiet_ms. Polls inside the page,
+# so the whole wait costs a single round trip. The wait consumes the arm: the
+# observer is disconnected, so mutations seen here never satisfy a later wait.
+WAIT_FOR_SETTLE = r"""
+var selector = arguments[0], quietMs = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var started = performance.now();
+var state = window.__eabWait;
+function finish(ok) {
+    if (state && window.__eabWait === state) {
+        if (window.__eabObserver) { window.__eabObserver.disconnect(); window.__eabObserver = null; }
+        window.__eabWait = null;
+    }
+    done(ok);
+}
+function check() {
+    var now = performance.now();
+    var changed = !state || state.mutations > 0;
+    var matched = !selector || document.querySelector(selector) !== null;
+    var quiet = !state || now - state.last >= quietMs;
+    if (changed && matched && quiet) { finish(true); return; }
+    if (now - started >= timeoutMs) { finish(false); return; }
+    setTimeout(check, 25);
+}
+check();
+"""
+
+
+class DomWaiter:
+    """Waits that resolve on DOM changes instead of fixed sleeps, with per-wait timings"""
+
+    POLL_FREQUENCY = 0.05
+
+    def __init__(self, browser) -> None:
+        self.timings = defaultdict(list)
+        self.browser = browser
+
+    @property
+    def browser(self):
+        return self._browser
+
+    @browser.setter
+    def browser(self, browser) -> None:
+        self._browser = browser
+        self.script_timeout = None  # the session's own script timeout, read on first settle() and restored after each
+
+    def _record(self, name, started, ok) -> None:
+        elapsed = time.perf_counter() - started
+        self.timings[name].append(elapsed)
+        log.debug(f"wait '{name}' {'resolved' if ok else 'timed out'} after {elapsed * 1000:.0f}ms")
+
+    def arm(self) -> None:
+        """Start watching for DOM mutations caused by the next action"""
+        try:
+            self.browser.execute_script(ARM_OBSERVER)
+        except Exception as e:
+            log.debug(f"Could not arm mutation observer: {e}")
+
+    def settle(self, name, selector=None, quiet_ms=100, timeout=3.0) -> bool:
+        """
+        Wait until the DOM changed since arm(), selector (if given) is present,
+        and the page has been quiet for quiet_ms. Returns False on timeout.
+        """
+        started = time.perf_counter()
+        ok = False
+        try:
+            if self.script_timeout is None:
+                self.script_timeout = self.browser.timeouts.script
+            self.browser.set_script_timeout(timeout + 2)
+            try:
+                ok = bool(self.browser.execute_async_script(WAIT_FOR_SETTLE, selector, quiet_ms, int(timeout * 1000)))
+            finally:
+                self.browser.set_script_timeout(self.script_timeout)
+        except Exception as e:
+            log.debug(f"wait '{name}' failed: {e}")
+        self._record(name, started, ok)
+        return ok
+
+    def until(self, name, condition, timeout=5.0):
+        """WebDriverWait on condition with a tight poll interval. Returns its result or False on timeout"""
+        started = time.perf_counter()
+        result = False
+        try:
+            result = WebDriverWait(self.browser, timeout, poll_frequency=self.POLL_FREQUENCY).until(condition)
+        except TimeoutException:
+            pass
+        except Exception as e:
+            log.debug(f"wait '{name}' failed: {e}")
+        self._record(name, started, bool(result))
+        return result
+
+    def summary(self) -> dict:
+        """Count, mean and percentiles of every named wait, in seconds"""
+        return {name: summarize(values) for name, values in self.timings.items()}